@@ -0,0 +1,290 @@
+"""
+    Benchmarks for the app.
+
+    Run all benchmarks with `python _benchmark.py` or a single one with
+    `python _benchmark.py <name>`.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+
+import numpy as np
+from pytia.console import Console
+
+from pytia_bounding_box.app.history import History
+from pytia_bounding_box.extraction import get_extraction
+from pytia_bounding_box.measure.assembly import PartBoxCache
+from pytia_bounding_box.measure.assembly import get_envelope
+from pytia_bounding_box.measure.cylinder import get_enclosing_cylinder
+from pytia_bounding_box.measure.extents import get_extents
+from pytia_bounding_box.measure.hull import get_hull_points
+from pytia_bounding_box.measure.oriented import get_oriented_box
+from pytia_bounding_box.measure.parallel import SharedPoints
+from pytia_bounding_box.measure.parallel import get_worker_count
+from pytia_bounding_box.measure.transform import get_extents_batch
+from pytia_bounding_box.measure.voxel import get_preview_box
+from pytia_bounding_box.resources import User
+from pytia_bounding_box.resources.records import Records
+from pytia_bounding_box.resources.records import get_index
+
+console = Console()
+
+
+def bench_parallel_extents() -> None:
+    """Measures the scaling of the parallel extent reduction from 1 to N cores."""
+    count = 100_000_000
+    console.info(f"Generating {count:,} points ...")
+    with SharedPoints(count) as shared:
+        shared.points[:] = np.random.default_rng(0).random((count, 3), dtype=np.float64)
+
+        t0 = time.perf_counter()  # pylint: disable=C0103
+        reference = get_extents(shared.points)
+        baseline = time.perf_counter() - t0
+        console.info(f"Single process without pool: {baseline:.4f}s")
+
+        workers = 1
+        while workers <= get_worker_count():
+            t0 = time.perf_counter()  # pylint: disable=C0103
+            result = shared.get_extents(workers=workers, chunk_size=count // 64)
+            elapsed = time.perf_counter() - t0
+            if (result.minimum, result.maximum) != (
+                reference.minimum,
+                reference.maximum,
+            ):
+                console.error(f"Result with {workers} workers differs: {result}")
+            console.info(
+                f"{workers:>3} workers: {elapsed:.4f}s (speedup {baseline/elapsed:.2f}x)"
+            )
+            workers *= 2
+
+
+def bench_oriented_box() -> None:
+    """Measures the oriented box of rotated point clouds with 1,000,000 points."""
+    count = 1_000_000
+    rng = np.random.default_rng(0)
+    rotation, _ = np.linalg.qr(rng.normal(size=(3, 3)))
+    size = np.array([100.0, 40.0, 10.0])
+
+    volume = (rng.random((count, 3)) - 0.5) * size
+    surface = rng.normal(size=(count, 3))
+    surface *= size / 2 / np.linalg.norm(surface, axis=1)[:, None]
+
+    for name, points in (("volume", volume), ("ellipsoid surface", surface)):
+        t0 = time.perf_counter()  # pylint: disable=C0103
+        box = get_oriented_box(points @ rotation.T)
+        elapsed = time.perf_counter() - t0
+        console.info(f"{name}: {elapsed:.4f}s (size {box.get_size(3)})")
+
+
+def bench_hull_points() -> None:
+    """Measures the hull reduction and the oriented box on the reduced points."""
+    count = 1_000_000
+    rng = np.random.default_rng(0)
+    volume = rng.random((count, 3))
+    tessellation = np.repeat(rng.normal(size=(count // 6, 3)), 6, axis=0)
+    tessellation /= np.linalg.norm(tessellation, axis=1)[:, None]
+
+    for name, points in (("volume", volume), ("sphere tessellation", tessellation)):
+        t0 = time.perf_counter()  # pylint: disable=C0103
+        hull = get_hull_points(points)
+        t1 = time.perf_counter()  # pylint: disable=C0103
+        get_oriented_box(hull)
+        t2 = time.perf_counter()  # pylint: disable=C0103
+        console.info(
+            f"{name}: {len(points):,} -> {len(hull):,} points in {t1-t0:.4f}s, "
+            f"oriented box on hull in {t2-t1:.4f}s"
+        )
+
+
+def bench_enclosing_cylinder() -> None:
+    """Measures the enclosing cylinder of a shaft and a bar with 1,000,000 points."""
+    count = 1_000_000
+    rng = np.random.default_rng(0)
+    angles = rng.random(count) * 2 * np.pi
+    shaft = np.column_stack(
+        (rng.random(count) * 300.0, 20.0 * np.cos(angles), 20.0 * np.sin(angles))
+    )
+    bar = rng.random((count, 3)) * [300.0, 40.0, 30.0]
+
+    for name, points in (("shaft surface", shaft), ("bar volume", bar)):
+        t0 = time.perf_counter()  # pylint: disable=C0103
+        cylinder = get_enclosing_cylinder(points, (1.0, 0.0, 0.0))
+        elapsed = time.perf_counter() - t0
+        console.info(f"{name}: {elapsed:.4f}s (size {cylinder.get_size(3)})")
+
+
+def bench_voxel_preview() -> None:
+    """Measures the voxel preview against the exact oriented box with 3,000,000 points."""
+    count = 3_000_000
+    rng = np.random.default_rng(0)
+    rotation, _ = np.linalg.qr(rng.normal(size=(3, 3)))
+    points = (rng.random((count, 3)) - 0.5) * [100.0, 40.0, 10.0] @ rotation.T
+
+    t0 = time.perf_counter()  # pylint: disable=C0103
+    preview = get_preview_box(points)
+    t1 = time.perf_counter()  # pylint: disable=C0103
+    box = get_oriented_box(get_hull_points(points))
+    t2 = time.perf_counter()  # pylint: disable=C0103
+    console.info(
+        f"preview: {t1-t0:.4f}s (size {preview.get_size(3)}, error "
+        f"{tuple(round(e, 3) for e in preview.error)}), exact: {t2-t1:.4f}s "
+        f"(size {box.get_size(3)})"
+    )
+
+
+def bench_extents_batch() -> None:
+    """Measures the extents of 2,000,000 points in 64 orientations, batched vs one by one."""
+    count = 2_000_000
+    rng = np.random.default_rng(0)
+    points = rng.random((count, 3))
+    rotations = np.stack([np.linalg.qr(rng.normal(size=(3, 3)))[0] for _ in range(64)])
+
+    t0 = time.perf_counter()  # pylint: disable=C0103
+    get_extents_batch(points, rotations)
+    t1 = time.perf_counter()  # pylint: disable=C0103
+    for rotation in rotations:
+        get_extents(points @ rotation.T)
+    t2 = time.perf_counter()  # pylint: disable=C0103
+    console.info(f"batched: {t1-t0:.4f}s, one by one: {t2-t1:.4f}s")
+
+
+def bench_assembly_envelope() -> None:
+    """Measures the envelope of an assembly with 10,000 instances of 500 parts."""
+    count = 10_000
+    rng = np.random.default_rng(0)
+    boxes = PartBoxCache(lambda part: get_extents(rng.random((1_000, 3)) * (part + 1)))
+    parts = [int(i) for i in rng.integers(0, 500, count)]
+    transforms = np.tile(np.eye(4), (count, 1, 1))
+    transforms[:, :3, :3] = np.linalg.qr(rng.normal(size=(count, 3, 3)))[0]
+    transforms[:, :3, 3] = rng.random((count, 3)) * 5_000.0
+
+    for name in ("first evaluation", "cached evaluation"):
+        t0 = time.perf_counter()  # pylint: disable=C0103
+        envelope = get_envelope(parts, transforms, boxes)
+        elapsed = time.perf_counter() - t0
+        console.info(f"{name}: {elapsed:.4f}s (size {envelope.get_size(3)})")
+
+
+def bench_history_lookup() -> None:
+    """Measures the prefill query of the history with 1,000,000 saves."""
+    count = 1_000_000
+    with tempfile.TemporaryDirectory() as folder:
+        history = History(Path(folder, "history.sqlite3"))
+        with history.connection:
+            history.connection.executemany(
+                "INSERT INTO saves VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (str(i % 100_000), f"C:\\{i % 100_000}.CATPart", float(i), "user")
+                    + ("Standard", "X-Axis", 3, 5, 0, "105 × 85 × 25")
+                    for i in range(count)
+                ),
+            )
+
+        t0 = time.perf_counter()  # pylint: disable=C0103
+        for i in range(1_000):
+            history.get_latest(str(i), f"C:\\{i}.CATPart")
+        elapsed = (time.perf_counter() - t0) / 1_000
+        history.close()
+    console.info(f"latest save of a part: {elapsed * 1e3:.4f}ms per query")
+
+
+def bench_resource_records() -> None:
+    """
+    Measures a user lookup in a users.json with 50,000 users: Parsed into objects, and parsed
+    into rows with an index and lazily built objects.
+    """
+    data = json.dumps(
+        [
+            {"logon": f"user{i}", "id": f"{i:05}", "name": f"User {i}", "mail": ""}
+            for i in range(50_000)
+        ]
+    ).encode()
+
+    t0 = time.perf_counter()  # pylint: disable=C0103
+    json.loads(data)
+    console.info(f"json.loads only: {time.perf_counter() - t0:.4f}s")
+
+    t0 = time.perf_counter()  # pylint: disable=C0103
+    users = {u.logon: u for u in (User(**i) for i in json.loads(data))}
+    users["user49999"]  # pylint: disable=W0104
+    console.info(f"parsed into objects: {time.perf_counter() - t0:.4f}s")
+
+    t0 = time.perf_counter()  # pylint: disable=C0103
+    rows = json.loads(data)
+    Records(User, rows)[get_index(rows, lambda u: u["logon"])["user49999"]]
+    console.info(f"parsed into records: {time.perf_counter() - t0:.4f}s")
+
+
+def bench_zipapp_startup() -> None:
+    """
+    Measures the import of the app modules from the zipapp, with and without bytecode, and
+    from the extracted zipapp.
+    """
+    from _build import create_archive  # pylint: disable=C0415
+
+    # Third party modules are imported first, only the modules of the app are measured.
+    script = (
+        "import sys, time; sys.path.insert(0, sys.argv[1]); import numpy, tkinter; "
+        "t0 = time.perf_counter(); "
+        "import resources, dependencies, measure.extents, measure.hull, "
+        "measure.oriented, measure.cylinder, measure.voxel, measure.transform, "
+        "measure.assembly, measure.bodies; "
+        "print(time.perf_counter() - t0)"
+    )
+    # Compiled, compressed, extracted
+    variants = {
+        "source": (False, False, False),
+        "bytecode": (True, False, False),
+        "bytecode, compressed": (True, True, False),
+        "bytecode, extracted": (True, False, True),
+    }
+    with tempfile.TemporaryDirectory() as folder:
+        for name, (compiled, compressed, extracted) in variants.items():
+            target = Path(folder, "app.pyz")
+            create_archive(Path("./pytia_bounding_box"), target, compiled, compressed)
+            path = (
+                get_extraction(target, Path(folder, ".app"), "0")
+                if extracted
+                else target
+            )
+            elapsed = sorted(
+                float(
+                    subprocess.run(
+                        [sys.executable, "-c", script, str(path)],
+                        capture_output=True,
+                        check=True,
+                        text=True,
+                    ).stdout
+                )
+                for _ in range(11)
+            )[5]
+            console.info(
+                f"{name}: {elapsed:.4f}s (median of 11), {os.path.getsize(target):,} bytes"
+            )
+
+
+BENCHMARKS: Dict[str, Callable[[], None]] = {
+    "parallel-extents": bench_parallel_extents,
+    "oriented-box": bench_oriented_box,
+    "hull-points": bench_hull_points,
+    "enclosing-cylinder": bench_enclosing_cylinder,
+    "voxel-preview": bench_voxel_preview,
+    "extents-batch": bench_extents_batch,
+    "assembly-envelope": bench_assembly_envelope,
+    "history-lookup": bench_history_lookup,
+    "resource-records": bench_resource_records,
+    "zipapp-startup": bench_zipapp_startup,
+}
+
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        console.info(f"Running benchmark {name!r} ...")
+        BENCHMARKS[name]()
@@ -5,8 +5,11 @@
 
 import json
 import os
+import py_compile
 import re
+import shutil
 import sys
+import tempfile
 import zipapp
 from datetime import datetime
 from pathlib import Path, WindowsPath
@@ -26,8 +29,48 @@ settings_path = Path("./pytia_bounding_box/resources/settings.json").resolve()
 branch_name = Repository(".").head.shorthand
 
 
+def create_archive(
+    source: Path, target: Path, compiled: bool = True, compressed: bool = False
+) -> None:
+    """
+    Creates the zipapp from the source folder.
+
+    Python can't write bytecode into the zipapp, so without compiled modules every launch
+    compiles all imported modules from source. If compiled, each module is compiled next to
+    its source, which is where zipimport looks for bytecode. The bytecode is hash-based and
+    unchecked, so it's loaded without comparing it to the source. The sources are kept for
+    tracebacks. The bytecode only works for the python version that runs the build.
+    """
+    with tempfile.TemporaryDirectory() as staging:
+        shutil.copytree(
+            source,
+            staging,
+            dirs_exist_ok=True,
+            ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+        )
+        if compiled:
+            for path in Path(staging).rglob("*.py"):
+                py_compile.compile(
+                    str(path),
+                    cfile=str(path.with_suffix(".pyc")),
+                    dfile=str(path.relative_to(staging)),
+                    doraise=True,
+                    invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+                )
+        zipapp.create_archive(
+            source=staging,
+            target=target,
+            interpreter=None,
+            main=None,
+            filter=None,
+            compressed=compressed,
+        )
+
+
 class Build:
-    def __init__(self) -> None:
+    def __init__(self, compressed: bool = False) -> None:
+        self.compressed = compressed
+
         if not os.path.exists(settings_path):
             console.error(
                 "Config file not found. Have you followed the setup instructions?"
@@ -135,17 +178,27 @@ class Build:
         self.provide()
         self.test()
         self.create_launcher()
-        zipapp.create_archive(
+
+        if sys.version_info[:2] != self.get_required_version():
+            console.warning(
+                f"The app is compiled with python {sys.version_info[0]}."
+                f"{sys.version_info[1]}, but requires python "
+                f"{'.'.join(map(str, self.get_required_version()))}. The app will "
+                "compile its modules from source on every launch."
+            )
+        console.info(
+            f"Creating {'compressed ' if self.compressed else ''}archive with bytecode ..."
+        )
+        create_archive(
             source=self.source_folder,
             target=self.build_app_path,
-            interpreter=None,
-            main=None,
-            filter=None,
-            compressed=False,
+            compiled=True,
+            compressed=self.compressed,
         )
         console.ok(f"Built app into {str(self.build_folder)!r}")
 
 
 if __name__ == "__main__":
-    builder = Build()
+    # Use the --compressed flag to build a smaller app, e.g. for slow network shares.
+    builder = Build(compressed="--compressed" in sys.argv[1:])
     builder.build()
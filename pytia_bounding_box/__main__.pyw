@@ -4,6 +4,17 @@
 """
     Application entry point.
 """
-from main import main
+from timing import tracer  # Imported first: Starts the start-up trace.
 
-main()
+from extraction import use_extraction  # pylint: disable=C0411
+
+# Run from the extracted copy of the zipapp: Must be done before the app modules are imported.
+with tracer.span("extraction"):
+    use_extraction()
+
+from main import main  # pylint: disable=C0413
+
+# The guard is required for worker processes: They import the main module, but must not run
+# the app.
+if __name__ == "__main__":
+    main()
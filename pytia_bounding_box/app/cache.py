@@ -0,0 +1,122 @@
+"""
+    The cache submodule of the app. Stores the measurements of documents in the appdata folder.
+
+    An entry is valid as long as the document file hasn't changed: The size and the
+    modification time of the file must match. Only the latest measurement of each document,
+    measurement mode and precision is kept.
+"""
+
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from atomic import write_atomic
+from const import APPDATA
+from const import CONFIG_MEASUREMENTS
+from pytia.log import log
+
+
+class MeasurementCache:
+    """Persistent cache of the measurements per document."""
+
+    def __init__(self, path: Path | str, maxsize: int = 1000) -> None:
+        """
+        Inits the MeasurementCache class. The cache file is read on the first access.
+
+        Args:
+            path (Path | str): The path of the cache file.
+            maxsize (int, optional): The number of entries to keep. Defaults to 1000.
+        """
+        self.path = Path(path)
+        self.maxsize = maxsize
+        self._items: Optional[OrderedDict[str, Dict]] = None
+
+    @staticmethod
+    def get_key(document: Path | str, mode: str, precision: int) -> str:
+        """Returns the cache key of a document measurement."""
+        return f"{os.path.normcase(os.path.abspath(document))}|{mode}|{precision}"
+
+    @staticmethod
+    def _get_state(document: Path | str) -> Tuple[int, int]:
+        """Returns the size and the modification time (ns) of the document file."""
+        stat = os.stat(document)
+        return stat.st_size, stat.st_mtime_ns
+
+    @property
+    def items(self) -> OrderedDict[str, Dict]:
+        """Returns the entries of the cache, reads the cache file if necessary."""
+        if self._items is None:
+            self._items = OrderedDict()
+            if self.path.exists():
+                try:
+                    with open(self.path, "r", encoding="utf8") as f:
+                        self._items.update(json.load(f))
+                except (OSError, ValueError) as e:
+                    log.warning(
+                        f"Measurement cache {str(self.path)!r} is unreadable: {e}"
+                    )
+        return self._items
+
+    def get(
+        self, document: Path | str, mode: str, precision: int
+    ) -> Optional[Tuple[float, float, float]]:
+        """
+        Returns the cached measurements of a document.
+
+        Args:
+            document (Path | str): The path of the document.
+            mode (str): The measurement mode.
+            precision (int): The number of digits of the measurements.
+
+        Returns:
+            Optional[Tuple[float, float, float]]: The X, Y & Z measurements, None if the \
+                document isn't cached or has changed since.
+        """
+        key = self.get_key(document, mode, precision)
+        if (entry := self.items.get(key)) is None:
+            return None
+        try:
+            if tuple(entry["state"]) != self._get_state(document):
+                return None
+        except OSError:
+            return None
+        x, y, z = entry["measurements"]
+        return x, y, z
+
+    def set(
+        self,
+        document: Path | str,
+        mode: str,
+        precision: int,
+        measurements: Tuple[float, float, float],
+    ) -> None:
+        """
+        Stores the measurements of a document and writes the cache file. The file is replaced
+        atomically, a concurrent reader sees either the old or the new cache.
+
+        Args:
+            document (Path | str): The path of the document.
+            mode (str): The measurement mode.
+            precision (int): The number of digits of the measurements.
+            measurements (Tuple[float, float, float]): The X, Y & Z measurements.
+        """
+        key = self.get_key(document, mode, precision)
+        self.items.pop(key, None)
+        self.items[key] = {
+            "state": self._get_state(document),
+            "measurements": list(measurements),
+        }
+        while len(self.items) > self.maxsize:
+            self.items.popitem(last=False)
+
+        try:
+            write_atomic(self.path, lambda f: json.dump(self.items, f))
+        except OSError as e:
+            log.warning(f"Cannot write the measurement cache {str(self.path)!r}: {e}")
+
+
+measurement_cache = MeasurementCache(Path(APPDATA, CONFIG_MEASUREMENTS))
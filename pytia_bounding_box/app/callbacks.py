@@ -2,19 +2,27 @@
     Callback submodule for the app.
 """
 
+import sqlite3
+import time
 import tkinter as tk
 from tkinter import messagebox as tkmsg
+from typing import TYPE_CHECKING
 
 from app.helper import LazyPartHelper
+from app.history import Save
+from app.history import history
 from app.layout import Layout
 from app.loaders import Loaders
 from app.state import UISetter
 from app.vars import Variables
 from const import LOGON
+from const import MeasurementMode
 from pytia.log import log
-from pytia_ui_tools.handlers.workspace_handler import Workspace
 from resources import resource
 
+if TYPE_CHECKING:
+    from pytia_ui_tools.handlers.workspace_handler import Workspace
+
 
 class Callbacks:
     """The Callbacks class. Handles all callbacks and bindings from the main apps widgets."""
@@ -26,7 +34,7 @@ class Callbacks:
         lazy_part_helper: LazyPartHelper,
         layout: Layout,
         loaders: Loaders,
-        workspace: Workspace,
+        workspace: "Workspace",
         ui_setter: UISetter,
     ) -> None:
         """
@@ -63,6 +71,13 @@ class Callbacks:
         self.layout.input_thickness.configure(command=self.callback_thickness)
         self.layout.button_save.configure(command=self.on_btn_save)
         self.layout.button_abort.configure(command=self.on_btn_abort)
+        for index, _ in enumerate(MeasurementMode):
+            self.layout.measurement_menu.entryconfig(
+                index, command=self.callback_measurement_mode
+            )
+        self.layout.measurement_menu.entryconfig(
+            len(MeasurementMode) + 1, command=self.callback_remeasure
+        )
 
     def _add_bindings(self) -> None:
         """Adds bindings to the widgets."""
@@ -70,6 +85,7 @@ class Callbacks:
             "<<ComboboxSelected>>", self.callback_combobox_preset
         )
         self.layout.input_axis.bind("<<ComboboxSelected>>", self.callback_combobox_axis)
+        self.root.bind("<Shift-F5>", lambda _: self.callback_remeasure())
 
     def on_btn_save(self) -> None:
         """Event handler for the OK button."""
@@ -118,7 +134,26 @@ class Callbacks:
             resource.props.base_size_preset, self.vars.selected_preset.name
         )
         self.part_helper.write_modifier()
+        try:
+            history.add(
+                Save(
+                    part_number=self.part_helper.part_number,
+                    path=str(self.part_helper.path),
+                    saved_at=time.time(),
+                    logon=LOGON,
+                    preset=self.vars.selected_preset.name,
+                    axis=self.vars.selected_axis.value,
+                    offset=self.vars.scale_offset_value.get(),
+                    step=self.vars.scale_step_value.get(),
+                    thickness=self.vars.thickness_value.get(),
+                    base_size=self.layout.input_result.get(),
+                )
+            )
+        except sqlite3.Error as e:
+            log.warning(f"Cannot record the save in the history: {e}")
 
+        # The counter changes the appdata file, it's only increased if the app has been used.
+        resource.appdata.counter += 1
         if resource.settings.restrictions.enable_information:
             for msg in resource.get_info_msg_by_counter():
                 tkmsg.showinfo(
@@ -149,6 +184,38 @@ class Callbacks:
         self.loaders.load_calculated()
         self.loaders.load_result()
 
+    def callback_measurement_mode(self) -> None:
+        """Callback for the measurement menu."""
+        log.info(
+            "Callback Menu Measurement: User selected "
+            f"{self.vars.measurement_mode.get()!r}"
+        )
+        resource.appdata.measurement_mode = self.vars.measurement_mode.get()
+
+        self.set_parent_state.busy()
+        self.loaders.load_measurements()
+        self.loaders.load_combobox_preset()
+        self.loaders.load_combobox_axis()
+        self.loaders.load_chkbox_thickness()
+        self.loaders.load_scale_offset()
+        self.loaders.load_scale_step()
+        self.loaders.load_calculated()
+        self.loaders.load_result()
+
+    def callback_remeasure(self) -> None:
+        """Callback for the remeasure menu entry: Measures the part, ignores the cache."""
+        log.info("Callback Menu Measurement: User requested remeasurement")
+
+        self.set_parent_state.busy()
+        self.loaders.load_measurements(remeasure=True)
+        self.loaders.load_combobox_preset()
+        self.loaders.load_combobox_axis()
+        self.loaders.load_chkbox_thickness()
+        self.loaders.load_scale_offset()
+        self.loaders.load_scale_step()
+        self.loaders.load_calculated()
+        self.loaders.load_result()
+
     def callback_combobox_axis(self, _: tk.Event) -> None:
         """Callback for the axis combo box widget."""
         log.info(
@@ -11,13 +11,19 @@ from pathlib import Path
 from tkinter import BooleanVar
 from tkinter import IntVar
 from tkinter import messagebox as tkmsg
+from typing import TYPE_CHECKING
+from typing import Dict
 from typing import Optional
 from typing import Tuple
 
 from const import LOGON
+from const import PID
+from const import PYTIA_BOUNDING_BOX
 from const import STYLES
+from const import TEMP
 from const import Axes
 from const import Preference
+from pytia.exceptions import PytiaBodyEmptyError
 from pytia.exceptions import PytiaDifferentDocumentError
 from pytia.exceptions import PytiaDocumentNotSavedError
 from pytia.exceptions import PytiaPropertyNotFoundError
@@ -25,9 +31,19 @@ from pytia.exceptions import PytiaValueError
 from pytia.log import log
 from resources import Preset
 from resources import resource
+from timing import tracer
 from ttkbootstrap import Menu
 from ttkbootstrap import Style
 
+if TYPE_CHECKING:
+    # NumPy is imported late, it's only required for the point based measurements.
+    import numpy as np
+    from measure.extents import BoundingBox
+
+# The show states of the visual properties in CATIA.
+_SHOW = 0
+_HIDE = 1
+
 
 def show_help() -> None:
     """Opens the help docs."""
@@ -277,15 +293,10 @@ class LazyPartHelper:
         # Also: The UI will load a little bit faster.
 
         # pylint: disable=C0415
-        # pylint: disable=C0103
-        t0 = time.perf_counter()
-        from pytia.framework import framework
-        from pytia.wrapper.documents.part_documents import PyPartDocument
-
-        t1 = time.perf_counter()
-        log.debug(f"Loaded PyPartDocument in {(t1-t0):.4f}s")
+        with tracer.span("imports"):
+            from pytia.framework import framework
+            from pytia.wrapper.documents.part_documents import PyPartDocument
         # pylint: enable=C0415
-        # pylint: enable=C0103
 
         self.framework = framework
         self.part_document = PyPartDocument(strict_naming=False)
@@ -314,6 +325,18 @@ class LazyPartHelper:
         """Returns the path of the document."""
         return Path(self.part_document.document.full_name)
 
+    @property
+    def part_number(self) -> str:
+        """Returns the part number of the document."""
+        return self.part_document.product.part_number
+
+    @property
+    def saved(self) -> bool:
+        """Returns True if the document is stored on disk and has no unsaved changes."""
+        return os.path.isabs(self.part_document.document.full_name) and bool(
+            self.part_document.document.saved
+        )
+
     def _lock_catia(self, value: bool) -> None:
         log.debug(f"Setting catia lock to {value!r}")
         self.framework.catia.refresh_display = not value
@@ -355,6 +378,149 @@ class LazyPartHelper:
 
         return _ensure_part_not_changed_wrapper
 
+    @_ensure_part_not_changed
+    def get_points(self, hull: bool = False) -> "np.ndarray":
+        """
+        Returns the vertices of the tessellated part. The part is exported as STL file to the
+        temp folder, which is read and removed afterwards.
+
+        Args:
+            hull (bool, optional): Returns only the vertices of the convex hull. The hull of \
+                a saved document is served from the hull cache without an export, as long as \
+                the document file doesn't change. Defaults to False.
+
+        Raises:
+            PytiaBodyEmptyError: Raised when the part doesn't contain any geometry.
+
+        Returns:
+            np.ndarray: The vertices as (n, 3) array.
+        """
+        # pylint: disable=C0415
+        # pylint: disable=C0103
+        from measure.hull import get_hull_points
+        from measure.hull import hull_cache
+        from measure.readers import read_points
+
+        t0 = time.perf_counter()
+        document = self.path if hull and self.saved else None
+        if document is None or (points := hull_cache.get(document)) is None:
+            path = Path(TEMP, f"{PYTIA_BOUNDING_BOX}_{PID}.stl")
+            self.part_document.document.export_data(str(path), "stl", overwrite=True)
+            try:
+                points = read_points(path)
+            finally:
+                path.unlink(missing_ok=True)
+            if hull:
+                points = get_hull_points(points)
+            if document is not None:
+                hull_cache.set(document, points)
+
+        t1 = time.perf_counter()
+        log.debug(f"Retrieved {len(points)} points from part in {(t1-t0):.4f}s")
+        # pylint: enable=C0415
+        # pylint: enable=C0103
+
+        if len(points) == 0:
+            raise PytiaBodyEmptyError("The part doesn't contain any geometry.")
+        return points
+
+    @_ensure_part_not_changed
+    def get_body_extents(self) -> Tuple["BoundingBox", Dict[str, "BoundingBox"]]:
+        """
+        Returns the bounding box of all shown solid bodies of the part. Bodies that are used
+        in a boolean operation are part of the body they're assembled to, bodies the user has
+        hidden aren't measured.
+
+        Each body is exported as STL file to the temp folder on its own, while all other shown
+        bodies are hidden. The visibility of each body is restored afterwards, even if an
+        export fails. The exports are measured concurrently. The boxes of a saved part are
+        cached by the body name and the state of the document file, cached bodies aren't
+        exported again.
+
+        Raises:
+            PytiaBodyEmptyError: Raised when the part doesn't contain any shown geometry.
+
+        Returns:
+            Tuple[BoundingBox, Dict[str, BoundingBox]]: The union of all body boxes and the \
+                box of each body.
+        """
+        # pylint: disable=C0415
+        # pylint: disable=C0103
+        from measure.bodies import body_extents_cache
+        from measure.bodies import get_union_extents
+
+        t0 = time.perf_counter()
+        document = self.part_document.document
+        selection = document.selection
+
+        def set_show(items: list, show: int) -> None:
+            selection.clear()
+            for item in items:
+                selection.add(item)
+            if selection.count:
+                selection.vis_properties.set_show(show)
+            selection.clear()
+
+        # Bodies the user has hidden would be exported as empty files, they're skipped.
+        shown = []
+        for body in self.part_document.part.bodies.items():
+            if body.in_boolean_operation():
+                continue
+            selection.clear()
+            selection.add(body)
+            if selection.vis_properties.get_show() == _SHOW:
+                shown.append(body)
+        selection.clear()
+
+        keys: Dict[str, Tuple] = {}
+        if self.saved:
+            stat = os.stat(self.path)
+            state = (os.path.normcase(self.path), stat.st_size, stat.st_mtime_ns)
+            keys = {body.name: (*state, body.name) for body in shown}
+        exported = [
+            body
+            for body in shown
+            if body_extents_cache.get(keys.get(body.name)) is None
+        ]
+
+        paths: Dict[str, Path] = {}
+        hidden: list = []  # The bodies that are hidden by this method at the moment
+        try:
+            for index, body in enumerate(exported):
+                hidden = [other for other in shown if other is not body]
+                set_show(hidden, _HIDE)
+                paths[body.name] = Path(TEMP, f"{PYTIA_BOUNDING_BOX}_{PID}_{index}.stl")
+                document.export_data(str(paths[body.name]), "stl", overwrite=True)
+                set_show(hidden, _SHOW)
+                hidden = []
+
+            union, boxes = get_union_extents(
+                paths,
+                workers=resource.settings.measurement.workers,
+                chunk_size=resource.settings.measurement.chunk_size,
+                keys=keys,
+            )
+        except ValueError as e:
+            raise PytiaBodyEmptyError(
+                f"The part doesn't contain any geometry: {e}"
+            ) from e
+        finally:
+            # Restores the visibility if an export has failed.
+            set_show(hidden, _SHOW)
+            for path in paths.values():
+                path.unlink(missing_ok=True)
+
+        t1 = time.perf_counter()
+        log.debug(
+            f"Measured {len(boxes)} bodies ({len(exported)} exported) in {(t1-t0):.4f}s"
+        )
+        for name, box in boxes.items():
+            log.info(f"Bounding box of body {name!r}: {box.size}")
+        # pylint: enable=C0415
+        # pylint: enable=C0103
+
+        return union, boxes
+
     @_ensure_part_not_changed
     def get_parameter(self, name: str) -> Optional[str]:
         """
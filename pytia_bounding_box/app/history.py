@@ -0,0 +1,152 @@
+"""
+    The history submodule of the app. Records every save in a SQLite database in the appdata
+    folder, so that the controls can be prefilled when a part is opened again.
+"""
+
+import os
+import sqlite3
+import time
+from dataclasses import astuple
+from dataclasses import dataclass
+from dataclasses import fields
+from pathlib import Path
+from typing import List
+from typing import Optional
+
+from const import APPDATA
+from const import HISTORY_DATABASE
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    part_number TEXT NOT NULL,
+    path TEXT NOT NULL,
+    saved_at REAL NOT NULL,
+    logon TEXT NOT NULL,
+    preset TEXT NOT NULL,
+    axis TEXT NOT NULL,
+    "offset" INTEGER NOT NULL,
+    step INTEGER NOT NULL,
+    thickness INTEGER NOT NULL,
+    base_size TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS saves_by_part ON saves (part_number, path, saved_at);
+CREATE INDEX IF NOT EXISTS saves_by_preset ON saves (preset, saved_at);
+"""
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class Save:
+    """Dataclass for a save of the bounding box of a part."""
+
+    part_number: str
+    path: str
+    saved_at: float  # Unix time
+    logon: str
+    preset: str
+    axis: str
+    offset: int
+    step: int
+    thickness: bool
+    base_size: str
+
+
+# Quoted, since "offset" is a keyword.
+_COLUMNS = ", ".join(f'"{f.name}"' for f in fields(Save))
+_PLACEHOLDERS = ", ".join("?" * len(fields(Save)))
+
+
+class History:
+    """The History class. Stores the saves in an indexed SQLite database."""
+
+    def __init__(self, path: Path | str) -> None:
+        """
+        Inits the History class. The database is opened on the first access.
+
+        Args:
+            path (Path | str): The path of the database file.
+        """
+        self.path = Path(path)
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Returns the connection to the database, creates the database if necessary."""
+        if self._connection is None:
+            os.makedirs(self.path.parent, exist_ok=True)
+            self._connection = sqlite3.connect(self.path)
+            # The appdata folder may be on a network share, where the shared memory of the
+            # WAL mode doesn't work. Databases created in WAL mode are converted back.
+            self._connection.execute("PRAGMA journal_mode=DELETE")
+            self._connection.executescript(_SCHEMA)
+        return self._connection
+
+    @staticmethod
+    def _to_save(row: tuple) -> Save:
+        """Converts a row of the saves table to a Save object."""
+        values = dict(zip((f.name for f in fields(Save)), row))
+        values["thickness"] = bool(values["thickness"])
+        return Save(**values)
+
+    def add(self, save: Save) -> None:
+        """
+        Records a save.
+
+        Args:
+            save (Save): The save to record.
+        """
+        with self.connection:
+            self.connection.execute(
+                f"INSERT INTO saves ({_COLUMNS}) VALUES ({_PLACEHOLDERS})",
+                astuple(save),
+            )
+
+    def get_latest(self, part_number: str, path: Path | str) -> Optional[Save]:
+        """
+        Returns the latest save of a part. Saves of the same part number at another path are
+        used if the part has never been saved at the given path, e.g. after it has been moved.
+
+        Args:
+            part_number (str): The part number of the part.
+            path (Path | str): The path of the part document.
+
+        Returns:
+            Optional[Save]: The latest save, None if the part has never been saved.
+        """
+        row = self.connection.execute(
+            f"SELECT {_COLUMNS} FROM saves WHERE part_number = ? "
+            "ORDER BY path = ? DESC, saved_at DESC LIMIT 1",
+            (part_number, str(path)),
+        ).fetchone()
+        return None if row is None else self._to_save(row)
+
+    def get_by_preset(
+        self, preset: str, since: float = 0, until: Optional[float] = None
+    ) -> List[Save]:
+        """
+        Returns all saves made with the given preset within a period of time, e.g. all parts
+        that have been saved with a preset this month.
+
+        Args:
+            preset (str): The name of the preset.
+            since (float, optional): The start of the period as unix time. Defaults to 0.
+            until (Optional[float], optional): The end of the period as unix time. Defaults \
+                to now.
+
+        Returns:
+            List[Save]: The saves, ordered by time.
+        """
+        rows = self.connection.execute(
+            f"SELECT {_COLUMNS} FROM saves WHERE preset = ? AND saved_at BETWEEN ? AND ? "
+            "ORDER BY saved_at",
+            (preset, since, time.time() if until is None else until),
+        ).fetchall()
+        return [self._to_save(row) for row in rows]
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+history = History(Path(APPDATA, HISTORY_DATABASE))
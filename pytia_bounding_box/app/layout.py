@@ -11,6 +11,7 @@ from app.helper import show_help
 from app.vars import Variables
 from const import STYLES
 from const import Axes
+from const import MeasurementMode
 from pytia_ui_tools.widgets.entries import NumberEntry
 from pytia_ui_tools.widgets.scales import SnapScale
 from resources import resource
@@ -40,8 +41,17 @@ class Layout:
         for style in STYLES:
             self._appearance_menu.add_command(label=style)
 
+        self._measurement_menu = Menu(menubar, tearoff=False)
+        for mode in MeasurementMode:
+            self._measurement_menu.add_radiobutton(
+                label=mode.value, value=mode.value, variable=variables.measurement_mode
+            )
+        self._measurement_menu.add_separator()
+        self._measurement_menu.add_command(label="Remeasure", accelerator="Shift+F5")
+
         menubar.add_cascade(label="Help", command=show_help)
         menubar.add_cascade(label="Appearance", menu=self._appearance_menu)
+        menubar.add_cascade(label="Measurement", menu=self._measurement_menu)
 
         set_appearance_menu(self._appearance_menu)
         root.configure(menu=menubar)
@@ -284,6 +294,11 @@ class Layout:
         )
         self._btn_abort.grid(row=0, column=2, padx=(2, 0), pady=0, sticky="e")
 
+    @property
+    def measurement_menu(self) -> Menu:
+        """Returns the measurement menu, which holds the measurement modes and 'Remeasure'."""
+        return self._measurement_menu
+
     @property
     def input_preset(self) -> Combobox:
         """Returns the preset combobox widget."""
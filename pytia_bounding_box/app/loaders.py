@@ -3,21 +3,39 @@
 """
 
 import functools
+import sqlite3
+import time
 import tkinter as tk
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
 
+from app.cache import measurement_cache
 from app.helper import LazyPartHelper
 from app.helper import get_offset
 from app.helper import get_preferred_axis
 from app.helper import sort_base_size
+from app.history import history
 from app.layout import Layout
 from app.state import UISetter
 from app.validators import Validators
 from app.vars import Variables
 from const import Axes
+from const import REFINEMENT_POLL_INTERVAL
+from const import MeasurementMode
+from pytia.log import log
 from pytia_ui_tools.widgets.tooltips import ToolTip
 from resources import resource
 
+if TYPE_CHECKING:
+    import numpy as np
+    from measure.cylinder import EnclosingCylinder
+    from measure.oriented import OrientedBox
+
 
 class Loaders:
     """The Loaders class. Provides access to the loader methods."""
@@ -49,6 +67,11 @@ class Loaders:
         self.layout = layout
         self.set_ui = ui_setter
 
+        self._points: Optional["np.ndarray"] = None
+        self._cylinders: Dict[Axes, "EnclosingCylinder"] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._refinement: Optional[Future] = None
+
     @staticmethod
     def _busy(func) -> Callable:
         @functools.wraps(func)
@@ -83,23 +106,176 @@ class Loaders:
         else:
             self.vars.entry_result_current_text.set("")
 
-    def load_measurements(self) -> None:
-        """Retrieves the base size from the body and writes the values to the UI."""
+    def load_measurements(self, remeasure: bool = False) -> None:
+        """
+        Retrieves the base size from the body and writes the values to the UI.
+        The measurement depends on the selected measurement mode.
+
+        Measurements of saved documents are served from the measurement cache, as long as the
+        document file doesn't change.
+
+        Args:
+            remeasure (bool, optional): Measures the part, even if it's cached. Defaults to \
+                False.
+        """
         # Late importing improves the GUI loading time.
         # pylint: disable=C0415
+        from measure.oriented import get_oriented_box
+        from measure.voxel import get_preview_box
         from pytia.utilities.bounding_box import get_bounding_box
 
         # pylint: enable=C0415
 
+        self._points = None
+        self._cylinders = {}
+        self._refinement = None  # A running refinement isn't loaded anymore.
+        tooltip = ""
+        mode = MeasurementMode(self.vars.measurement_mode.get())
+
+        # The cylinder mode requires the points, the progressive mode has its own preview.
+        cacheable = (
+            mode
+            in (
+                MeasurementMode.AXIS_ALIGNED,
+                MeasurementMode.BODIES,
+                MeasurementMode.ORIENTED,
+            )
+            and self.part_helper.saved
+        )
+        if (
+            cacheable
+            and not remeasure
+            and (
+                cached := measurement_cache.get(
+                    self.part_helper.path, mode.value, resource.settings.precision
+                )
+            )
+        ):
+            log.info(f"Loaded measurements {cached} from the measurement cache.")
+            self._set_measurements(cached, "")
+            return
+
+        match mode:
+            case MeasurementMode.ORIENTED:
+                box = get_oriented_box(self.part_helper.get_points(hull=True))
+                log.info(f"Oriented box of part: {box.size} (rotation {box.rotation})")
+                measurements = box.get_size(n_digits=resource.settings.precision)
+            case MeasurementMode.BODIES:
+                union, _ = self.part_helper.get_body_extents()
+                measurements = union.get_size(n_digits=resource.settings.precision)
+            case MeasurementMode.PROGRESSIVE:
+                points = self.part_helper.get_points()
+                preview = get_preview_box(points)
+                log.info(
+                    f"Preview of oriented box of part: {preview.box.size} "
+                    f"(error {preview.error}, voxel size {preview.voxel_size})"
+                )
+                measurements = preview.get_size(n_digits=resource.settings.precision)
+                tooltip = (
+                    "Preview: The exact measurement is running in the background.\n\n"
+                    "The extent of the part along the axes of the preview differs from "
+                    f"the preview by at most {', '.join(f'{e:.3f}mm' for e in preview.error)}. "
+                    "The exact box may differ further, its axes may be rotated."
+                )
+                self._start_refinement(points)
+            case MeasurementMode.CYLINDER:
+                # The box is still required for the box presets, the points are kept for
+                # the diameter presets (see `load_calculated`).
+                measurements = get_bounding_box(n_digits=resource.settings.precision)
+                self._points = self.part_helper.get_points(hull=True)
+            case _:
+                measurements = get_bounding_box(n_digits=resource.settings.precision)
+
+        if cacheable:
+            measurement_cache.set(
+                self.part_helper.path,
+                mode.value,
+                resource.settings.precision,
+                measurements,
+            )
+        self._set_measurements(measurements, tooltip)
+
+    def _set_measurements(
+        self, measurements: Tuple[float, float, float], tooltip: str
+    ) -> None:
+        """Writes the measurements to the variables and to the UI."""
         (
             self.vars.x_measure,
             self.vars.y_measure,
             self.vars.z_measure,
-        ) = get_bounding_box(n_digits=resource.settings.precision)
+        ) = measurements
 
         self.vars.entry_measure_x_text.set(str(self.vars.x_measure))
         self.vars.entry_measure_y_text.set(str(self.vars.y_measure))
         self.vars.entry_measure_z_text.set(str(self.vars.z_measure))
+        for entry in (
+            self.layout.measure_x,
+            self.layout.measure_y,
+            self.layout.measure_z,
+        ):
+            ToolTip(entry, text=tooltip)
+
+    def _start_refinement(self, points: "np.ndarray") -> None:
+        """
+        Starts the exact oriented box measurement of the points in the background. The UI is
+        polled until the result is available, the save button is disabled meanwhile.
+        """
+        # pylint: disable=C0415
+        from measure.hull import get_hull_points
+        from measure.oriented import get_oriented_box
+
+        # pylint: enable=C0415
+
+        self._refinement = self._executor.submit(
+            lambda: get_oriented_box(get_hull_points(points))
+        )
+        self.layout.button_save["state"] = tk.DISABLED
+        self.root.after(
+            REFINEMENT_POLL_INTERVAL, self._load_refinement, self._refinement
+        )
+
+    def _load_refinement(self, refinement: "Future[OrientedBox]") -> None:
+        """
+        Loads the result of the background measurement to the UI, once it's available.
+        Results of refinements that have been superseded by a new measurement are dropped.
+        """
+        if refinement is not self._refinement:
+            return
+        if not refinement.done():
+            self.layout.button_save["state"] = tk.DISABLED
+            self.root.after(REFINEMENT_POLL_INTERVAL, self._load_refinement, refinement)
+            return
+
+        self._refinement = None
+        try:
+            box = refinement.result()
+        except Exception as e:  # pylint: disable=W0703
+            # The preview stays, it can be saved like any other measurement.
+            log.error(
+                f"Cannot measure the exact oriented box, keeping the preview: {e}"
+            )
+            self._set_measurements(
+                (self.vars.x_measure, self.vars.y_measure, self.vars.z_measure),
+                "Preview: The exact measurement has failed, see the log file.",
+            )
+        else:
+            log.info(f"Oriented box of part: {box.size} (rotation {box.rotation})")
+            self._set_measurements(
+                box.get_size(n_digits=resource.settings.precision), ""
+            )
+            self.load_calculated()
+        self.load_result()
+
+    def close(self) -> None:
+        """
+        Drops a running refinement and shuts down the background measurement, e.g. when the
+        window is hidden in resident mode. A pending poll of the refinement doesn't load its
+        result anymore.
+        """
+        if self._refinement is not None:
+            self._refinement.cancel()
+            self._refinement = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
     def load_process(self) -> None:
         """
@@ -192,6 +368,33 @@ class Loaders:
             self.layout.input_step["state"] = tk.DISABLED
             self.vars.scale_step_value.set(0)
 
+    def load_history(self) -> None:
+        """
+        Prefills the axis, the offset, the step and the thickness from the latest save of the
+        part, if the part has been saved with the selected preset before.
+
+        Requires the selected preset and its defaults to be loaded.
+        """
+        try:
+            save = history.get_latest(
+                self.part_helper.part_number, self.part_helper.path
+            )
+        except sqlite3.Error as e:
+            log.warning(f"Cannot read the history: {e}")
+            return
+        if save is None or save.preset != self.vars.selected_preset.name:
+            return
+
+        log.info(f"Prefilling the values of the save from {time.ctime(save.saved_at)}.")
+        if self.vars.selected_preset.preference:
+            self.layout.input_axis.set(save.axis)
+            self.vars.selected_axis = Axes(save.axis)
+        if self.vars.selected_preset.offset:
+            self.vars.scale_offset_value.set(save.offset)
+            self.vars.scale_step_value.set(save.step)
+        if str(self.layout.input_thickness["state"]) == tk.NORMAL:
+            self.vars.thickness_value.set(save.thickness)
+
     def load_chkbox_thickness(self) -> None:
         """
         Loads the thickness checkbox depending on the presets config file and
@@ -233,10 +436,15 @@ class Loaders:
 
         Requires valid measurements.
         """
+        x_measure, y_measure, z_measure = self._get_calculation_base()
+        self.vars.entry_measure_x_text.set(str(x_measure))
+        self.vars.entry_measure_y_text.set(str(y_measure))
+        self.vars.entry_measure_z_text.set(str(z_measure))
+
         x_calc, y_calc, z_calc = get_offset(
-            self.vars.x_measure,
-            self.vars.y_measure,
-            self.vars.z_measure,
+            x_measure,
+            y_measure,
+            z_measure,
             self.vars.selected_preset,
             self.vars.selected_axis,
             self.vars.scale_offset_value,
@@ -246,6 +454,45 @@ class Loaders:
         self.vars.entry_value_y_text.set(str(y_calc))
         self.vars.entry_value_z_text.set(str(z_calc))
 
+    def _get_calculation_base(self) -> Tuple[float, float, float]:
+        """
+        Returns the measurements the calculation is based on. In the enclosing cylinder mode
+        the diameter presets use the diameter of the minimum enclosing cylinder around the
+        selected axis for both axes that aren't the selected axis. The cylinder is computed
+        once per axis and measurement.
+        """
+        measurements = {
+            Axes.X: self.vars.x_measure,
+            Axes.Y: self.vars.y_measure,
+            Axes.Z: self.vars.z_measure,
+        }
+        if self._points is None or self.vars.selected_preset.coord in [3, 4]:
+            return self.vars.x_measure, self.vars.y_measure, self.vars.z_measure
+
+        selected_axis = self.vars.selected_axis
+        if selected_axis not in self._cylinders:
+            # pylint: disable=C0415
+            from measure.cylinder import get_enclosing_cylinder
+
+            # pylint: enable=C0415
+
+            direction = tuple(float(axis == selected_axis) for axis in Axes)
+            cylinder = get_enclosing_cylinder(self._points, direction)
+            log.info(
+                f"Enclosing cylinder of part around the {selected_axis.value}: "
+                f"{cylinder.diameter} x {cylinder.length}"
+            )
+            self._cylinders[selected_axis] = cylinder
+
+        diameter, _ = self._cylinders[selected_axis].get_size(
+            n_digits=resource.settings.precision
+        )
+        x, y, z = (
+            value if axis == selected_axis else diameter
+            for axis, value in measurements.items()
+        )
+        return x, y, z
+
     @_busy
     def load_result(self) -> None:
         """
@@ -265,3 +512,6 @@ class Loaders:
         )
         self.vars.entry_result_new_text.set(value)
         self.validators.validate_result()
+        if self._refinement is not None:
+            # The preview can't be saved while the exact measurement is running.
+            self.layout.button_save["state"] = tk.DISABLED
@@ -2,7 +2,6 @@
     The validators submodule for this app.
 """
 
-import re
 import tkinter as tk
 
 from app.layout import Layout
@@ -31,9 +30,8 @@ class Validators:
         the OK button accordingly to the validation result.
         """
 
-        if re.match(
-            self.vars.selected_preset.result_filter,
-            self.vars.entry_result_new_text.get(),
+        if self.vars.selected_preset.result_pattern.match(
+            self.vars.entry_result_new_text.get()
         ):
             self.layout.button_save["state"] = tk.NORMAL
             ToolTip(self.layout.button_save, "")
@@ -10,6 +10,7 @@ from tkinter import Tk
 
 import resources
 from const import Axes
+from const import MeasurementMode
 
 
 @dataclass(slots=True, kw_only=True)
@@ -39,6 +40,8 @@ class Variables:
     selected_axis: Axes
     pre_selected_preset_reason: str
 
+    measurement_mode: StringVar
+
     def __init__(self, root: Tk) -> None:
         """Initialize the variables."""
         self.x_measure = 0.0
@@ -67,3 +70,11 @@ class Variables:
         self.selected_preset = resources.resource.presets[0]
         self.selected_axis = Axes.X
         self.pre_selected_preset_reason = ""
+
+        self.measurement_mode = StringVar(master=root, name="measurement_mode")
+        if resources.resource.appdata.measurement_mode in [
+            m.value for m in MeasurementMode
+        ]:
+            self.measurement_mode.set(resources.resource.appdata.measurement_mode)
+        else:
+            self.measurement_mode.set(MeasurementMode.AXIS_ALIGNED.value)
@@ -0,0 +1,50 @@
+"""
+    Atomic writes of the files in the appdata folder.
+
+    The content is written to a temporary file in the same folder, which then replaces the
+    file. A concurrently starting app sees either the old or the new file, an interrupted write
+    doesn't corrupt the file.
+
+    Important: Do not import third party modules here. This module
+    must work on its own without any other dependencies!
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import IO
+from typing import Any
+from typing import Callable
+
+
+def write_atomic(
+    path: Path | str, write: Callable[[IO[Any]], Any], binary: bool = False
+) -> None:
+    """
+    Writes a file atomically. The temporary file is removed if the write fails.
+
+    Args:
+        path (Path | str): The path of the file. Missing folders are created.
+        write (Callable[[IO[Any]], Any]): The function that writes the content to the given \
+            file object, e.g. `lambda f: json.dump(data, f)`.
+        binary (bool, optional): Opens the file in binary mode instead of utf8 text mode. \
+            Defaults to False.
+
+    Raises:
+        OSError: Raised when the file cannot be written. Errors of the write function are \
+            raised as well.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        if binary:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+        else:
+            with os.fdopen(fd, "w", encoding="utf8") as f:
+                write(f)
+        os.replace(temp, path)
+    except BaseException:
+        Path(temp).unlink(missing_ok=True)
+        raise
@@ -21,9 +21,13 @@ CNEXT = "win_b64\\code\\bin\\CNEXT.exe"
 TEMP = str(os.environ.get("TEMP"))
 APPDATA = f"{str(os.environ.get('APPDATA'))}\\{PYTIA}\\{PYTIA_BOUNDING_BOX}"
 LOGS = f"{APPDATA}\\logs"
+WHEELHOUSE = f"{APPDATA}\\wheelhouse"
+APP_CACHE = f"{APPDATA}\\.app"
+HULLS = f"{APPDATA}\\hulls"
 LOG = "app.log"
 PID = os.getpid()
 PID_FILE = f"{TEMP}\\{PYTIA_BOUNDING_BOX}.pid"
+RESIDENT_NAME = f"{PYTIA_BOUNDING_BOX}-{LOGON}"
 VENV = f"\\.env\\{APP_VERSION}"
 VENV_PYTHON = Path(VENV, "Scripts\\python.exe")
 VENV_PYTHONW = Path(VENV, "Scripts\\pythonw.exe")
@@ -32,6 +36,7 @@ PY_VERSION = APPDATA + "\\pyversion.txt"
 CONFIG_APPDATA = "config.json"
 CONFIG_SETTINGS = "settings.json"
 CONFIG_DEPS = "dependencies.json"
+CONFIG_DEPS_VERIFIED = "dependencies.verified.json"
 CONFIG_PROPS = "properties.json"
 CONFIG_PROPS_DEFAULT = "properties.default.json"
 CONFIG_PRESETS = "presets.json"
@@ -41,9 +46,16 @@ CONFIG_PROCESSES_DEFAULT = "processes.default.json"
 CONFIG_INFOS = "information.json"
 CONFIG_INFOS_DEFAULT = "information.default.json"
 CONFIG_USERS = "users.json"
+CONFIG_MEASUREMENTS = "measurements.json"
+HISTORY_DATABASE = "history.sqlite3"
+RESIDENT_KEY = "resident.key"
+STARTUP_TIMINGS = "startup.json"
 
 WEB_PIP = "https://www.pypi.org"
 
+REFINEMENT_POLL_INTERVAL = 100  # ms
+RESIDENT_POLL_INTERVAL = 100  # ms
+
 STYLES = [
     "cosmo",
     "litera",
@@ -80,3 +92,13 @@ class Axes(Enum):
     X = "X-Axis"
     Y = "Y-Axis"
     Z = "Z-Axis"
+
+
+class MeasurementMode(Enum):
+    """Enum class for measurement modes."""
+
+    AXIS_ALIGNED = "Axis-aligned box"
+    BODIES = "Axis-aligned box (all bodies)"
+    ORIENTED = "Oriented box"
+    PROGRESSIVE = "Oriented box (progressive)"
+    CYLINDER = "Enclosing cylinder"
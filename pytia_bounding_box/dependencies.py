@@ -11,25 +11,42 @@
         This module must work on its own without any other dependencies!
 """
 
+import hashlib
 import importlib.resources
 import json
+import os
+import queue
 import re
 import subprocess
 import sys
+import sysconfig
+import threading
+import time
 import tkinter as tk
 import tkinter.messagebox as tkmsg
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from dataclasses import dataclass
+from http.client import HTTPConnection
+from http.client import HTTPException
 from http.client import HTTPSConnection
 from importlib import metadata
-from socket import gaierror
+from pathlib import Path
 from tkinter import ttk
+from typing import Dict
+from typing import Iterable
 from typing import List
+from typing import Optional
 from urllib.parse import urlparse
 
+from atomic import write_atomic
+from const import APPDATA
 from const import CONFIG_DEPS
+from const import CONFIG_DEPS_VERIFIED
 from const import VENV_PYTHON
 from const import VENV_PYTHONW
 from const import WEB_PIP
+from const import WHEELHOUSE
 from resources import resource
 
 
@@ -76,39 +93,143 @@ class Environment:
 class Dependencies:
     """Class for managing dependencies."""
 
-    def __init__(self) -> None:
-        ...
+    def __init__(
+        self, verified_path: Path | str = Path(APPDATA, CONFIG_DEPS_VERIFIED)
+    ) -> None:
+        """
+        Inits the Dependencies class.
+
+        Args:
+            verified_path (Path | str, optional): The file that stores the key of the last \
+                successful verification. Defaults to the file in the appdata folder.
+        """
+        self.verified_path = Path(verified_path)
 
     @staticmethod
-    def read_dependencies_file() -> List[PackageInfo]:
+    def read_dependencies_data() -> bytes:
+        """Returns the content of the deps json from the resources folder."""
+        with importlib.resources.open_binary("resources", CONFIG_DEPS) as f:
+            return f.read()
+
+    @classmethod
+    def read_dependencies_file(cls) -> List[PackageInfo]:
         """
         Reads the deps json from the resources folder.
 
         Returns:
             List[PackageInfo]: The dependencies as a list.
         """
-        with importlib.resources.open_binary("resources", CONFIG_DEPS) as f:
-            return [PackageInfo(**i) for i in json.load(f)]
+        return [PackageInfo(**i) for i in json.loads(cls.read_dependencies_data())]
+
+    @classmethod
+    def get_verification_key(cls) -> str:
+        """
+        Returns the key of the verification of the installed packages: The interpreter, the
+        environment, the modification time of its site-packages folder and the digest of the
+        deps json. Installing or removing a package changes the site-packages folder.
+        """
+        try:
+            state: Optional[int] = os.stat(sysconfig.get_paths()["purelib"]).st_mtime_ns
+        except OSError:
+            state = None
+        digest = hashlib.blake2b(cls.read_dependencies_data(), digest_size=16)
+        return f"{sys.executable}|{sys.prefix}|{state}|{digest.hexdigest()}"
+
+    def is_verified(self, key: str) -> bool:
+        """Returns wether the packages have been verified with the given key before."""
+        try:
+            with open(self.verified_path, "r", encoding="utf8") as f:
+                return json.load(f).get("key") == key
+        except (OSError, ValueError, AttributeError):
+            return False
+
+    def set_verified(self, key: str) -> None:
+        """
+        Stores the key of a successful verification. The file is replaced atomically, errors
+        are ignored: The packages are verified again on the next start.
+        """
+        try:
+            write_atomic(self.verified_path, lambda f: json.dump({"key": key}, f))
+        except OSError:
+            pass
 
     def _remove_venv(self) -> None:
         pass
 
     @staticmethod
-    def web_resource_available(address: str) -> bool:
-        """Returns wether a web resource is available or not."""
-        domain = urlparse(address).netloc
-        path = urlparse(address).path or "/"
-        conn = HTTPSConnection(domain, timeout=5)
-
+    def _probe_host(
+        scheme: str, host: str, paths: List[str], deadline: float
+    ) -> Dict[str, bool]:
+        """
+        Sends a HEAD request for each path to the host, all over one connection. Stops at the
+        first error or when the deadline has passed, the remaining paths are unavailable.
+        """
+        available = dict.fromkeys(paths, False)
+        connection_class = HTTPConnection if scheme == "http" else HTTPSConnection
+        conn = connection_class(host)
         try:
-            conn.request("HEAD", path)
-            response = conn.getresponse()
-            return True if response.status in [200, 301, 302, 307, 308] else False
-        except gaierror:
-            print("not available")
-            return False
+            for path in paths:
+                # Each request gets the remaining time only, not the full timeout.
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                conn.timeout = remaining
+                if conn.sock is not None:
+                    conn.sock.settimeout(remaining)
+                conn.request("HEAD", path or "/")
+                response = conn.getresponse()
+                response.read()  # The response must be consumed to reuse the connection.
+                available[path] = response.status in [200, 301, 302, 307, 308]
+        except (OSError, HTTPException):
+            pass
         finally:
             conn.close()
+        return available
+
+    @classmethod
+    def web_resources_available(
+        cls, addresses: Iterable[str], timeout: float = 5
+    ) -> Dict[str, bool]:
+        """
+        Returns wether the web resources are available or not. The hosts are probed
+        concurrently, the resources of one host share a connection.
+
+        Args:
+            addresses (Iterable[str]): The addresses of the web resources.
+            timeout (float, optional): The deadline for all probes in seconds. Resources \
+                that haven't been probed until then are unavailable. Defaults to 5.
+
+        Returns:
+            Dict[str, bool]: Wether each address is available.
+        """
+        deadline = time.monotonic() + timeout
+        hosts: Dict[tuple, Dict[str, str]] = {}
+        for address in addresses:
+            url = urlparse(address)
+            hosts.setdefault((url.scheme, url.netloc), {})[url.path] = address
+
+        available = {
+            address: False for paths in hosts.values() for address in paths.values()
+        }
+        if not hosts:
+            return available
+        executor = ThreadPoolExecutor(len(hosts))
+        futures = {
+            executor.submit(cls._probe_host, *host, list(paths), deadline): paths
+            for host, paths in hosts.items()
+        }
+        done, _ = wait(futures, timeout=max(deadline - time.monotonic(), 0))
+        # Probes still running are bound by the socket timeout, don't wait for them.
+        executor.shutdown(wait=False, cancel_futures=True)
+        for future in done:
+            for path, result in future.result().items():
+                available[futures[future][path]] = result
+        return available
+
+    @classmethod
+    def web_resource_available(cls, address: str, timeout: float = 5) -> bool:
+        """Returns wether a web resource is available or not."""
+        return cls.web_resources_available([address], timeout)[address]
 
     @classmethod
     def get_missing_packages(cls) -> List[PackageInfo]:
@@ -123,12 +244,41 @@ class Dependencies:
                 missing_packages.append(package)
         return missing_packages
 
+    @staticmethod
+    def get_cached_wheel(address: str) -> Path:
+        """
+        Returns the path of a wheel in the wheelhouse. Wheels are stored by their file name,
+        which contains the name, the version and the platform tags of the package.
+        """
+        return Path(WHEELHOUSE, Path(urlparse(address).path).name)
+
+    @classmethod
+    def get_cached_requirements(cls) -> Optional[List[str]]:
+        """
+        Returns the requirements of the missing packages for an installation from the
+        wheelhouse: Wheels are given by their path in the wheelhouse, packages from PyPI by
+        their name and version. Returns None if a wheel hasn't been downloaded yet.
+        """
+        requirements = []
+        for package in cls.get_missing_packages():
+            if package.wheel is None:
+                requirements.append(f"{package.name}=={package.version}")
+            elif (wheel := cls.get_cached_wheel(package.wheel)).is_file():
+                requirements.append(str(wheel))
+            else:
+                return None
+        return requirements
+
     @classmethod
     def get_pip_commands(cls) -> dict:
         pip_commands = {}
-        for missing_package in cls.get_missing_packages():
+        missing_packages = cls.get_missing_packages()
+        wheels_available = cls.web_resources_available(
+            p.wheel for p in missing_packages if p.wheel is not None
+        )
+        for missing_package in missing_packages:
             if missing_package.wheel is not None:
-                if cls.web_resource_available(missing_package.wheel):
+                if wheels_available[missing_package.wheel]:
                     pip_commands[missing_package.name] = missing_package.wheel
                 else:
                     tkmsg.showerror(
@@ -143,14 +293,21 @@ class Dependencies:
             else:
                 pip_commands[
                     missing_package.name
-                ] = f'"{missing_package.name}=={missing_package.version}"'
+                ] = f"{missing_package.name}=={missing_package.version}"
         return pip_commands
 
     def install_dependencies(self) -> None:
         """Installs missing dependencies."""
 
+        # If the packages have been verified in this environment before and nothing has been
+        # installed or removed since, start the app without reading the package metadata.
+        key = self.get_verification_key()
+        if self.is_verified(key):
+            return
+
         # If nothing's missing, return and start the app.
         if self.get_missing_packages() == []:
+            self.set_verified(key)
             return
 
         Environment.warn_if_not_virtual()
@@ -212,8 +369,70 @@ class VisualInstaller(tk.Tk):
         self.progress_bar.grid(row=1, column=0, padx=(15, 3), pady=(15, 3))
         self.progress_bar.focus()
 
+    def _run_pip(self, *args: str) -> bool:
+        """
+        Runs pip in the environment of the app. Reports the progress of pip per package.
+
+        Returns:
+            bool: Wether pip has succeeded.
+        """
+        python_exe = sys.executable
+        if str(VENV_PYTHONW) in python_exe:
+            python_exe = python_exe.replace(str(VENV_PYTHONW), str(VENV_PYTHON))
+        command = [python_exe, "-m", "pip", *args]
+        command += ["--no-cache-dir", "--disable-pip-version-check"]
+
+        lines: queue.Queue[str] = queue.Queue()
+        with subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        ) as process:
+            reader = threading.Thread(
+                target=lambda: [lines.put(line) for line in process.stdout],  # type: ignore
+                daemon=True,
+            )
+            reader.start()
+            while process.poll() is None or reader.is_alive():
+                while not lines.empty():
+                    self._report(lines.get())
+                self.update()
+                time.sleep(0.01)
+            while not lines.empty():
+                self._report(lines.get())
+        return process.returncode == 0
+
+    def _report(self, line: str) -> None:
+        """Shows the progress of pip, e.g. 'Downloading numpy-2.1.3-...whl'."""
+        words = line.split()
+        if len(words) > 1 and words[0] in ("Collecting", "Downloading", "Saved"):
+            self.message.set(f"{words[0]} {Path(words[1]).name}"[:48])
+        elif line.startswith(("Installing collected packages", "Successfully")):
+            self.message.set(line.strip()[:48])
+        self.update_idletasks()
+
     def _install_pip(self) -> None:
-        """Installs python packages using pip."""
+        """
+        Installs python packages using pip. The packages are installed from the wheelhouse in
+        the appdata folder, without connecting to the internet, if all wheels have been
+        downloaded before. Otherwise all missing wheels and their dependencies are downloaded
+        into the wheelhouse first. Both steps are a single pip call for all packages.
+        """
+        self.progress.set(1)
+        self.progress_bar.configure(mode="indeterminate")
+        self.progress_bar.start()
+
+        requirements = Dependencies.get_cached_requirements()
+        self.message.set("Installing packages from the wheelhouse ...")
+        if requirements is not None and self._run_pip(
+            "install", "--no-index", "--find-links", WHEELHOUSE, *requirements
+        ):
+            self.progress_bar.stop()
+            self.destroy()
+            return
+
         if not Dependencies.web_resource_available(WEB_PIP):
             tkmsg.showerror(
                 title=resource.settings.title,
@@ -222,23 +441,29 @@ class VisualInstaller(tk.Tk):
             sys.exit()
 
         pip_commands = Dependencies.get_pip_commands()
-
-        self.progress.set(1)
-        self.progress_bar.configure(mode="indeterminate")
-        self.progress_bar.start()
-
-        for index, key in enumerate(pip_commands.keys()):
-            python_exe = sys.executable
-            if str(VENV_PYTHONW) in python_exe:
-                python_exe = python_exe.replace(str(VENV_PYTHONW), str(VENV_PYTHON))
-            command = f"start /wait {python_exe} -m pip install {pip_commands[key]} --no-cache-dir"
-            self.message.set(
-                f"Installing package {index+1} of {len(pip_commands)}: {key}"
+        self.message.set(f"Downloading {len(pip_commands)} packages ...")
+        os.makedirs(WHEELHOUSE, exist_ok=True)
+        if self._run_pip(
+            "download",
+            "--dest",
+            WHEELHOUSE,
+            "--find-links",
+            WHEELHOUSE,
+            *pip_commands.values(),
+        ):
+            if (requirements := Dependencies.get_cached_requirements()) is None:
+                tkmsg.showerror(
+                    title=resource.settings.title,
+                    message=(
+                        "Cannot install required dependencies: The downloaded wheels are "
+                        "missing in the wheelhouse.\n\n"
+                        "Please notify your system administrator immediately."
+                    ),
+                )
+                sys.exit()
+            self._run_pip(
+                "install", "--no-index", "--find-links", WHEELHOUSE, *requirements
             )
-            self.update_idletasks()
-            with subprocess.Popen(command, shell=True) as process:
-                while process.poll() is None:
-                    self.update()
         self.progress_bar.stop()
         self.destroy()
 
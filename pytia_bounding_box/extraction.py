@@ -0,0 +1,145 @@
+"""
+    Runs the app from an extracted copy of the zipapp.
+
+    Imports and resource files are read faster from a folder than from the zipapp. The zipapp
+    is extracted once per app version into the app cache folder, the folder is named by the
+    size and the modification time of the zipapp, so that a rebuilt zipapp of the same version
+    is extracted again. Copies of other versions and other builds are removed.
+
+    The extraction writes a manifest with the size and the digest of each extracted file. The
+    copy is verified against the manifest on each launch and extracted again if a file is
+    missing or has been modified.
+
+    Important: Do not import third party modules here. This module
+    must work on its own without any other dependencies!
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from const import APP_CACHE
+from const import APP_VERSION
+
+MANIFEST = ".manifest.json"
+
+
+def _move_bytecode(folder: Path) -> None:
+    """
+    Moves the bytecode of the zipapp (module.pyc next to module.py) into the __pycache__
+    folders, where it's loaded from for modules with source.
+    """
+    if sys.implementation.cache_tag is None:
+        return
+    for path in folder.rglob("*.pyc"):
+        if path.parent.name != "__pycache__" and path.with_suffix(".py").exists():
+            cache = Path(path.parent, "__pycache__")
+            cache.mkdir(exist_ok=True)
+            path.replace(Path(cache, f"{path.stem}.{sys.implementation.cache_tag}.pyc"))
+
+
+def _get_digest(path: Path) -> str:
+    """Returns the digest of the content of a file."""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def _write_manifest(folder: Path) -> None:
+    """Writes the size and the digest of each file of the extracted copy to the manifest."""
+    files: Dict[str, Tuple[int, str]] = {
+        path.relative_to(folder).as_posix(): (path.stat().st_size, _get_digest(path))
+        for path in folder.rglob("*")
+        if path.is_file()
+    }
+    with open(Path(folder, MANIFEST), "w", encoding="utf8") as f:
+        json.dump(files, f)
+
+
+def _verify(folder: Path) -> bool:
+    """Returns True if all files of the manifest exist with their size and digest."""
+    try:
+        with open(Path(folder, MANIFEST), "r", encoding="utf8") as f:
+            files = json.load(f)
+        for name, (size, digest) in files.items():
+            path = Path(folder, name)
+            # The size is checked first, it's much cheaper than the digest.
+            if path.stat().st_size != size or _get_digest(path) != digest:
+                return False
+    except (OSError, ValueError, TypeError):
+        return False
+    return True
+
+
+def _remove_stale(root: Path, version: str, current: Path) -> None:
+    """Removes the extracted copies of other versions and other builds."""
+    for folder in (*root.glob("*"), *Path(root, version).glob("*")):
+        if folder.is_dir() and folder.name != version and folder != current:
+            if not folder.name.startswith("."):  # Extractions in progress
+                shutil.rmtree(folder, ignore_errors=True)
+
+
+def get_extraction(archive: Path, root: Path, version: str) -> Path:
+    """
+    Returns the extracted copy of the zipapp. Extracts the zipapp if there's no valid copy yet.
+
+    Args:
+        archive (Path): The path of the zipapp.
+        root (Path): The app cache folder.
+        version (str): The version of the app.
+
+    Returns:
+        Path: The folder of the extracted copy.
+    """
+    stat = os.stat(archive)
+    folder = Path(root, version, f"{stat.st_size}-{stat.st_mtime_ns}")
+
+    if not _verify(folder):
+        # An incomplete or modified copy is replaced. Files in use by a running instance of
+        # the app can't be removed, the rename fails in this case.
+        shutil.rmtree(folder, ignore_errors=True)
+        folder.parent.mkdir(parents=True, exist_ok=True)
+        # Extract into a temporary folder first, the copy is complete once it's renamed.
+        temp = Path(tempfile.mkdtemp(prefix=".extracting-", dir=folder.parent))
+        try:
+            with zipfile.ZipFile(archive) as z:
+                z.extractall(temp)
+            _move_bytecode(temp)
+            _write_manifest(temp)
+            os.rename(temp, folder)
+        except OSError:
+            # Another instance of the app has extracted the zipapp in the meantime.
+            shutil.rmtree(temp, ignore_errors=True)
+            if not _verify(folder):
+                raise
+
+    _remove_stale(root, version, folder)
+    return folder
+
+
+def use_extraction() -> Optional[Path]:
+    """
+    Imports the modules of the app from the extracted copy of the zipapp, if the app runs
+    from a zipapp. Must be called before the modules of the app are imported.
+
+    Returns:
+        Optional[Path]: The folder of the extracted copy, None if the app doesn't run from \
+            a zipapp or the zipapp can't be extracted.
+    """
+    if not os.path.isfile(sys.path[0]):
+        return None
+    try:
+        folder = get_extraction(Path(sys.path[0]), Path(APP_CACHE), APP_VERSION)
+    except (OSError, zipfile.BadZipFile):
+        return None
+    # Bytecode written by python (e.g. for another python version) would fail the manifest.
+    sys.dont_write_bytecode = True
+    sys.path[0] = str(folder)
+    return folder
@@ -2,10 +2,13 @@
     The GUI for the application.
 """
 
+import queue
 import time
 import tkinter as tk
 from pathlib import Path
 from tkinter import font
+from typing import TYPE_CHECKING
+from typing import Optional
 
 import ttkbootstrap as ttk
 from app.callbacks import Callbacks
@@ -18,9 +21,13 @@ from app.state import UISetter
 from app.validators import Validators
 from app.vars import Variables
 from const import APP_VERSION
+from const import APPDATA
 from const import LOG
 from const import LOGON
 from const import LOGS
+from const import RESIDENT_POLL_INTERVAL
+from const import STARTUP_TIMINGS
+from lazy import lazy_import
 from pytia.exceptions import PytiaBodyEmptyError
 from pytia.exceptions import PytiaDifferentDocumentError
 from pytia.exceptions import PytiaDocumentNotSavedError
@@ -29,13 +36,20 @@ from pytia.exceptions import PytiaPropertyNotFoundError
 from pytia.exceptions import PytiaWrongDocumentTypeError
 from pytia.log import log
 from pytia_ui_tools.exceptions import PytiaUiToolsOutsideWorkspaceError
-from pytia_ui_tools.handlers.error_handler import ErrorHandler
-from pytia_ui_tools.handlers.mail_handler import MailHandler
-from pytia_ui_tools.handlers.workspace_handler import Workspace
 from pytia_ui_tools.window_manager import WindowManager
+from resident import ResidentServer
 from resources import resource
+from timing import tracer
 
-t0 = time.perf_counter()
+if TYPE_CHECKING:
+    from pytia_ui_tools.handlers.error_handler import ErrorHandler
+    from pytia_ui_tools.handlers.workspace_handler import Workspace
+
+# The handlers are only required after the window has been shown, the error and the mail
+# handler only if an error occurs.
+ui_tools_error_handler = lazy_import("pytia_ui_tools.handlers.error_handler")
+ui_tools_mail_handler = lazy_import("pytia_ui_tools.handlers.mail_handler")
+ui_tools_workspace_handler = lazy_import("pytia_ui_tools.handlers.workspace_handler")
 
 
 class GUI(tk.Tk):
@@ -44,21 +58,33 @@ class GUI(tk.Tk):
     HEIGHT = 480
     WIDTH = 390
 
-    def __init__(self) -> None:
-        ttk.tk.Tk.__init__(self)
-        ttk.Style(theme=resource.appdata.theme)
+    def __init__(self, resident: Optional[ResidentServer] = None) -> None:
+        """
+        Inits the GUI class.
+
+        Args:
+            resident (Optional[ResidentServer], optional): The server of the resident mode. \
+                The window is hidden instead of destroyed, if given. Defaults to None.
+        """
+        with tracer.span("tk"):
+            ttk.tk.Tk.__init__(self)
+        with tracer.span("theme"):
+            ttk.Style(theme=resource.appdata.theme)
 
         self.part_helper: LazyPartHelper  # Instantiate later for performance improvement
         self.loaders: Loaders  # Instantiate later, depends on part_helper
-        self.workspace: Workspace  # The workspace and loaders can only be read after the
+        self.workspace: "Workspace"  # The workspace and loaders can only be read after the
         # lazy_document_helper has been instantiated. The reason is that the workspace depends on
         # the 'document.full_name' property, which is only available after the lazy_document_helper
         # has been instantiated.
-        self.vars = Variables(root=self)
-        self.frames = Frames(root=self)
-        self.layout = Layout(root=self, frames=self.frames, variables=self.vars)
-        self.set_ui = UISetter(root=self, layout=self.layout)
-        self.validators = Validators(variables=self.vars, layout=self.layout)
+        self.resident = resident
+        self.hidden_at: Optional[float] = None  # The time the window has been hidden at
+        with tracer.span("layout"):
+            self.vars = Variables(root=self)
+            self.frames = Frames(root=self)
+            self.layout = Layout(root=self, frames=self.frames, variables=self.vars)
+            self.set_ui = UISetter(root=self, layout=self.layout)
+            self.validators = Validators(variables=self.vars, layout=self.layout)
 
         self.readonly = bool(
             not resource.user_exists(LOGON)
@@ -66,24 +92,8 @@ class GUI(tk.Tk):
         )
 
         self.window_manager = WindowManager(self)
-        self.mail_handler = MailHandler(
-            standard_receiver=resource.settings.mails.admin,
-            app_title=resource.settings.title,
-            app_version=APP_VERSION,
-            logfile=Path(LOGS, LOG),
-        )
-        self.error_handler = ErrorHandler(
-            mail_handler=self.mail_handler,
-            warning_exceptions=[
-                PytiaNoDocumentOpenError,
-                PytiaWrongDocumentTypeError,
-                PytiaBodyEmptyError,
-                PytiaPropertyNotFoundError,
-                PytiaDifferentDocumentError,
-                PytiaDocumentNotSavedError,
-                PytiaUiToolsOutsideWorkspaceError,
-            ],
-        )
+        # The error handler is instantiated on the first error.
+        self._error_handler: Optional["ErrorHandler"] = None
 
         self.title(
             f"{resource.settings.title} "
@@ -96,7 +106,6 @@ class GUI(tk.Tk):
         self.config(cursor="wait")
         self.default_font = font.nametofont("TkDefaultFont")
         self.default_font.configure(family="Segoe UI", size=10)
-        self.report_callback_exception = self.error_handler.exceptions_callback
 
         screen_width = self.winfo_screenwidth()
         screen_height = self.winfo_screenheight()
@@ -104,20 +113,70 @@ class GUI(tk.Tk):
         y_coordinate = int((screen_height / 2) - (GUI.HEIGHT / 2))
         self.geometry(f"{GUI.WIDTH}x{GUI.HEIGHT}+{x_coordinate}+{y_coordinate}")
 
-        self.update()
+        with tracer.span("paint"):
+            self.update()
         self.window_manager.remove_window_buttons()
 
+    @property
+    def error_handler(self) -> "ErrorHandler":
+        """Returns the error handler, instantiates the error and the mail handler if necessary."""
+        if self._error_handler is None:
+            self._error_handler = ui_tools_error_handler.ErrorHandler(
+                mail_handler=ui_tools_mail_handler.MailHandler(
+                    standard_receiver=resource.settings.mails.admin,
+                    app_title=resource.settings.title,
+                    app_version=APP_VERSION,
+                    logfile=Path(LOGS, LOG),
+                ),
+                warning_exceptions=[
+                    PytiaNoDocumentOpenError,
+                    PytiaWrongDocumentTypeError,
+                    PytiaBodyEmptyError,
+                    PytiaPropertyNotFoundError,
+                    PytiaDifferentDocumentError,
+                    PytiaDocumentNotSavedError,
+                    PytiaUiToolsOutsideWorkspaceError,
+                ],
+            )
+        return self._error_handler
+
+    def report_callback_exception(self, exc, val, tb) -> None:  # type: ignore
+        """Handles the exceptions of all callbacks with the error handler."""
+        self.error_handler.exceptions_callback(exc, val, tb)
+
     def run(self) -> None:
         """Run the app."""
-        t1 = time.perf_counter()  # pylint: disable=C0103
-        log.info(f"Loaded UI in {(t1-t0):.4f}s")
-
         self.after(200, self.run_controller)
         self.mainloop()
 
+    def destroy(self) -> None:
+        """
+        Destroys the window. Hides the window in resident mode instead, it's shown again for
+        the next request.
+        """
+        if (loaders := getattr(self, "loaders", None)) is not None:
+            loaders.close()
+        if self.resident is None:
+            super().destroy()
+            return
+        self.withdraw()
+        self.hidden_at = time.monotonic()
+        self.resident.set_idle()
+        log.info("Waiting for the next request in resident mode.")
+
     def run_controller(self) -> None:
         """Runs all controllers. Initializes all lazy loaders."""
-        self.part_helper = LazyPartHelper()
+        self.document_controller()
+        self.report_trace()
+        if self.resident is not None:
+            self.resident_controller()
+
+    def document_controller(self) -> None:
+        """Initializes all lazy loaders for the active document and runs the main controller."""
+        if (loaders := getattr(self, "loaders", None)) is not None:
+            loaders.close()  # Drops the refinement of the previous document.
+        with tracer.span("part"):
+            self.part_helper = LazyPartHelper()
         self.loaders = Loaders(
             root=self,
             variables=self.vars,
@@ -126,12 +185,13 @@ class GUI(tk.Tk):
             lazy_part_helper=self.part_helper,
             ui_setter=self.set_ui,
         )
-        self.workspace = Workspace(
-            path=self.part_helper.path,
-            filename=resource.settings.files.workspace,
-            allow_outside_workspace=resource.settings.restrictions.allow_outside_workspace,
-        )
-        self.workspace.read_yaml()
+        with tracer.span("workspace"):
+            self.workspace = ui_tools_workspace_handler.Workspace(
+                path=self.part_helper.path,
+                filename=resource.settings.files.workspace,
+                allow_outside_workspace=resource.settings.restrictions.allow_outside_workspace,
+            )
+            self.workspace.read_yaml()
         self.callbacks()
         self.traces()
         self.bindings()
@@ -141,17 +201,66 @@ class GUI(tk.Tk):
         """The main controller: Loads and calculates the bounding box."""
         self.set_ui.busy()
         self.loaders.load_process()
-        self.loaders.load_measurements()
-        self.loaders.load_combobox_preset()
-        self.loaders.load_combobox_axis()
-        self.loaders.load_chkbox_thickness()
-        self.loaders.load_scale_offset()
-        self.loaders.load_scale_step()
-        self.loaders.load_existing_base_size()
-        self.loaders.load_calculated()
-        self.loaders.load_result()
+        with tracer.span("measurement"):
+            self.loaders.load_measurements()
+        with tracer.span("result"):
+            self.loaders.load_combobox_preset()
+            self.loaders.load_combobox_axis()
+            self.loaders.load_chkbox_thickness()
+            self.loaders.load_scale_offset()
+            self.loaders.load_scale_step()
+            self.loaders.load_history()
+            self.loaders.load_existing_base_size()
+            self.loaders.load_calculated()
+            self.loaders.load_result()
         # self.set_ui.normal()
 
+    def resident_controller(self) -> None:
+        """
+        Shows the window for the active document, if another launch of the app has handed its
+        request over. Exits the app if the window has been hidden for longer than the timeout
+        from the settings. Repeats itself until then.
+        """
+        assert self.resident is not None
+        try:
+            self.resident.requests.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            log.info("Showing the window for the active document in resident mode.")
+            self.hidden_at = None
+            self.config(cursor="wait")
+            self.layout.input_preset.current(0)
+            self.vars.pre_selected_preset_reason = ""
+            self.deiconify()
+            self.lift()
+            self.focus_force()
+            tracer.start("resident")
+            self.document_controller()
+            self.report_trace()
+
+        if (
+            self.hidden_at is not None
+            and time.monotonic() - self.hidden_at
+            > resource.settings.resident.timeout * 60
+            and self.resident.stop()
+        ):
+            log.info("Exiting the resident mode after the timeout.")
+            super().destroy()
+            return
+        self.after(RESIDENT_POLL_INTERVAL, self.resident_controller)
+
+    def report_trace(self) -> None:
+        """
+        Ends the start-up trace once the first result is shown. Writes the trace to the log
+        and to the start-up timings in the appdata folder.
+        """
+        if not tracer.finish():
+            return
+        for line in tracer.format():
+            log.info(line)
+        tracer.write(Path(APPDATA, STARTUP_TIMINGS))
+
     def bindings(self) -> None:
         """Key bindings."""
         self.bind("<Escape>", lambda _: self.destroy())
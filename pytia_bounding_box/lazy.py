@@ -0,0 +1,58 @@
+"""
+    Deferred imports of modules, which are only required in some cases.
+
+    `lazy_import` returns a stand-in of the module, the module itself is imported on the first
+    attribute access. This keeps rarely used modules, like the error and the mail handler, out
+    of the start-up of the app.
+
+    Usage:
+
+        error_handler = lazy_import("pytia_ui_tools.handlers.error_handler")
+
+        def on_error() -> None:
+            error_handler.ErrorHandler(...)  # Imports the module
+
+    Important: Do not import third party modules here. This module
+    must work on its own without any other dependencies!
+"""
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Any
+
+from timing import tracer
+
+
+class LazyModule(ModuleType):
+    """Stand-in of a module, which imports the module on the first attribute access."""
+
+    def _load(self) -> ModuleType:
+        """Imports the module and takes over its namespace."""
+        with tracer.span(f"import {self.__name__}"):
+            module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return module
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names that aren't in the namespace yet.
+        return getattr(self._load(), name)
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__name__!r}>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Returns the module, if it has been imported already. Returns a stand-in of the module
+    otherwise, which imports the module on the first attribute access.
+
+    Args:
+        name (str): The absolute name of the module, e.g. "pytia_ui_tools.handlers.error_handler".
+
+    Returns:
+        ModuleType: The module or its stand-in.
+    """
+    if (module := sys.modules.get(name)) is not None:
+        return module
+    return LazyModule(name)
@@ -14,20 +14,30 @@ from const import LOGS
 from const import PID
 from const import PID_FILE
 from dependencies import deps
+from resident import ResidentServer
+from resident import hand_over
 from resources import resource
+from timing import tracer
 
 
 def main() -> None:
     """Application entry point."""
 
+    # In resident mode a running instance of the app shows its window for the active
+    # document, nothing else must be loaded in this case.
+    if resource.settings.resident.enabled and hand_over():
+        return
+
     # For the apps auto-install-feature, all required dependencies must be
     # imported after they have been checked.
     # So: First check if all required dependencies are installed.
     # Afterwards import those modules which depend on third party modules.
-    deps.install_dependencies()
+    with tracer.span("dependencies"):
+        deps.install_dependencies()
 
-    from gui import GUI  # pylint: disable=C0415
-    from pytia.log import log  # pylint: disable=C0415
+    with tracer.span("imports"):
+        from gui import GUI  # pylint: disable=C0415
+        from pytia.log import log  # pylint: disable=C0415
 
     with open(PID_FILE, "w") as f:
         f.write(str(PID))
@@ -40,7 +50,15 @@ def main() -> None:
     log.add_file_handler(folder=LOGS, filename=LOG)
     log.info(f"Running PYTIA Bounding Box {APP_VERSION}, PID={PID}")
 
-    gui = GUI()
+    resident = None
+    if resource.settings.resident.enabled:
+        resident = ResidentServer()
+        if not resident.start():
+            log.warning("Cannot run in resident mode, another instance is running.")
+            resident = None
+
+    with tracer.span("gui"):
+        gui = GUI(resident=resident)
     gui.run()
 
 
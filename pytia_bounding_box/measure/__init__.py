@@ -0,0 +1,3 @@
+"""
+    The measure submodule of the app. Computes extents from point sources, such as meshes.
+"""
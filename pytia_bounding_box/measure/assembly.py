@@ -0,0 +1,141 @@
+"""
+    Envelopes of assemblies from the boxes of their parts.
+
+    Each instance of a part is placed by a rigid transform, which maps the coordinates of the
+    part to the coordinates of the assembly. For nested products the transform of an instance
+    is the product of all transforms along its path. The envelope is the bounding box of all
+    transformed part boxes. It's computed for all instances at once: A box transformed by the
+    rotation R spans |R| times its half edge lengths around its transformed center, which is
+    exactly the extent of its eight transformed corners.
+
+    Part boxes are measured once per part and reused for all its instances and for every
+    following evaluation of the assembly.
+
+    The app itself measures part documents only, this module isn't used by it. It's provided
+    for callers that walk a product structure themselves.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Sequence
+
+import numpy as np
+from measure.extents import BoundingBox
+from measure.transform import split_transforms
+
+
+class PartBoxCache:
+    """
+    Cache of the bounding boxes per part. Parts are identified by a key, e.g. the path of the
+    part document, and measured on the first request only.
+    """
+
+    def __init__(self, measure: Callable[[Hashable], BoundingBox]) -> None:
+        """
+        Inits the PartBoxCache class.
+
+        Args:
+            measure (Callable[[Hashable], BoundingBox]): The function that measures the part \
+                of the given key.
+        """
+        self.measure = measure
+        self._items: Dict[Hashable, BoundingBox] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, part: Hashable) -> BoundingBox:
+        """
+        Returns the bounding box of a part. The part is measured on the first request only.
+
+        Args:
+            part (Hashable): The key of the part.
+
+        Returns:
+            BoundingBox: The bounding box of the part in its own coordinates.
+        """
+        if part not in self._items:
+            self._items[part] = self.measure(part)
+        return self._items[part]
+
+    def invalidate(self, part: Hashable) -> None:
+        """Removes a part from the cache, e.g. after the part has been modified."""
+        self._items.pop(part, None)
+
+    def clear(self) -> None:
+        """Removes all parts from the cache."""
+        self._items.clear()
+
+
+def get_instance_transform(components: Sequence[float]) -> np.ndarray:
+    """
+    Returns the transform of an instance from the 12 position components of CATIA: The
+    directions of the X, Y & Z axis of the instance followed by its origin, all given in the
+    coordinates of the parent product.
+
+    Args:
+        components (Sequence[float]): The 12 position components.
+
+    Raises:
+        ValueError: Raised when the number of components isn't 12.
+
+    Returns:
+        np.ndarray: The transform as (4, 4) homogeneous matrix.
+    """
+    if len(components) != 12:
+        raise ValueError(f"Expected 12 position components, got {len(components)}.")
+    transform = np.eye(4)
+    transform[:3, :4] = np.asarray(components, dtype=np.float64).reshape(4, 3).T
+    return transform
+
+
+def get_envelope(
+    parts: Sequence[Hashable], transforms: np.ndarray, boxes: PartBoxCache
+) -> BoundingBox:
+    """
+    Returns the envelope of an assembly: The bounding box of all instance boxes in the
+    coordinates of the assembly.
+
+    Args:
+        parts (Sequence[Hashable]): The part key of each instance.
+        transforms (np.ndarray): The transform of each instance as (k, 4, 4) or (k, 3, 3) \
+            array, see `measure.transform.split_transforms`.
+        boxes (PartBoxCache): The cache that provides the boxes of the parts.
+
+    Raises:
+        ValueError: Raised when there are no instances, or when the number of parts and \
+            transforms differs.
+
+    Returns:
+        BoundingBox: The envelope of the assembly.
+    """
+    if len(parts) == 0:
+        raise ValueError("Cannot compute the envelope of an empty assembly.")
+    if len(parts) != len(transforms):
+        raise ValueError(
+            f"Got {len(parts)} parts, but {len(transforms)} instance transforms."
+        )
+    rotations, translations = split_transforms(np.asarray(transforms))
+
+    keys: Dict[Hashable, int] = {}
+    instances = np.fromiter(
+        (keys.setdefault(part, len(keys)) for part in parts),
+        dtype=np.intp,
+        count=len(parts),
+    )
+    part_boxes = [boxes.get(part) for part in keys]
+    minimum = np.array([box.minimum for box in part_boxes])
+    maximum = np.array([box.maximum for box in part_boxes])
+
+    centers = np.einsum("kij,kj->ki", rotations, ((minimum + maximum) / 2)[instances])
+    centers += translations
+    halves = np.einsum(
+        "kij,kj->ki", np.abs(rotations), ((maximum - minimum) / 2)[instances]
+    )
+
+    x_min, y_min, z_min = (float(v) for v in (centers - halves).min(axis=0))
+    x_max, y_max, z_max = (float(v) for v in (centers + halves).max(axis=0))
+    return BoundingBox(minimum=(x_min, y_min, z_min), maximum=(x_max, y_max, z_max))
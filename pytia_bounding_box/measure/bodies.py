@@ -0,0 +1,141 @@
+"""
+    Extents of parts with several bodies.
+
+    Each body is exported as its own mesh file. The bodies are measured concurrently, the
+    bounding box of the part is the union of the body boxes. The box of each body is cached by
+    a key the caller knows before the export, e.g. the body name and the saved state of the
+    part document, so that only bodies without a cached box are exported and measured.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict
+from typing import Hashable
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+
+from measure.extents import BoundingBox
+from measure.parallel import CHUNK_SIZE
+from measure.parallel import get_worker_count
+from measure.readers import get_mesh_extents
+
+
+class BodyExtentsCache:
+    """Cache of the bounding boxes per body. Bodies are identified by a key of the caller."""
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """
+        Inits the BodyExtentsCache class.
+
+        Args:
+            maxsize (int, optional): The number of bodies to keep. Defaults to 256.
+        """
+        self.maxsize = maxsize
+        self._items: OrderedDict[Hashable, BoundingBox] = OrderedDict()
+
+    def get(self, key: Optional[Hashable]) -> Optional[BoundingBox]:
+        """Returns the cached bounding box of a body, None if the key is None or missing."""
+        if key is None or key not in self._items:
+            return None
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def set(self, key: Hashable, box: BoundingBox) -> None:
+        """Stores the bounding box of a body, the least recently used bodies are dropped."""
+        self._items[key] = box
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all bodies from the cache."""
+        self._items.clear()
+
+
+body_extents_cache = BodyExtentsCache()
+
+
+def measure_bodies(
+    paths: Mapping[str, Path | str], workers: int = 0, chunk_size: int = CHUNK_SIZE
+) -> Dict[str, BoundingBox]:
+    """
+    Returns the bounding box of each body, the bodies are measured concurrently. A single
+    large body is reduced by a pool of worker processes.
+
+    Args:
+        paths (Mapping[str, Path | str]): The path of the mesh file of each body.
+        workers (int, optional): The number of threads, or of worker processes for a single \
+            body. Zero or less uses all available cores. Defaults to 0.
+        chunk_size (int, optional): The number of points per chunk of the worker processes. \
+            Defaults to CHUNK_SIZE.
+
+    Returns:
+        Dict[str, BoundingBox]: The bounding box of each body.
+    """
+    if not paths:
+        return {}
+
+    # Several bodies are measured by the threads, the cores are busy already.
+    measure = functools.partial(
+        get_mesh_extents,
+        workers=workers if len(paths) == 1 else 1,
+        chunk_size=chunk_size,
+    )
+    with ThreadPoolExecutor(get_worker_count(workers)) as executor:
+        return dict(zip(paths, executor.map(measure, paths.values())))
+
+
+def get_union_extents(
+    paths: Mapping[str, Path | str],
+    workers: int = 0,
+    chunk_size: int = CHUNK_SIZE,
+    keys: Optional[Mapping[str, Hashable]] = None,
+) -> Tuple[BoundingBox, Dict[str, BoundingBox]]:
+    """
+    Returns the bounding box of a part from the mesh files of its bodies.
+
+    Args:
+        paths (Mapping[str, Path | str]): The path of the mesh file of each body that has \
+            to be measured.
+        workers (int, optional): The number of threads, or of worker processes for a single \
+            body. Zero or less uses all available cores. Defaults to 0.
+        chunk_size (int, optional): The number of points per chunk of the worker processes. \
+            Defaults to CHUNK_SIZE.
+        keys (Optional[Mapping[str, Hashable]], optional): The cache key of each body. \
+            Bodies with a cached box don't need a mesh file, the boxes of the measured \
+            bodies are stored. Bodies without key aren't cached. Defaults to None.
+
+    Raises:
+        ValueError: Raised when there are no bodies, a body has no geometry or a body has \
+            neither a cached box nor a mesh file.
+
+    Returns:
+        Tuple[BoundingBox, Dict[str, BoundingBox]]: The union of all body boxes and the box \
+            of each body.
+    """
+    keys = keys or {}
+    names = list(dict.fromkeys((*keys, *paths)))
+    if not names:
+        raise ValueError("Cannot compute the extents of a part without bodies.")
+
+    cached = {name: body_extents_cache.get(keys.get(name)) for name in names}
+    measured = measure_bodies(
+        {name: path for name, path in paths.items() if cached[name] is None},
+        workers,
+        chunk_size,
+    )
+    for name, box in measured.items():
+        if keys.get(name) is not None:
+            body_extents_cache.set(keys[name], box)
+
+    boxes: Dict[str, BoundingBox] = {}
+    for name in names:
+        if (box := cached[name] or measured.get(name)) is None:
+            raise ValueError(f"The body {name!r} is neither cached nor exported.")
+        boxes[name] = box
+    return functools.reduce(BoundingBox.merge, boxes.values()), boxes
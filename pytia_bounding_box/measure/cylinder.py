@@ -0,0 +1,184 @@
+"""
+    Minimum enclosing cylinder for point sources.
+
+    The cylinder axis is given, e.g. the turning axis of a part. The points are projected onto
+    the plane normal to the axis, the diameter is the diameter of the minimum enclosing circle
+    of the projection. The circle is computed with Welzl's algorithm, the search for points
+    outside of the current circle is vectorized. Pass hull-reduced points (see
+    `measure.hull.get_hull_points`) for large point sources.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+from measure.extents import get_min_max
+from measure.hull import discard_interior_2d
+from measure.hull import get_tolerance
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class EnclosingCylinder:
+    """Dataclass for the minimum enclosing cylinder of a point source around a given axis."""
+
+    axis: Tuple[float, float, float]
+    center: Tuple[float, float, float]
+    diameter: float
+    length: float
+
+    def get_size(self, n_digits: int) -> Tuple[float, float]:
+        """
+        Returns the diameter and the length rounded to the given number of digits, following
+        the same precision rule as the `get_bounding_box` function of pytia.
+
+        Args:
+            n_digits (int): The number of digits after the decimal point.
+
+        Returns:
+            Tuple[float, float]: The rounded diameter and length.
+        """
+        return round(self.diameter, n_digits), round(self.length, n_digits)
+
+
+def _get_circle_2(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Returns the circle with the segment from a to b as diameter."""
+    center = (a + b) / 2
+    return center, float(np.hypot(*(a - center)))
+
+
+def _get_circle_3(
+    a: np.ndarray, b: np.ndarray, c: np.ndarray
+) -> Tuple[np.ndarray, float]:
+    """Returns the circumcircle of three points, or the widest two-point circle if collinear."""
+    ab, ac = b - a, c - a
+    det = 2 * (ab[0] * ac[1] - ab[1] * ac[0])
+    if abs(det) <= np.finfo(float).eps * (ab @ ab + ac @ ac):
+        return max(
+            (_get_circle_2(a, b), _get_circle_2(a, c), _get_circle_2(b, c)),
+            key=lambda circle: circle[1],
+        )
+    offset = (
+        np.array(
+            [
+                ac[1] * (ab @ ab) - ab[1] * (ac @ ac),
+                ab[0] * (ac @ ac) - ac[0] * (ab @ ab),
+            ]
+        )
+        / det
+    )
+    return a + offset, float(np.hypot(*offset))
+
+
+def _get_next_outside(
+    points: np.ndarray,
+    start: int,
+    stop: int,
+    circle: Tuple[np.ndarray, float],
+    tolerance: float,
+) -> Optional[int]:
+    """Returns the index of the first point within [start, stop) outside of the circle."""
+    delta = points[start:stop] - circle[0]
+    distances = np.einsum("ij,ij->i", delta, delta)
+    outside = np.flatnonzero(distances > (circle[1] + tolerance) ** 2)
+    return int(outside[0]) + start if len(outside) else None
+
+
+def get_enclosing_circle(points: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Returns the minimum enclosing circle of planar points (Welzl's algorithm).
+
+    Points inside the octagon of the extreme points cannot touch the circle, they are
+    discarded. The remaining points are shuffled, which gives the expected linear run time.
+    The iterative form of the algorithm only updates the circle when a point lies outside of
+    it, the next such point is searched in one vectorized test.
+
+    Args:
+        points (np.ndarray): The points as (n, 2) array.
+
+    Raises:
+        ValueError: Raised when the array is empty.
+
+    Returns:
+        Tuple[np.ndarray, float]: The center and the radius of the circle.
+    """
+    if len(points) == 0:
+        raise ValueError(
+            "Cannot compute the enclosing circle of an empty point source."
+        )
+
+    candidates = discard_interior_2d(points)
+    candidates = candidates[np.random.default_rng(0).permutation(len(candidates))]
+    if len(candidates) == 1:
+        return candidates[0], 0.0
+
+    tolerance = get_tolerance(candidates)
+
+    circle = _get_circle_2(candidates[0], candidates[1])
+    i = 2
+    while (
+        i := _get_next_outside(candidates, i, len(candidates), circle, tolerance)
+    ) is not None:
+        # The point i is on the boundary of the circle of the first i + 1 points.
+        circle = _get_circle_2(candidates[0], candidates[i])
+        j = 1
+        while (j := _get_next_outside(candidates, j, i, circle, tolerance)) is not None:
+            # The points i & j are on the boundary of the circle of the first j + 1 points.
+            circle = _get_circle_2(candidates[i], candidates[j])
+            k = 0
+            while (
+                k := _get_next_outside(candidates, k, j, circle, tolerance)
+            ) is not None:
+                circle = _get_circle_3(candidates[i], candidates[j], candidates[k])
+                k += 1
+            j += 1
+        i += 1
+    return circle
+
+
+def get_enclosing_cylinder(
+    points: np.ndarray, axis: Tuple[float, float, float] | np.ndarray
+) -> EnclosingCylinder:
+    """
+    Returns the minimum enclosing cylinder of the points around the given axis direction.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+        axis (Tuple[float, float, float] | np.ndarray): The direction of the cylinder axis.
+
+    Raises:
+        ValueError: Raised when the array is empty or the axis has no length.
+
+    Returns:
+        EnclosingCylinder: The enclosing cylinder.
+    """
+    if len(points) == 0:
+        raise ValueError("Cannot compute the extents of an empty point source.")
+    direction = np.asarray(axis, dtype=np.float64)
+    if not np.linalg.norm(direction):
+        raise ValueError("The cylinder axis must not be a zero vector.")
+    direction = direction / np.linalg.norm(direction)
+
+    # Orthonormal basis of the plane normal to the axis.
+    helper = np.eye(3)[np.argmin(np.abs(direction))]
+    u = np.cross(direction, helper)
+    u /= np.linalg.norm(u)
+    v = np.cross(direction, u)
+    frame = np.stack((u, v, direction))
+
+    local = points @ frame.T
+    minimum, maximum = get_min_max(local)
+    center_2d, radius = get_enclosing_circle(np.ascontiguousarray(local[:, :2]))
+    center = center_2d[0] * u + center_2d[1] * v
+    center = center + (minimum[2] + maximum[2]) / 2 * direction
+
+    x, y, z = (float(d) for d in direction)
+    cx, cy, cz = (float(c) for c in center)
+    return EnclosingCylinder(
+        axis=(x, y, z),
+        center=(cx, cy, cz),
+        diameter=2 * radius,
+        length=float(maximum[2] - minimum[2]),
+    )
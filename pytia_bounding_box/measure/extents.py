@@ -0,0 +1,143 @@
+"""
+    Axis-aligned extent reduction for point sources.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable
+from typing import Tuple
+
+import numpy as np
+
+# Number of points that are reduced side by side. Reducing a (n, 3) array along its first axis
+# is slow, since the inner loop only spans three values. Folding the points into rows of this
+# many points keeps the inner loop long and contiguous.
+_LANES = 1024
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class BoundingBox:
+    """Dataclass for the axis-aligned bounds of a point source."""
+
+    minimum: Tuple[float, float, float]
+    maximum: Tuple[float, float, float]
+
+    @property
+    def size(self) -> Tuple[float, float, float]:
+        """Returns the exact edge lengths along the X, Y & Z axis."""
+        x, y, z = (float(hi - lo) for lo, hi in zip(self.minimum, self.maximum))
+        return x, y, z
+
+    def get_size(self, n_digits: int) -> Tuple[float, float, float]:
+        """
+        Returns the edge lengths rounded to the given number of digits. This follows the same
+        precision rule as the `get_bounding_box` function of pytia, so that both results can
+        be compared and passed on to the presets.
+
+        Args:
+            n_digits (int): The number of digits after the decimal point.
+
+        Returns:
+            Tuple[float, float, float]: The rounded edge lengths of the X, Y & Z axis.
+        """
+        x, y, z = self.size
+        return round(x, n_digits), round(y, n_digits), round(z, n_digits)
+
+    def merge(self, other: BoundingBox) -> BoundingBox:
+        """
+        Returns the union of this and another bounding box.
+
+        Args:
+            other (BoundingBox): The bounding box to merge with.
+
+        Returns:
+            BoundingBox: The bounding box enclosing both boxes.
+        """
+        return BoundingBox(
+            minimum=_as_tuple(np.minimum(self.minimum, other.minimum)),
+            maximum=_as_tuple(np.maximum(self.maximum, other.maximum)),
+        )
+
+
+def _as_tuple(values: np.ndarray) -> Tuple[float, float, float]:
+    """Converts a vector of three values to a tuple of python floats."""
+    x, y, z = (float(v) for v in values)
+    return x, y, z
+
+
+def _validate(points: np.ndarray) -> None:
+    """Raises a ValueError if the points array isn't a (n, 3) array."""
+    if points.ndim != 2 or points.shape[1] != 3:
+        raise ValueError(f"Expected an array of shape (n, 3), got {points.shape}.")
+
+
+def get_min_max(points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the minimum and maximum of the given points per axis. The result is exact, it
+    doesn't depend on the order in which the points are reduced.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The minimum and the maximum, each as array of three \
+            values. Infinite values are returned for an empty array.
+    """
+    _validate(points)
+    split = len(points) - len(points) % _LANES
+    lanes = points[:split].reshape(-1, 3 * _LANES)
+    tail = points[split:]
+    minimum = np.vstack((lanes.min(axis=0, initial=np.inf).reshape(-1, 3), tail))
+    maximum = np.vstack((lanes.max(axis=0, initial=-np.inf).reshape(-1, 3), tail))
+    return minimum.min(axis=0, initial=np.inf), maximum.max(axis=0, initial=-np.inf)
+
+
+def get_extents(points: np.ndarray) -> BoundingBox:
+    """
+    Returns the axis-aligned bounding box of the given points.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+
+    Raises:
+        ValueError: Raised when the array is empty or has the wrong shape.
+
+    Returns:
+        BoundingBox: The bounding box of the points.
+    """
+    if len(points) == 0:
+        raise ValueError("Cannot compute the extents of an empty point source.")
+    minimum, maximum = get_min_max(points)
+    return BoundingBox(minimum=_as_tuple(minimum), maximum=_as_tuple(maximum))
+
+
+def reduce_extents(blocks: Iterable[np.ndarray]) -> BoundingBox:
+    """
+    Returns the axis-aligned bounding box of a stream of point blocks. Only the running minimum
+    and maximum are kept, so the blocks can be discarded after they have been reduced.
+
+    Args:
+        blocks (Iterable[np.ndarray]): The point blocks, each as (n, 3) array.
+
+    Raises:
+        ValueError: Raised when the stream doesn't contain any point.
+
+    Returns:
+        BoundingBox: The bounding box of all points of all blocks.
+    """
+    minimum = np.full(3, np.inf)
+    maximum = np.full(3, -np.inf)
+    empty = True
+
+    for block in blocks:
+        if len(block) == 0:
+            continue
+        block_minimum, block_maximum = get_min_max(block)
+        np.minimum(minimum, block_minimum, out=minimum)
+        np.maximum(maximum, block_maximum, out=maximum)
+        empty = False
+
+    if empty:
+        raise ValueError("Cannot compute the extents of an empty point source.")
+    return BoundingBox(minimum=_as_tuple(minimum), maximum=_as_tuple(maximum))
@@ -0,0 +1,625 @@
+"""
+    Convex hull utilities for point sources.
+
+    Orientation dependent queries, like the oriented bounding box, only depend on the convex
+    hull of a point source. The functions of this module reduce a point source to its hull
+    vertices, all distance tests are vectorized. The hull vertices of a saved document are
+    computed once and served from the persistent `hull_cache` afterwards.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import os
+from itertools import combinations
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+from atomic import write_atomic
+from const import HULLS
+
+# Directions of the 26-DOP (axes, face diagonals and body diagonals). The extreme points along
+# these directions span a polytope inside the convex hull, used to discard interior points.
+_DOP_DIRECTIONS = np.array(
+    [
+        [1, 0, 0],
+        [0, 1, 0],
+        [0, 0, 1],
+        [1, 1, 0],
+        [1, -1, 0],
+        [1, 0, 1],
+        [1, 0, -1],
+        [0, 1, 1],
+        [0, 1, -1],
+        [1, 1, 1],
+        [1, 1, -1],
+        [1, -1, 1],
+        [1, -1, -1],
+    ],
+    dtype=np.float64,
+)
+
+MAX_HULL_VERTICES = 2_000  # Bounds the time spent on smooth surfaces.
+EXTREME_DIRECTIONS = 128  # Number of directions of the extreme point core set.
+
+_CHUNK_SIZE = 1 << 16  # Number of points tested against all planes at once.
+_TOLERANCE = 1e-9  # Relative to the magnitude of the coordinates.
+
+
+def get_tolerance(points: np.ndarray) -> float:
+    """Returns the absolute distance tolerance for the given point source."""
+    return _TOLERANCE * max(float(np.abs(points).max()), 1.0)
+
+
+def _get_polytope_planes(
+    vertices: np.ndarray, tolerance: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the facet planes of the convex hull of a small vertex set. All vertex triples are
+    tested at once, a triple spans a facet if all vertices lie on one side of its plane.
+
+    Args:
+        vertices (np.ndarray): The vertices as (m, 3) array, m should not exceed a few dozens.
+        tolerance (float): The absolute distance tolerance.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The outward unit normals as (f, 3) array and the plane \
+            offsets as (f,) array. Empty for degenerated (flat) vertex sets.
+    """
+    triples = np.array(list(combinations(range(len(vertices)), 3)))
+    if len(triples) == 0:
+        return np.empty((0, 3)), np.empty(0)
+
+    a, b, c = (vertices[triples[:, i]] for i in range(3))
+    normals = np.cross(b - a, c - a)
+    lengths = np.linalg.norm(normals, axis=1)
+    valid = lengths > tolerance * tolerance
+    normals = normals[valid] / lengths[valid, None]
+    offsets = np.einsum("ij,ij->i", normals, a[valid])
+
+    distances = vertices @ normals.T - offsets
+    outward = (distances <= tolerance).all(axis=0)
+    inward = (distances >= -tolerance).all(axis=0) & ~outward
+    normals = np.concatenate((normals[outward], -normals[inward]))
+    offsets = np.concatenate((offsets[outward], -offsets[inward]))
+
+    # A flat vertex set has facets on both sides of the same plane, nothing is inside.
+    if len(normals) and (np.abs(normals @ normals.T + 1.0) < 1e-12).any():
+        return np.empty((0, 3)), np.empty(0)
+    return normals, offsets
+
+
+def discard_interior(points: np.ndarray) -> np.ndarray:
+    """
+    Discards points that lie strictly inside the convex hull. The extreme points along the
+    directions of a 26-DOP (aligned to the principal axes) span a polytope, which is always
+    inside the hull. All points strictly inside this polytope cannot be hull vertices.
+
+    This is a cheap pre-reduction, the result is a superset of the hull vertices.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+
+    Returns:
+        np.ndarray: The remaining points as (m, 3) array.
+    """
+    if len(points) < 32:
+        return points
+
+    tolerance = get_tolerance(points)
+    center = points.mean(axis=0)
+    _, axes = np.linalg.eigh(np.cov((points - center).T))
+    directions = _DOP_DIRECTIONS @ axes.T
+    extremes = []
+    for direction in directions:
+        projection = points @ direction
+        extremes.extend((np.argmin(projection), np.argmax(projection)))
+    normals, offsets = _get_polytope_planes(points[np.unique(extremes)], tolerance)
+    if len(normals) == 0:
+        return points
+
+    # The distances are computed plane by plane, so that the reductions run over contiguous
+    # rows instead of the short axis of a (n, f) array.
+    keep = np.empty(len(points), dtype=bool)
+    for start in range(0, len(points), _CHUNK_SIZE):
+        distances = normals @ points[start : start + _CHUNK_SIZE].T
+        distances -= offsets[:, None]
+        keep[start : start + _CHUNK_SIZE] = distances.max(axis=0) >= -tolerance
+    return points[keep]
+
+
+def get_directions(count: int) -> np.ndarray:
+    """
+    Returns unit vectors, which are evenly spread over the upper hemisphere (Fibonacci
+    lattice). Together with their opposites they cover the whole sphere.
+
+    Args:
+        count (int): The number of directions.
+
+    Returns:
+        np.ndarray: The directions as (count, 3) array.
+    """
+    index = np.arange(count) + 0.5
+    z = 1.0 - index / count
+    radius = np.sqrt(1.0 - z * z)
+    angle = np.pi * (1.0 + np.sqrt(5.0)) * index
+    return np.stack((radius * np.cos(angle), radius * np.sin(angle), z), axis=1)
+
+
+def get_extreme_indices(
+    points: np.ndarray, count: int = EXTREME_DIRECTIONS
+) -> np.ndarray:
+    """
+    Returns the indices of the extreme points along evenly spread directions and their
+    opposites, see `get_extreme_points`.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+        count (int, optional): The number of directions. Defaults to EXTREME_DIRECTIONS.
+
+    Returns:
+        np.ndarray: At most 2 * count sorted indices.
+    """
+    if len(points) <= 2 * count:
+        return np.arange(len(points))
+
+    # The projections are computed per chunk as (count, chunk) array, so that the reductions
+    # run over contiguous rows.
+    directions = get_directions(count)
+    transposed = np.ascontiguousarray(points.T)
+    candidates = []
+    for start in range(0, len(points), _CHUNK_SIZE):
+        projection = directions @ transposed[:, start : start + _CHUNK_SIZE]
+        candidates.extend(
+            (projection.argmax(axis=1) + start, projection.argmin(axis=1) + start)
+        )
+    candidates = np.unique(np.concatenate(candidates))
+
+    projection = directions @ transposed[:, candidates]
+    extremes = (projection.argmax(axis=1), projection.argmin(axis=1))
+    return candidates[np.unique(np.concatenate(extremes))]
+
+
+def get_extreme_points(
+    points: np.ndarray, count: int = EXTREME_DIRECTIONS
+) -> np.ndarray:
+    """
+    Returns the extreme points along evenly spread directions and their opposites. This is a
+    small core set of the hull vertices: Its extent along the sampled directions equals the
+    extent of all points, along any other direction it approximates it. The error shrinks
+    with the number of directions, the points are no superset of the hull vertices.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+        count (int, optional): The number of directions. Defaults to EXTREME_DIRECTIONS.
+
+    Returns:
+        np.ndarray: At most 2 * count points as (m, 3) array.
+    """
+    if len(points) <= 2 * count:
+        return points
+    return points[get_extreme_indices(points, count)]
+
+
+def _get_chain(
+    points: np.ndarray, start: np.ndarray, end: np.ndarray, tolerance: float
+) -> List:
+    """
+    Returns the hull vertices of all points strictly right of the directed line from start to
+    end, ordered from start to end (QuickHull). Points within the tolerance of a hull edge are
+    treated as collinear and dropped, so that densely sampled straight edges are collapsed in
+    one step.
+
+    Args:
+        points (np.ndarray): The candidate points as (n, 2) array.
+        start (np.ndarray): The start of the line.
+        end (np.ndarray): The end of the line.
+        tolerance (float): The absolute distance tolerance.
+
+    Returns:
+        List: The ordered hull vertices, without start and end.
+    """
+    chain = []
+    stack: List[Tuple] = [(start, end, points)]
+    while stack:
+        a, b, subset = stack.pop()
+        if subset is None:
+            chain.append(a)
+            continue
+
+        direction = b - a
+        cross = direction[0] * (subset[:, 1] - a[1]) - direction[1] * (
+            subset[:, 0] - a[0]
+        )
+        right = cross < -tolerance * np.hypot(direction[0], direction[1])
+        if not right.any():
+            continue
+
+        subset, cross = subset[right], cross[right]
+        farthest = subset[np.argmin(cross)]
+        stack.append((farthest, b, subset))
+        stack.append((farthest, None, None))
+        stack.append((a, farthest, subset))
+    return chain
+
+
+def discard_interior_2d(points: np.ndarray) -> np.ndarray:
+    """Discards points strictly inside the octagon of the extreme points (Akl-Toussaint)."""
+    if len(points) < 16:
+        return points
+
+    # All tests run on contiguous coordinate arrays, reducing (n, 8) arrays along their short
+    # axis is several times slower.
+    x, y = np.ascontiguousarray(points[:, 0]), np.ascontiguousarray(points[:, 1])
+    diagonal, anti_diagonal = x + y, y - x
+    extremes = [
+        np.argmax(x),
+        np.argmax(diagonal),
+        np.argmax(y),
+        np.argmax(anti_diagonal),
+        np.argmin(x),
+        np.argmin(diagonal),
+        np.argmin(y),
+        np.argmin(anti_diagonal),
+    ]
+    octagon = points[extremes]
+    octagon = octagon[np.any(octagon != np.roll(octagon, 1, axis=0), axis=1)]
+    if len(octagon) < 3:
+        return points
+
+    # Outward normals of the counter-clockwise octagon edges.
+    tolerance = get_tolerance(octagon)
+    edges = np.roll(octagon, -1, axis=0) - octagon
+    normals = np.stack((edges[:, 1], -edges[:, 0]), axis=1)
+    normals /= np.linalg.norm(normals, axis=1)[:, None]
+    offsets = np.einsum("ij,ij->i", normals, octagon) - tolerance
+
+    outside = np.zeros(len(points), dtype=bool)
+    for (nx, ny), offset in zip(normals, offsets):
+        outside |= nx * x + ny * y >= offset
+    return points[outside]
+
+
+def get_hull_2d(points: np.ndarray) -> np.ndarray:
+    """
+    Returns the vertices of the convex hull of a planar point set (QuickHull).
+
+    Args:
+        points (np.ndarray): The points as (n, 2) array.
+
+    Returns:
+        np.ndarray: The hull vertices in counter-clockwise order as (m, 2) array. Collinear \
+            point sets return their two end points.
+    """
+    points = discard_interior_2d(points)
+    left, right = points[np.argmin(points[:, 0])], points[np.argmax(points[:, 0])]
+    if np.array_equal(left, right):
+        return left[None, :]
+
+    tolerance = get_tolerance(points)
+    hull = [left, *_get_chain(points, left, right, tolerance), right]
+    hull.extend(_get_chain(points, right, left, tolerance))
+    return np.array(hull)
+
+
+def _cross(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Returns the row-wise cross product of two (n, 3) arrays, faster than np.cross."""
+    return np.stack(
+        (
+            a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1],
+            a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2],
+            a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0],
+        ),
+        axis=1,
+    )
+
+
+def _get_initial_simplex(points: np.ndarray, tolerance: float) -> Optional[List[int]]:
+    """
+    Returns the indices of four points that span a tetrahedron of maximum extent, or None if
+    the points are flat or collinear.
+    """
+    minimum, maximum = points.argmin(axis=0), points.argmax(axis=0)
+    axis = int(np.argmax(points[maximum, range(3)] - points[minimum, range(3)]))
+    a, b = int(minimum[axis]), int(maximum[axis])
+    direction = points[b] - points[a]
+    if np.linalg.norm(direction) <= tolerance:
+        return None
+
+    line = np.cross(points - points[a], direction / np.linalg.norm(direction))
+    c = int(np.argmax(np.einsum("ij,ij->i", line, line)))
+    normal = np.cross(direction, points[c] - points[a])
+    if np.linalg.norm(normal) <= tolerance * tolerance:
+        return None
+
+    normal /= np.linalg.norm(normal)
+    distances = (points - points[a]) @ normal
+    d = int(np.argmax(np.abs(distances)))
+    if abs(distances[d]) <= tolerance:
+        return None
+    return [a, b, c, d]
+
+
+def _get_quickhull_vertices(
+    points: np.ndarray, tolerance: float, max_vertices: int
+) -> np.ndarray:
+    """
+    Returns the indices of the hull vertices of a point set (QuickHull).
+
+    Each facet keeps the set of points outside of it. The farthest point of a facet is added
+    to the hull, all facets it sees are replaced by a fan of new facets from their horizon to
+    the point. The outside points of the removed facets are distributed to the new facets in
+    one vectorized distance test, points within the tolerance of the hull are dropped. The
+    facet with the farthest outside point is expanded first, so that a stopped construction
+    is as close to the hull as possible.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+        tolerance (float): The absolute distance tolerance.
+        max_vertices (int): The number of points added to the hull, before the construction \
+            is stopped. The extreme points of the remaining outside points (see \
+            `get_extreme_indices`) and along the coordinate axes are returned along with the \
+            vertices in this case.
+
+    Returns:
+        np.ndarray: The indices of the hull vertices. All indices are returned for flat or \
+            collinear point sets.
+    """
+    simplex = _get_initial_simplex(points, tolerance)
+    if simplex is None:
+        return np.arange(len(points))
+
+    facets: Dict[int, Tuple[Tuple[int, int, int], np.ndarray, float, np.ndarray]] = {}
+    edges: Dict[Tuple[int, int], int] = {}
+    pending: List[Tuple[float, int]] = []
+    next_id = 0
+
+    def add_facets(
+        triangles: List[Tuple[int, int, int]], candidates: np.ndarray
+    ) -> None:
+        """Adds facets and distributes the candidate points to their outside sets."""
+        nonlocal next_id
+        corners = points[np.array(triangles)]
+        normals = _cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        normals /= np.linalg.norm(normals, axis=1)[:, None]
+        offsets = np.einsum("ij,ij->i", normals, corners[:, 0])
+
+        owner = np.full(len(candidates), -1)
+        heights = np.zeros(len(candidates))
+        if len(candidates):
+            distances = points[candidates] @ normals.T - offsets
+            owner = np.argmax(distances, axis=1)
+            heights = distances[np.arange(len(candidates)), owner]
+            owner[heights <= tolerance] = -1
+
+        order = np.argsort(owner, kind="stable")
+        bounds = np.searchsorted(owner[order], np.arange(len(triangles) + 1))
+        for k, triangle in enumerate(triangles):
+            outside = candidates[order[bounds[k] : bounds[k + 1]]]
+            facets[next_id] = (triangle, normals[k], float(offsets[k]), outside)
+            for i in range(3):
+                edges[(triangle[i], triangle[(i + 1) % 3])] = next_id
+            if len(outside):
+                distance = float(heights[order[bounds[k] : bounds[k + 1]]].max())
+                heapq.heappush(pending, (-distance, next_id))
+            next_id += 1
+
+    # The facets of the initial simplex are oriented outwards, away from the fourth point.
+    triangles = []
+    for i in range(4):
+        a, b, c = (simplex[j] for j in range(4) if j != i)
+        normal = np.cross(points[b] - points[a], points[c] - points[a])
+        if normal @ (points[simplex[i]] - points[a]) > 0:
+            b, c = c, b
+        triangles.append((a, b, c))
+    candidates = np.ones(len(points), dtype=bool)
+    candidates[simplex] = False
+    add_facets(triangles, np.flatnonzero(candidates))
+
+    added = 0
+    while pending and added < max_vertices:
+        _, facet_id = heapq.heappop(pending)
+        if facet_id not in facets:
+            continue
+        added += 1
+        _, normal, offset, outside = facets[facet_id]
+        eye = int(outside[np.argmax(points[outside] @ normal)])
+        apex = points[eye]
+
+        visible = {facet_id}
+        stack = [facet_id]
+        while stack:
+            triangle = facets[stack.pop()][0]
+            for i in range(3):
+                neighbor = edges[(triangle[(i + 1) % 3], triangle[i])]
+                if neighbor not in visible:
+                    _, n_normal, n_offset, _ = facets[neighbor]
+                    if apex @ n_normal - n_offset > tolerance:
+                        visible.add(neighbor)
+                        stack.append(neighbor)
+
+        horizon = []
+        candidates = []
+        for visible_id in visible:
+            triangle, _, _, outside = facets.pop(visible_id)
+            candidates.append(outside)
+            for i in range(3):
+                edge = (triangle[i], triangle[(i + 1) % 3])
+                del edges[edge]
+                if edges.get((edge[1], edge[0])) not in visible:
+                    horizon.append(edge)
+        # Reverse edges of removed facets have been deleted already, they're not on the horizon.
+        horizon = [e for e in horizon if (e[1], e[0]) in edges]
+
+        remaining = np.concatenate(candidates)
+        add_facets([(u, v, eye) for u, v in horizon], remaining[remaining != eye])
+
+    vertices = np.unique([v for f in facets.values() for v in f[0]])
+    if pending:
+        remaining = np.concatenate([outside for _, _, _, outside in facets.values()])
+        # The extremes along the coordinate axes are added, the axis aligned extents are exact.
+        subset = points[remaining]
+        extremes = (
+            get_extreme_indices(subset),
+            subset.argmin(axis=0),
+            subset.argmax(axis=0),
+        )
+        vertices = np.union1d(vertices, remaining[np.concatenate(extremes)])
+    return vertices
+
+
+def merge_duplicates(points: np.ndarray) -> np.ndarray:
+    """
+    Returns the points without exact duplicates, e.g. the shared vertices of a tessellation.
+    The rows are hashed into one 64 bit key and sorted, which is much faster than sorting the
+    rows themselves. Rows with equal keys are compared, the points are returned unchanged in
+    the unlikely case of a hash collision.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+
+    Returns:
+        np.ndarray: The unique points as (m, 3) array, in no particular order.
+    """
+    bits = np.ascontiguousarray(points, dtype=np.float64).view(np.uint64)
+    with np.errstate(over="ignore"):
+        keys = (
+            bits[:, 0] * np.uint64(0x9E3779B97F4A7C15)
+            ^ bits[:, 1] * np.uint64(0xC2B2AE3D27D4EB4F)
+            ^ bits[:, 2] * np.uint64(0x165667B19E3779F9)
+        )
+    order = np.argsort(keys)
+    keys = keys[order]
+    repeated = np.flatnonzero(keys[1:] == keys[:-1]) + 1
+    if not np.array_equal(points[order[repeated]], points[order[repeated - 1]]):
+        return points
+
+    first = np.ones(len(points), dtype=bool)
+    first[repeated] = False
+    return points[order[first]]
+
+
+def get_hull_points(
+    points: np.ndarray, max_vertices: int = MAX_HULL_VERTICES
+) -> np.ndarray:
+    """
+    Returns the vertices of the convex hull of the given points. Interior points are discarded
+    in a cheap pre-reduction, duplicated vertices (e.g. of a tessellation) are merged.
+
+    Points within the distance tolerance of the hull are treated as part of a hull facet, they
+    are dropped. Flat and collinear point sets are returned without the hull reduction.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+        max_vertices (int, optional): The number of points added to the hull before the \
+            construction is stopped. Smooth surfaces, which consist of hull vertices only, \
+            are reduced to the vertices of an inner hull and the extreme points of the \
+            remaining points in this case. Their hull is an approximation: The extents along \
+            the sampled directions and the coordinate axes are exact, the remaining points are closer to the inner \
+            hull than the points that have been added last. Defaults to MAX_HULL_VERTICES.
+
+    Returns:
+        np.ndarray: The hull vertices as (m, 3) array, at most about max_vertices plus \
+            2 * EXTREME_DIRECTIONS + 6 points.
+    """
+    candidates = merge_duplicates(discard_interior(points))
+    if len(candidates) <= 4:
+        return candidates
+    tolerance = get_tolerance(candidates)
+    return candidates[_get_quickhull_vertices(candidates, tolerance, max_vertices)]
+
+
+class HullCache:
+    """
+    Persistent cache of the hull vertices per document. The hull of each document is stored as
+    its own file in the cache folder. An entry is valid as long as the document file hasn't
+    changed: The size and the modification time of the file must match, the part doesn't have
+    to be exported again.
+    """
+
+    def __init__(self, folder: Path | str, maxsize: int = 64) -> None:
+        """
+        Inits the HullCache class.
+
+        Args:
+            folder (Path | str): The cache folder. Created on the first write.
+            maxsize (int, optional): The number of documents to keep. Defaults to 64.
+        """
+        self.folder = Path(folder)
+        self.maxsize = maxsize
+
+    @staticmethod
+    def get_key(document: Path | str) -> str:
+        """Returns the cache key of a document: Its normalized path."""
+        return os.path.normcase(os.path.abspath(document))
+
+    @staticmethod
+    def _get_state(document: Path | str) -> Tuple[int, int]:
+        """Returns the size and the modification time (ns) of the document file."""
+        stat = os.stat(document)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _get_path(self, document: Path | str) -> Path:
+        """Returns the path of the cache file of a document."""
+        key = self.get_key(document).encode("utf8")
+        return Path(
+            self.folder, f"{hashlib.blake2b(key, digest_size=16).hexdigest()}.npz"
+        )
+
+    def get(self, document: Path | str) -> Optional[np.ndarray]:
+        """
+        Returns the cached hull vertices of a document.
+
+        Args:
+            document (Path | str): The path of the document.
+
+        Returns:
+            Optional[np.ndarray]: The hull vertices as (m, 3) array, None if the document \
+                isn't cached or has changed since.
+        """
+        try:
+            state = self._get_state(document)
+            with np.load(self._get_path(document)) as data:
+                if tuple(data["state"]) != state:
+                    return None
+                return data["hull"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, document: Path | str, hull: np.ndarray) -> None:
+        """
+        Stores the hull vertices of a document. The file is replaced atomically, the oldest
+        files are removed if there are more than maxsize. The cache is an optimization only,
+        write errors are ignored.
+
+        Args:
+            document (Path | str): The path of the document.
+            hull (np.ndarray): The hull vertices as (m, 3) array.
+        """
+        try:
+            state = np.array(self._get_state(document), dtype=np.int64)
+            write_atomic(
+                self._get_path(document),
+                lambda f: np.savez(f, state=state, hull=hull),
+                binary=True,
+            )
+            files = sorted(
+                self.folder.glob("*.npz"), key=lambda p: p.stat().st_mtime_ns
+            )
+            for path in files[: -self.maxsize]:
+                path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Removes all documents from the cache."""
+        for path in self.folder.glob("*.npz"):
+            path.unlink(missing_ok=True)
+
+
+hull_cache = HullCache(HULLS)
@@ -0,0 +1,293 @@
+"""
+    Oriented (approximately minimum-volume) bounding box for point sources.
+
+    The search starts from the axis-aligned frame and from the principal axes of the points.
+    Each frame is refined by fixing one box axis at a time and solving the remaining planar
+    problem exactly: The minimum-area rectangle of the projected points has one side flush
+    with an edge of their convex hull (rotating calipers), all edge directions are evaluated
+    at once. The refinement stops when the volume doesn't shrink anymore. This alternating
+    search is a heuristic, it finds a local minimum and doesn't guarantee the global one.
+
+    The search runs on a small core set: The extreme points of a strided sample along evenly
+    spread directions. The extreme points of all points along the axes of the found frame are
+    added to the core set and the search continues from the found frame, until the core set
+    holds them or the box of all points doesn't shrink anymore. Since the edges of the core
+    set only approximate the angles of smooth surfaces, the frame is finally polished on the
+    sample by a grid search of the angles close to it. The found frame, the polished frame
+    and the axis-aligned frame are measured on all points in one batched pass (see
+    `measure.transform.get_extents_batch`), the box encloses every point.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import permutations
+from typing import Callable
+from typing import List
+from typing import Tuple
+
+import numpy as np
+from measure.extents import get_min_max
+from measure.hull import get_extreme_points
+from measure.hull import get_hull_2d
+from measure.hull import get_tolerance
+from measure.transform import get_extents_batch
+
+MAX_ITERATIONS = 8  # Refinement rounds per seed frame.
+CORE_SIZE = 20_000  # Number of sampled points the core set is taken from.
+
+_ANGLE_BATCH = 512  # Number of edge directions evaluated at once.
+_POLISH_SPAN = 0.2  # Angle in radians the polish searches around the found frame.
+_POLISH_ANGLES = 16  # Number of angles evaluated per zoom level of the polish.
+_POLISH_LEVELS = 4  # Number of zoom levels of the polish.
+_IMPROVEMENT = 1e-9  # Relative volume decrease that counts as improvement.
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class OrientedBox:
+    """
+    Dataclass for the oriented bounding box of a point source.
+
+    The box axes are assigned to the part axes they are closest to, so that the edge lengths
+    can be used like the axis-aligned X, Y & Z extents.
+    """
+
+    center: Tuple[float, float, float]
+    rotation: Tuple[
+        Tuple[float, float, float], ...
+    ]  # Rows: Box axes assigned to X, Y & Z.
+    size: Tuple[float, float, float]
+
+    @property
+    def volume(self) -> float:
+        """Returns the volume of the box."""
+        return self.size[0] * self.size[1] * self.size[2]
+
+    def get_size(self, n_digits: int) -> Tuple[float, float, float]:
+        """
+        Returns the edge lengths rounded to the given number of digits. The result can be
+        passed to the presets like the result of the `get_bounding_box` function of pytia.
+
+        Args:
+            n_digits (int): The number of digits after the decimal point.
+
+        Returns:
+            Tuple[float, float, float]: The rounded edge lengths of the X, Y & Z box axis.
+        """
+        x, y, z = self.size
+        return round(x, n_digits), round(y, n_digits), round(z, n_digits)
+
+
+def _get_volume(points: np.ndarray, frame: np.ndarray) -> float:
+    """Returns the volume of the box of the points in the given frame (rows are axes)."""
+    minimum, maximum = get_min_max(points @ frame.T)
+    return float(np.prod(maximum - minimum))
+
+
+def get_min_area_angle(points: np.ndarray) -> float:
+    """
+    Returns the rotation angle of the minimum-area rectangle enclosing planar points.
+
+    Args:
+        points (np.ndarray): The points as (n, 2) array.
+
+    Returns:
+        float: The angle in radians within [0, pi/2), by which the first axis of the \
+            rectangle is rotated counter-clockwise against the first coordinate axis.
+    """
+    hull = get_hull_2d(points)
+    if len(hull) < 2:
+        return 0.0
+
+    edges = np.roll(hull, -1, axis=0) - hull
+    angles = np.unique(np.mod(np.arctan2(edges[:, 1], edges[:, 0]), np.pi / 2))
+
+    best_angle, best_area = 0.0, np.inf
+    for start in range(0, len(angles), _ANGLE_BATCH):
+        batch = angles[start : start + _ANGLE_BATCH]
+        cos, sin = np.cos(batch), np.sin(batch)
+        u = hull @ np.stack((cos, sin))
+        v = hull @ np.stack((-sin, cos))
+        areas = np.ptp(u, axis=0) * np.ptp(v, axis=0)
+        index = int(np.argmin(areas))
+        if areas[index] < best_area:
+            best_angle, best_area = float(batch[index]), float(areas[index])
+    return best_angle
+
+
+def get_nearby_min_area_angle(points: np.ndarray) -> float:
+    """
+    Returns the rotation angle of the smallest rectangle enclosing planar points, searched
+    close to the coordinate axes: A grid of angles is evaluated at once and narrowed around
+    the best angle on each zoom level. Unlike `get_min_area_angle`, the angle isn't limited to
+    the edge directions of a hull, which resolves the angle on smooth surfaces.
+
+    Args:
+        points (np.ndarray): The points as (n, 2) array.
+
+    Returns:
+        float: The angle in radians within [-_POLISH_SPAN, _POLISH_SPAN].
+    """
+    x, y = np.ascontiguousarray(points[:, 0]), np.ascontiguousarray(points[:, 1])
+    best_angle, best_area = 0.0, float(np.ptp(x) * np.ptp(y))
+    span = _POLISH_SPAN
+    for _ in range(_POLISH_LEVELS):
+        angles = best_angle + np.linspace(-span, span, _POLISH_ANGLES)
+        cos, sin = np.cos(angles)[:, None], np.sin(angles)[:, None]
+        areas = np.ptp(cos * x + sin * y, axis=1) * np.ptp(cos * y - sin * x, axis=1)
+        index = int(np.argmin(areas))
+        if areas[index] < best_area:
+            best_angle, best_area = float(angles[index]), float(areas[index])
+        span *= 2 / (_POLISH_ANGLES - 1)
+    return best_angle
+
+
+def _refine(
+    points: np.ndarray,
+    frame: np.ndarray,
+    get_angle: Callable[[np.ndarray], float] = get_min_area_angle,
+) -> Tuple[np.ndarray, float]:
+    """
+    Refines a frame by solving the planar minimum-area problem for one fixed axis at a time.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+        frame (np.ndarray): The orthonormal seed frame as (3, 3) array, rows are the axes.
+        get_angle (Callable[[np.ndarray], float], optional): Returns the rotation angle of \
+            the smallest rectangle of the projected points. Defaults to get_min_area_angle.
+
+    Returns:
+        Tuple[np.ndarray, float]: The refined frame and the volume of its box.
+    """
+    volume = _get_volume(points, frame)
+    for _ in range(MAX_ITERATIONS):
+        improved = False
+        for fixed in range(3):
+            i, j = (k for k in range(3) if k != fixed)
+            angle = get_angle(points @ frame[[i, j]].T)
+            cos, sin = np.cos(angle), np.sin(angle)
+            candidate = frame.copy()
+            candidate[i] = cos * frame[i] + sin * frame[j]
+            candidate[j] = -sin * frame[i] + cos * frame[j]
+
+            candidate_volume = _get_volume(points, candidate)
+            if candidate_volume < volume * (1 - _IMPROVEMENT):
+                frame, volume = candidate, candidate_volume
+                improved = True
+        if not improved:
+            break
+    return frame, volume
+
+
+def _align_to_part_axes(frame: np.ndarray) -> np.ndarray:
+    """
+    Reorders and flips the axes of the frame, so that each box axis points along the part
+    axis it is closest to.
+
+    Args:
+        frame (np.ndarray): The orthonormal frame as (3, 3) array, rows are the axes.
+
+    Returns:
+        np.ndarray: The aligned frame, its rows correspond to the X, Y & Z axis.
+    """
+    alignment = np.abs(frame)
+    order = max(
+        permutations(range(3)),
+        key=lambda p: sum(alignment[p[axis], axis] for axis in range(3)),
+    )
+    aligned = frame[list(order)]
+    return aligned * np.where(np.diag(aligned) < 0, -1.0, 1.0)[:, None]
+
+
+def _search(points: np.ndarray, seeds: List[np.ndarray]) -> Tuple[np.ndarray, float]:
+    """Returns the refined frame with the smallest volume, earlier seeds win ties."""
+    frame, volume = _refine(points, seeds[0])
+    for seed in seeds[1:]:
+        candidate, candidate_volume = _refine(points, seed)
+        if candidate_volume < volume * (1 - _IMPROVEMENT):
+            frame, volume = candidate, candidate_volume
+    return frame, volume
+
+
+def _get_outside(points: np.ndarray, core: np.ndarray, frame: np.ndarray) -> np.ndarray:
+    """
+    Returns the extreme points along the axes of the frame, which are outside of the box of
+    the core in the frame.
+    """
+    minimum, maximum = get_min_max(core @ frame.T)
+    tolerance = get_tolerance(core)
+    outside = []
+    for axis in range(3):
+        projection = points @ frame[axis]
+        low, high = int(np.argmin(projection)), int(np.argmax(projection))
+        if projection[low] < minimum[axis] - tolerance:
+            outside.append(low)
+        if projection[high] > maximum[axis] + tolerance:
+            outside.append(high)
+    return points[outside]
+
+
+def get_oriented_box(points: np.ndarray) -> OrientedBox:
+    """
+    Returns an oriented bounding box of the given points, which approximates the box with the
+    minimum volume (see the module docs). The box encloses all points, its volume is never
+    larger than the volume of the axis-aligned box, an axis-aligned part keeps its
+    axis-aligned box.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+
+    Raises:
+        ValueError: Raised when the array is empty or has the wrong shape.
+
+    Returns:
+        OrientedBox: The oriented bounding box.
+    """
+    if points.ndim != 2 or points.shape[1] != 3:
+        raise ValueError(f"Expected an array of shape (n, 3), got {points.shape}.")
+    if len(points) == 0:
+        raise ValueError("Cannot compute the extents of an empty point source.")
+
+    centroid = points.mean(axis=0)
+    centered = points - centroid
+    sample = centered[:: max(1, len(centered) // CORE_SIZE)]
+    core = get_extreme_points(sample)
+
+    seeds = [np.eye(3)]
+    if len(sample) > 1:
+        _, axes = np.linalg.eigh(np.cov(sample.T))
+        seeds.append(axes.T)
+    frame, _ = _search(core, seeds)
+    volume = _get_volume(centered, frame)
+    for _ in range(MAX_ITERATIONS):
+        outside = _get_outside(centered, core, frame)
+        if len(outside) == 0:
+            break
+        core = np.concatenate((core, outside))
+        candidate, _ = _search(core, [frame])
+        candidate_volume = _get_volume(centered, candidate)
+        if candidate_volume >= volume * (1 - _IMPROVEMENT):
+            break
+        frame, volume = candidate, candidate_volume
+
+    # The edges of the small core set only approximate the angles of smooth surfaces.
+    polished, _ = _refine(sample, frame, get_nearby_min_area_angle)
+
+    # The core set may miss points that enlarge the box beyond the axis-aligned box. All
+    # candidates are measured on all points in one pass, earlier candidates win ties.
+    candidates = [_align_to_part_axes(f) for f in (np.eye(3), frame, polished)]
+    boxes = get_extents_batch(centered, np.stack(candidates))
+    best = 0
+    for index, box in enumerate(boxes[1:], start=1):
+        if np.prod(box.size) < np.prod(boxes[best].size) * (1 - _IMPROVEMENT):
+            best = index
+
+    frame = candidates[best]
+    minimum, maximum = np.array(boxes[best].minimum), np.array(boxes[best].maximum)
+    center = centroid + (minimum + maximum) / 2 @ frame
+    x, y, z = boxes[best].size
+    return OrientedBox(
+        center=(float(center[0]), float(center[1]), float(center[2])),
+        rotation=tuple((float(row[0]), float(row[1]), float(row[2])) for row in frame),
+        size=(x, y, z),
+    )
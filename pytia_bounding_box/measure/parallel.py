@@ -0,0 +1,177 @@
+"""
+    Parallel extent reduction for large point sources.
+
+    The points are placed in shared memory and split into chunks. Each chunk is reduced to its
+    minimum and maximum by a pool of worker processes, the partial results are combined
+    afterwards. Since minimum and maximum are exact operations, the result is bit-identical to
+    the single-process reduction of `measure.extents.get_extents`.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+from measure.extents import BoundingBox
+from measure.extents import get_extents
+from measure.extents import get_min_max
+from measure.extents import reduce_extents
+
+CHUNK_SIZE = 4_000_000  # Number of points per chunk.
+
+_worker_memory: Optional[SharedMemory] = None
+_worker_points: Optional[np.ndarray] = None
+
+
+def _attach(name: str, shape: Tuple[int, int], dtype: str) -> None:
+    """Worker initializer: Attaches the worker process to the shared point buffer."""
+    global _worker_memory, _worker_points  # pylint: disable=W0603
+    _worker_memory = SharedMemory(name=name)
+    _worker_points = np.ndarray(shape, dtype=dtype, buffer=_worker_memory.buf)
+
+
+def _reduce_chunk(bounds: Tuple[int, int]) -> np.ndarray:
+    """Worker task: Returns the minimum and maximum of a chunk as (2, 3) array."""
+    assert _worker_points is not None
+    return np.stack(get_min_max(_worker_points[bounds[0] : bounds[1]]))
+
+
+def get_worker_count(workers: int = 0) -> int:
+    """
+    Returns the number of worker processes to use.
+
+    Args:
+        workers (int, optional): The requested number of workers. Zero or less uses all \
+            available cores. Defaults to 0.
+
+    Returns:
+        int: The number of workers.
+    """
+    return workers if workers > 0 else os.cpu_count() or 1
+
+
+class SharedPoints:
+    """
+    Point buffer in shared memory. Readers write into the `points` array directly (see
+    `measure.readers.read_shared_points`), so the points don't have to be copied before they
+    are reduced in parallel.
+
+    Use this class as context manager, the shared memory is released on exit.
+    """
+
+    def __init__(self, count: int) -> None:
+        """
+        Inits the SharedPoints class.
+
+        Args:
+            count (int): The number of points the buffer holds.
+        """
+        self._capacity = count
+        self._memory = SharedMemory(create=True, size=max(1, count * 3 * 8))
+        self.points = np.ndarray((count, 3), dtype=np.float64, buffer=self._memory.buf)
+
+    def __enter__(self) -> SharedPoints:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @classmethod
+    def from_array(cls, points: np.ndarray) -> SharedPoints:
+        """
+        Returns a shared buffer holding a copy of the given points.
+
+        Args:
+            points (np.ndarray): The points as (n, 3) array.
+
+        Returns:
+            SharedPoints: The shared point buffer.
+        """
+        shared = cls(len(points))
+        shared.points[:] = points
+        return shared
+
+    def resize(self, count: int) -> None:
+        """
+        Resizes the `points` array, the leading points are kept. The array is narrowed within
+        the shared memory, only a count beyond the allocated memory moves the points to a new,
+        larger block of shared memory.
+
+        Args:
+            count (int): The new number of points.
+        """
+        if count <= self._capacity:
+            self.points = np.ndarray(
+                (count, 3), dtype=np.float64, buffer=self._memory.buf
+            )
+            return
+
+        grown = SharedPoints(count)
+        grown.points[: len(self.points)] = self.points
+        self.close()
+        self._capacity, self._memory, self.points = count, grown._memory, grown.points
+
+    def close(self) -> None:
+        """Releases the shared memory."""
+        del self.points
+        self._memory.close()
+        self._memory.unlink()
+
+    def get_extents(
+        self, workers: int = 0, chunk_size: int = CHUNK_SIZE
+    ) -> BoundingBox:
+        """
+        Returns the axis-aligned bounding box of the buffer, reduced by a pool of workers.
+
+        Args:
+            workers (int, optional): The number of worker processes. Zero or less uses all \
+                available cores. Defaults to 0.
+            chunk_size (int, optional): The number of points per chunk. Defaults to CHUNK_SIZE.
+
+        Returns:
+            BoundingBox: The bounding box of the points.
+        """
+        count = len(self.points)
+        workers = get_worker_count(workers)
+        if workers == 1 or count <= chunk_size:
+            return get_extents(self.points)
+
+        chunks = [
+            (start, min(start + chunk_size, count))
+            for start in range(0, count, chunk_size)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            initializer=_attach,
+            initargs=(self._memory.name, self.points.shape, self.points.dtype.str),
+        ) as executor:
+            partials: List[np.ndarray] = list(executor.map(_reduce_chunk, chunks))
+        return reduce_extents(partials)
+
+
+def get_extents_parallel(
+    points: np.ndarray, workers: int = 0, chunk_size: int = CHUNK_SIZE
+) -> BoundingBox:
+    """
+    Returns the axis-aligned bounding box of the given points, reduced by a pool of workers.
+    Small point sources, which fit into one chunk, are reduced in this process.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+        workers (int, optional): The number of worker processes. Zero or less uses all \
+            available cores. Defaults to 0.
+        chunk_size (int, optional): The number of points per chunk. Defaults to CHUNK_SIZE.
+
+    Returns:
+        BoundingBox: The bounding box of the points.
+    """
+    if get_worker_count(workers) == 1 or len(points) <= chunk_size:
+        return get_extents(points)
+
+    with SharedPoints.from_array(points) as shared:
+        return shared.get_extents(workers=workers, chunk_size=chunk_size)
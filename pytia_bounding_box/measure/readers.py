@@ -0,0 +1,442 @@
+"""
+    Streaming readers for mesh files (STL, OBJ & PLY).
+
+    Text files are read in large blocks. The vertex records of each block are located with
+    vectorized byte operations and parsed in one call into a float array, no python object
+    is created per vertex.
+"""
+
+import os
+from pathlib import Path
+from typing import BinaryIO
+from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+import numpy as np
+from measure.extents import BoundingBox
+from measure.extents import reduce_extents
+from measure.parallel import CHUNK_SIZE
+from measure.parallel import SharedPoints
+from measure.parallel import get_worker_count
+
+READ_BLOCK_SIZE = 1 << 24  # 16 MiB
+
+# Rough number of bytes per vertex in text files, used to preallocate the point array.
+_STL_BYTES_PER_VERTEX = 64
+_OBJ_BYTES_PER_VERTEX = 24
+
+_WHITESPACE = np.zeros(256, dtype=bool)
+_WHITESPACE[[9, 10, 11, 12, 13, 32]] = True
+_NEWLINE = 10
+_CARRIAGE_RETURN = 13
+_SPACE = 32
+_TAB = 9
+
+_STL_BINARY_HEADER = 80
+_STL_BINARY_FACET = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")]
+)
+
+_PLY_COORDINATES = ("x", "y", "z")
+
+
+def _iter_text_blocks(f: BinaryIO, block_size: int) -> Iterator[bytes]:
+    """
+    Yields blocks of the file that always end with a complete line.
+
+    Args:
+        f (BinaryIO): The file object, opened in binary mode.
+        block_size (int): The number of bytes to read at once.
+
+    Yields:
+        Iterator[bytes]: The blocks of the file, each ending with a newline.
+    """
+    remainder = b""
+    while chunk := f.read(block_size):
+        chunk = remainder + chunk
+        cut = chunk.rfind(b"\n") + 1
+        remainder = chunk[cut:]
+        if cut:
+            yield chunk[:cut]
+    if remainder:
+        yield remainder + b"\n"
+
+
+def _parse_values(buffer: np.ndarray, keep: np.ndarray, expected: int) -> np.ndarray:
+    """
+    Parses all numbers from the kept bytes of the buffer. All other bytes are replaced with
+    spaces, the whole text is parsed in one call.
+
+    Args:
+        buffer (np.ndarray): The bytes of the block as uint8 array.
+        keep (np.ndarray): The mask of bytes to keep.
+        expected (int): The minimum amount of numbers that must be parsed.
+
+    Raises:
+        ValueError: Raised when the text cannot be parsed.
+
+    Returns:
+        np.ndarray: The parsed numbers as flat float array.
+    """
+    text = np.where(keep & (buffer != _CARRIAGE_RETURN), buffer, _SPACE)
+    try:
+        values = np.fromstring(text.astype(np.uint8).tobytes(), sep=" ")
+    except ValueError as e:
+        raise ValueError(f"Cannot parse vertex records: {e}") from e
+    if values.size < expected:
+        raise ValueError("Cannot parse vertex records: Found non-numeric values.")
+    return values
+
+
+def _parse_keyword_records(block: bytes, keyword: bytes) -> np.ndarray:
+    """
+    Parses all records of a text block, whose first token is the given keyword.
+    E.g. 'vertex 1.0 2.0 3.0' for the keyword 'vertex'.
+
+    Only the first three values of a record are returned. Additional values, like the weight
+    or the vertex color of an OBJ file, are dropped.
+
+    Args:
+        block (bytes): The text block, must end with a newline.
+        keyword (bytes): The keyword of the record.
+
+    Raises:
+        ValueError: Raised when the records cannot be parsed.
+
+    Returns:
+        np.ndarray: The vertices as (n, 3) array.
+    """
+    buffer = np.frombuffer(block, dtype=np.uint8)
+    line_ends = np.flatnonzero(buffer == _NEWLINE)
+    line_starts = np.concatenate(([0], line_ends[:-1] + 1))
+
+    # Position of the first token of each line. Indented lines are advanced until their first
+    # token, which only touches the indentation and not the whole buffer. Blank lines stop at
+    # their newline and are dropped by the length check below.
+    first, ends = line_starts, line_ends
+    indented = np.flatnonzero(_WHITESPACE[buffer[first]] & (first < ends))
+    while len(indented):
+        first[indented] += 1
+        indented = indented[
+            _WHITESPACE[buffer[first[indented]]] & (first[indented] < ends[indented])
+        ]
+
+    # The keyword must be followed by a space or a tab. Each line ends with a newline,
+    # therefore the index is always within the buffer.
+    length = len(keyword)
+    valid = first + length < ends
+    first, ends = first[valid], ends[valid]
+    match = np.isin(buffer[first + length], (_SPACE, _TAB))
+    for i, char in enumerate(keyword):
+        match &= buffer[first + i] == char
+    starts, ends = first[match] + length, ends[match]
+
+    count = len(starts)
+    if count == 0:
+        return np.empty((0, 3))
+
+    delta = np.zeros(len(buffer) + 1, dtype=np.int8)
+    delta[starts] = 1
+    delta[ends] = -1
+    keep = np.cumsum(delta[:-1], dtype=np.int8) > 0
+    values = _parse_values(buffer, keep, 3 * count)
+
+    # The number of values of each record: Records may have different widths, e.g. OBJ
+    # vertices with and without color. A token starts at each kept non-whitespace byte,
+    # which doesn't follow another one.
+    token = keep & ~_WHITESPACE[buffer]
+    token[1:] &= ~token[:-1]
+    tokens = np.concatenate(([0], np.cumsum(token)))
+    widths = tokens[ends] - tokens[starts]
+    if values.size != tokens[-1] or np.any(widths < 3):
+        raise ValueError(
+            f"Cannot parse {keyword.decode()!r} records: Inconsistent number of values."
+        )
+    offsets = np.concatenate(([0], np.cumsum(widths[:-1])))
+    return values[offsets[:, None] + np.arange(3)]
+
+
+def _is_binary_stl(f: BinaryIO, size: int) -> bool:
+    """Returns True if the file matches the size of a binary STL file."""
+    if size < _STL_BINARY_HEADER + 4:
+        return False
+    f.seek(_STL_BINARY_HEADER)
+    count = int(np.frombuffer(f.read(4), dtype="<u4")[0])
+    f.seek(0)
+    return size == _STL_BINARY_HEADER + 4 + count * _STL_BINARY_FACET.itemsize
+
+
+def _iter_binary_stl(f: BinaryIO, block_size: int) -> Iterator[np.ndarray]:
+    """Yields the vertices of a binary STL file in blocks."""
+    f.seek(_STL_BINARY_HEADER)
+    remaining = int(np.frombuffer(f.read(4), dtype="<u4")[0])
+    facets_per_block = max(1, block_size // _STL_BINARY_FACET.itemsize)
+    while remaining > 0:
+        facets = np.fromfile(f, dtype=_STL_BINARY_FACET, count=facets_per_block)
+        if len(facets) == 0:
+            raise ValueError("Cannot read STL file: Unexpected end of file.")
+        remaining -= len(facets)
+        yield facets["vertices"].reshape(-1, 3).astype(np.float64)
+
+
+def _read_ply_header(f: BinaryIO) -> Tuple[int, int, int, List[int]]:
+    """
+    Reads the header of an ASCII PLY file.
+
+    Args:
+        f (BinaryIO): The file object, opened in binary mode.
+
+    Raises:
+        ValueError: Raised when the file isn't an ASCII PLY file, or when the vertex element
+            cannot be read.
+
+    Returns:
+        Tuple[int, int, int, List[int]]: The number of lines to skip before the vertex
+            element, the number of vertices, the number of properties per vertex and the
+            column indices of the x, y & z coordinates.
+    """
+    if f.readline().strip() != b"ply":
+        raise ValueError("Cannot read PLY file: Missing magic number.")
+
+    elements: List[Tuple[str, int, List[str]]] = []
+    while line := f.readline():
+        tokens = line.decode("ascii", errors="replace").split()
+        if not tokens or tokens[0] in ("comment", "obj_info"):
+            continue
+        match tokens[0]:
+            case "format":
+                if tokens[1] != "ascii":
+                    raise ValueError(f"Cannot read PLY file: Format {tokens[1]!r}.")
+            case "element":
+                elements.append((tokens[1], int(tokens[2]), []))
+            case "property":
+                if tokens[1] == "list":
+                    elements[-1][2].append("list")
+                else:
+                    elements[-1][2].append(tokens[2])
+            case "end_header":
+                break
+    else:
+        raise ValueError("Cannot read PLY file: Missing end of header.")
+
+    skip = 0
+    for name, count, properties in elements:
+        if name == "vertex":
+            if "list" in properties or not all(
+                c in properties for c in _PLY_COORDINATES
+            ):
+                raise ValueError("Cannot read PLY file: Unsupported vertex element.")
+            columns = [properties.index(c) for c in _PLY_COORDINATES]
+            return skip, count, len(properties), columns
+        skip += count
+    raise ValueError("Cannot read PLY file: Missing vertex element.")
+
+
+def _iter_ascii_ply(f: BinaryIO, block_size: int) -> Iterator[np.ndarray]:
+    """Yields the vertices of an ASCII PLY file in blocks."""
+    skip, remaining, width, columns = _read_ply_header(f)
+    for block in _iter_text_blocks(f, block_size):
+        if remaining <= 0:
+            break
+        line_ends = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == _NEWLINE)
+        if skip >= len(line_ends):
+            skip -= len(line_ends)
+            continue
+
+        first = skip
+        last = min(len(line_ends), skip + remaining)
+        start = line_ends[first - 1] + 1 if first > 0 else 0
+        buffer = np.frombuffer(block[start : line_ends[last - 1] + 1], dtype=np.uint8)
+        count = last - first
+        values = _parse_values(buffer, np.ones(len(buffer), dtype=bool), count * width)
+        if values.size != count * width:
+            raise ValueError("Cannot read PLY file: Inconsistent number of values.")
+
+        skip = 0
+        remaining -= count
+        yield values.reshape(count, width)[:, columns]
+
+    if remaining > 0:
+        raise ValueError("Cannot read PLY file: Unexpected end of file.")
+
+
+def iter_point_blocks(
+    path: Path | str, block_size: int = READ_BLOCK_SIZE
+) -> Iterator[np.ndarray]:
+    """
+    Yields the vertices of a mesh file in blocks. Supported are ASCII & binary STL files, OBJ
+    files and ASCII PLY files. The format is taken from the file suffix.
+
+    Args:
+        path (Path | str): The path of the mesh file.
+        block_size (int, optional): The number of bytes to read at once. Defaults to \
+            READ_BLOCK_SIZE.
+
+    Raises:
+        ValueError: Raised when the file format isn't supported or the file cannot be parsed.
+
+    Yields:
+        Iterator[np.ndarray]: The vertices as (n, 3) float arrays.
+    """
+    suffix = Path(path).suffix.lower()
+    with open(path, "rb") as f:
+        match suffix:
+            case ".stl":
+                if _is_binary_stl(f, os.fstat(f.fileno()).st_size):
+                    yield from _iter_binary_stl(f, block_size)
+                else:
+                    for block in _iter_text_blocks(f, block_size):
+                        yield _parse_keyword_records(block, b"vertex")
+            case ".obj":
+                for block in _iter_text_blocks(f, block_size):
+                    yield _parse_keyword_records(block, b"v")
+            case ".ply":
+                yield from _iter_ascii_ply(f, block_size)
+            case _:
+                raise ValueError(
+                    f"Cannot read mesh file: Unsupported format {suffix!r}."
+                )
+
+
+def _estimate_vertex_count(path: Path | str) -> int:
+    """
+    Returns the number of vertices of a mesh file, used for preallocation. The count is exact
+    for binary STL and PLY files, whose header holds it, and estimated from the file size
+    otherwise.
+    """
+    size = os.path.getsize(path)
+    match Path(path).suffix.lower():
+        case ".stl":
+            with open(path, "rb") as f:
+                if _is_binary_stl(f, size):
+                    return (
+                        3
+                        * (size - _STL_BINARY_HEADER - 4)
+                        // _STL_BINARY_FACET.itemsize
+                    )
+            return size // _STL_BYTES_PER_VERTEX + 1
+        case ".ply":
+            with open(path, "rb") as f:
+                try:
+                    return _read_ply_header(f)[1]
+                except (ValueError, IndexError):
+                    return size // _OBJ_BYTES_PER_VERTEX + 1
+        case _:
+            return size // _OBJ_BYTES_PER_VERTEX + 1
+
+
+def _fill_points(
+    path: Path | str,
+    block_size: int,
+    points: np.ndarray,
+    grow: Callable[[np.ndarray, int, int], np.ndarray],
+) -> Tuple[np.ndarray, int]:
+    """
+    Reads all vertices of a mesh file block by block into the given array.
+
+    Args:
+        path (Path | str): The path of the mesh file.
+        block_size (int): The number of bytes to read at once.
+        points (np.ndarray): The preallocated (n, 3) array.
+        grow (Callable[[np.ndarray, int, int], np.ndarray]): Called with the full array, the \
+            required length and the number of points read so far. Returns the grown array, \
+            which holds the points read so far.
+
+    Returns:
+        Tuple[np.ndarray, int]: The array and the number of points read.
+    """
+    count = 0
+    for block in iter_point_blocks(path, block_size):
+        if count + len(block) > len(points):
+            points = grow(points, max(2 * len(points), count + len(block)), count)
+        points[count : count + len(block)] = block
+        count += len(block)
+    return points, count
+
+
+def read_points(path: Path | str, block_size: int = READ_BLOCK_SIZE) -> np.ndarray:
+    """
+    Reads all vertices of a mesh file into one preallocated array.
+    See `iter_point_blocks` for the supported formats.
+
+    Args:
+        path (Path | str): The path of the mesh file.
+        block_size (int, optional): The number of bytes to read at once. Defaults to \
+            READ_BLOCK_SIZE.
+
+    Returns:
+        np.ndarray: The vertices as (n, 3) float array.
+    """
+
+    def grow(points: np.ndarray, size: int, count: int) -> np.ndarray:
+        grown = np.empty((size, 3))
+        grown[:count] = points[:count]
+        return grown
+
+    points = np.empty((_estimate_vertex_count(path), 3))
+    points, count = _fill_points(path, block_size, points, grow)
+
+    # Don't keep a heavily oversized buffer alive.
+    return points[:count].copy() if count < len(points) // 2 else points[:count]
+
+
+def read_shared_points(
+    path: Path | str, block_size: int = READ_BLOCK_SIZE
+) -> SharedPoints:
+    """
+    Reads all vertices of a mesh file directly into shared memory, so that they can be reduced
+    by the worker processes without another copy. See `iter_point_blocks` for the supported
+    formats.
+
+    Args:
+        path (Path | str): The path of the mesh file.
+        block_size (int, optional): The number of bytes to read at once. Defaults to \
+            READ_BLOCK_SIZE.
+
+    Returns:
+        SharedPoints: The vertices in shared memory. Must be closed by the caller.
+    """
+
+    def grow(_: np.ndarray, size: int, __: int) -> np.ndarray:
+        shared.resize(size)
+        return shared.points
+
+    shared = SharedPoints(_estimate_vertex_count(path))
+    try:
+        _, count = _fill_points(path, block_size, shared.points, grow)
+        shared.resize(count)
+    except BaseException:
+        shared.close()
+        raise
+    return shared
+
+
+def get_mesh_extents(
+    path: Path | str,
+    block_size: int = READ_BLOCK_SIZE,
+    workers: int = 1,
+    chunk_size: int = CHUNK_SIZE,
+) -> BoundingBox:
+    """
+    Returns the axis-aligned bounding box of a mesh file. The file is reduced block by block,
+    the vertices are never held in memory as a whole. Files with more vertices than one chunk
+    are read into shared memory and reduced by a pool of worker processes instead, if more
+    than one worker is requested.
+
+    Args:
+        path (Path | str): The path of the mesh file.
+        block_size (int, optional): The number of bytes to read at once. Defaults to \
+            READ_BLOCK_SIZE.
+        workers (int, optional): The number of worker processes. Zero or less uses all \
+            available cores. Defaults to 1.
+        chunk_size (int, optional): The number of points per chunk. Defaults to CHUNK_SIZE.
+
+    Returns:
+        BoundingBox: The bounding box of the mesh.
+    """
+    if get_worker_count(workers) > 1 and _estimate_vertex_count(path) > chunk_size:
+        with read_shared_points(path, block_size) as shared:
+            return shared.get_extents(workers, chunk_size)
+    return reduce_extents(iter_point_blocks(path, block_size))
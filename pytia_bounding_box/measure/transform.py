@@ -0,0 +1,157 @@
+"""
+    Extents of point sources in user-defined axis systems.
+
+    A rigid transform maps part coordinates to the coordinates of an axis system. It's given
+    as (3, 3) rotation matrix or as (4, 4) homogeneous matrix, the rows of the rotation are the
+    axes of the axis system. A stack of transforms is applied in one matrix product of the
+    points with all stacked rotations, so the points are scanned once for any number of
+    candidate orientations. The translations only shift the resulting extents.
+"""
+
+from __future__ import annotations
+
+from typing import List
+from typing import Tuple
+
+import numpy as np
+from measure.extents import BoundingBox
+
+# Number of projected values per chunk. The points are projected in chunks of rows, so that the
+# projections of all transforms stay small, independent of the number of transforms.
+_CHUNK_ELEMENTS = 1 << 21
+_ORTHONORMAL_TOLERANCE = 1e-6
+
+
+def get_axis_system_transform(
+    origin: Tuple[float, float, float] | np.ndarray,
+    x_axis: Tuple[float, float, float] | np.ndarray,
+    y_axis: Tuple[float, float, float] | np.ndarray,
+) -> np.ndarray:
+    """
+    Returns the transform from part coordinates to the coordinates of an axis system, as it's
+    defined in CATIA: An origin and the directions of the X and Y axis. The Z axis completes
+    the right-handed system.
+
+    Args:
+        origin (Tuple[float, float, float] | np.ndarray): The origin of the axis system.
+        x_axis (Tuple[float, float, float] | np.ndarray): The direction of the X axis.
+        y_axis (Tuple[float, float, float] | np.ndarray): The direction of the Y axis, it's \
+            orthogonalized against the X axis.
+
+    Raises:
+        ValueError: Raised when the axes are zero or parallel.
+
+    Returns:
+        np.ndarray: The transform as (4, 4) homogeneous matrix.
+    """
+    x = np.asarray(x_axis, dtype=np.float64)
+    y = np.asarray(y_axis, dtype=np.float64)
+    if not np.linalg.norm(x):
+        raise ValueError("The X axis of the axis system must not be a zero vector.")
+    x = x / np.linalg.norm(x)
+    y = y - (y @ x) * x
+    if np.linalg.norm(y) <= _ORTHONORMAL_TOLERANCE:
+        raise ValueError(
+            "The Y axis of the axis system must not be parallel to the X axis."
+        )
+    y = y / np.linalg.norm(y)
+
+    transform = np.eye(4)
+    transform[:3, :3] = np.stack((x, y, np.cross(x, y)))
+    transform[:3, 3] = -transform[:3, :3] @ np.asarray(origin, dtype=np.float64)
+    return transform
+
+
+def split_transforms(transforms: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Splits a stack of rigid transforms into rotations and translations.
+
+    Args:
+        transforms (np.ndarray): The transforms as (k, 3, 3) or (k, 4, 4) array.
+
+    Raises:
+        ValueError: Raised when the transforms have the wrong shape or aren't rigid.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The rotations as (k, 3, 3) and the translations as \
+            (k, 3) array.
+    """
+    if transforms.ndim != 3 or transforms.shape[1:] not in ((3, 3), (4, 4)):
+        raise ValueError(
+            f"Expected transforms of shape (k, 3, 3) or (k, 4, 4), got {transforms.shape}."
+        )
+    rotations = transforms[:, :3, :3].astype(np.float64)
+    if transforms.shape[1] == 4:
+        if not np.allclose(transforms[:, 3], [0.0, 0.0, 0.0, 1.0]):
+            raise ValueError(
+                "The last row of a homogeneous transform must be (0, 0, 0, 1)."
+            )
+        translations = transforms[:, :3, 3].astype(np.float64)
+    else:
+        translations = np.zeros((len(transforms), 3))
+
+    gram = rotations @ rotations.transpose(0, 2, 1)
+    if not np.allclose(gram, np.eye(3), atol=_ORTHONORMAL_TOLERANCE):
+        raise ValueError("The rotations must be orthonormal, scaling isn't supported.")
+    return rotations, translations
+
+
+def get_extents_batch(points: np.ndarray, transforms: np.ndarray) -> List[BoundingBox]:
+    """
+    Returns the bounding boxes of the given points in each of the given axis systems. All
+    transforms are applied in one pass over the points.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+        transforms (np.ndarray): The rigid transforms as (k, 3, 3) or (k, 4, 4) array.
+
+    Raises:
+        ValueError: Raised when the points are empty or when the transforms are invalid.
+
+    Returns:
+        List[BoundingBox]: The bounding boxes, one for each transform. The minimum and the \
+            maximum are given in the coordinates of the respective axis system.
+    """
+    if points.ndim != 2 or points.shape[1] != 3:
+        raise ValueError(f"Expected an array of shape (n, 3), got {points.shape}.")
+    if len(points) == 0:
+        raise ValueError("Cannot compute the extents of an empty point source.")
+    rotations, translations = split_transforms(np.asarray(transforms))
+
+    # The rows 3i, 3i + 1 & 3i + 2 are the axes of the i-th transform. The projections are
+    # computed transposed, so that each axis is reduced along a contiguous row.
+    stacked = rotations.reshape(-1, 3)
+    minimum = np.full(len(stacked), np.inf)
+    maximum = np.full(len(stacked), -np.inf)
+    chunk_size = max(1, _CHUNK_ELEMENTS // len(stacked))
+    for start in range(0, len(points), chunk_size):
+        projected = stacked @ points[start : start + chunk_size].T
+        np.minimum(minimum, projected.min(axis=1), out=minimum)
+        np.maximum(maximum, projected.max(axis=1), out=maximum)
+
+    minimum = minimum.reshape(-1, 3) + translations
+    maximum = maximum.reshape(-1, 3) + translations
+    return [
+        BoundingBox(
+            minimum=(float(lo[0]), float(lo[1]), float(lo[2])),
+            maximum=(float(hi[0]), float(hi[1]), float(hi[2])),
+        )
+        for lo, hi in zip(minimum, maximum)
+    ]
+
+
+def get_transformed_extents(points: np.ndarray, transform: np.ndarray) -> BoundingBox:
+    """
+    Returns the bounding box of the given points in the given axis system.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+        transform (np.ndarray): The rigid transform as (3, 3) or (4, 4) array.
+
+    Raises:
+        ValueError: Raised when the points are empty or when the transform is invalid.
+
+    Returns:
+        BoundingBox: The bounding box in the coordinates of the axis system.
+    """
+    return get_extents_batch(points, np.asarray(transform)[None])[0]
@@ -0,0 +1,133 @@
+"""
+    Voxel-grid previews for point sources.
+
+    The points are replaced by the centers of the occupied cells of a regular grid. Every point
+    lies within half a cell of the center of its cell and every center has at least one point
+    in its cell. Thus the edge lengths of any box measured on the centers differ from the edge
+    lengths of the box of all points in the same frame by at most the projection of one cell.
+    The grid is bounded, the preview costs one pass over the points and the box search runs on
+    a few thousand centers.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+from measure.extents import get_min_max
+from measure.oriented import OrientedBox
+from measure.oriented import get_oriented_box
+
+PREVIEW_DIVISIONS = 64  # Number of cells along the longest extent of the points.
+
+_CHUNK_SIZE = 1 << 18  # Number of points assigned to their cells at once.
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class PreviewBox:
+    """Dataclass for the oriented box of a voxel preview and the bound of its error."""
+
+    box: OrientedBox
+    voxel_size: float
+    # Max. difference of each edge length to the extent of the points along the same axis.
+    error: Tuple[float, float, float]
+
+    def get_size(self, n_digits: int) -> Tuple[float, float, float]:
+        """
+        Returns the edge lengths of the preview box rounded to the given number of digits.
+
+        Args:
+            n_digits (int): The number of digits after the decimal point.
+
+        Returns:
+            Tuple[float, float, float]: The rounded edge lengths of the X, Y & Z box axis.
+        """
+        return self.box.get_size(n_digits)
+
+
+def get_voxel_size(points: np.ndarray, divisions: int = PREVIEW_DIVISIONS) -> float:
+    """
+    Returns the edge length of the cells, so that the longest extent of the points is divided
+    into the given number of cells.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+        divisions (int, optional): The number of cells along the longest extent. Defaults to \
+            PREVIEW_DIVISIONS.
+
+    Raises:
+        ValueError: Raised when the number of divisions is smaller than 1.
+
+    Returns:
+        float: The edge length of the cells. Is 1 if all points are equal.
+    """
+    if divisions < 1:
+        raise ValueError(f"The number of divisions must be positive, got {divisions}.")
+    minimum, maximum = get_min_max(points)
+    extent = float(np.max(maximum - minimum))
+    return extent / divisions if extent > 0 else 1.0
+
+
+def downsample(points: np.ndarray, voxel_size: float) -> np.ndarray:
+    """
+    Returns the centers of all grid cells that contain at least one point. The grid starts at
+    the minimum of the points.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+        voxel_size (float): The edge length of the cells.
+
+    Raises:
+        ValueError: Raised when the array is empty or the voxel size isn't positive.
+
+    Returns:
+        np.ndarray: The cell centers as (m, 3) array, m is at most the number of points.
+    """
+    if len(points) == 0:
+        raise ValueError("Cannot downsample an empty point source.")
+    if voxel_size <= 0:
+        raise ValueError(f"The voxel size must be positive, got {voxel_size}.")
+
+    minimum, maximum = get_min_max(points)
+    shape = np.floor((maximum - minimum) / voxel_size).astype(np.int64) + 1
+    occupied = np.zeros(int(np.prod(shape)), dtype=bool)
+    # The flat cell index is computed as float dot product, which is exact for any grid that
+    # fits into memory and much faster than integer arithmetic on the columns.
+    strides = np.array([shape[1] * shape[2], shape[2], 1], dtype=np.float64)
+    for start in range(0, len(points), _CHUNK_SIZE):
+        cells = points[start : start + _CHUNK_SIZE] - minimum
+        cells *= 1 / voxel_size
+        np.floor(cells, out=cells)
+        np.minimum(cells, shape - 1, out=cells)
+        occupied[(cells @ strides).astype(np.int64)] = True
+
+    cells = np.column_stack(np.unravel_index(np.flatnonzero(occupied), shape))
+    return minimum + (cells + 0.5) * voxel_size
+
+
+def get_preview_box(
+    points: np.ndarray, divisions: int = PREVIEW_DIVISIONS
+) -> PreviewBox:
+    """
+    Returns the oriented box of the voxel-downsampled points together with the bound of its
+    error: Each edge length differs from the extent of the points along the same box axis by
+    at most the voxel size for axes along a part axis and by at most sqrt(3) times the voxel
+    size for any other axis. The error isn't a bound of the difference to the exact oriented
+    box, whose axes may be rotated against the axes of the preview.
+
+    Args:
+        points (np.ndarray): The points as (n, 3) array.
+        divisions (int, optional): The number of cells along the longest extent. Defaults to \
+            PREVIEW_DIVISIONS.
+
+    Raises:
+        ValueError: Raised when the array is empty.
+
+    Returns:
+        PreviewBox: The preview box.
+    """
+    voxel_size = get_voxel_size(points, divisions)
+    box = get_oriented_box(downsample(points, voxel_size))
+    x, y, z = (voxel_size * float(np.abs(axis).sum()) for axis in box.rotation)
+    return PreviewBox(box=box, voxel_size=voxel_size, error=(x, y, z))
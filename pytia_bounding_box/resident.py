@@ -0,0 +1,198 @@
+"""
+    Resident mode of the app.
+
+    The first instance of the app listens on a named pipe of the user (a unix socket on other
+    platforms). It stays in the
+    background when its window is closed and shows the window again for the active document
+    when the app is launched the next time: The new launch hands its request over to the
+    resident instance and exits, before the user interface and the dependencies are loaded.
+    The resident instance exits after it has been idle for the timeout from the settings.
+
+    Connections are authenticated with a random key, which is stored in the appdata folder of
+    the user.
+
+    Important: Do not import third party modules here. This module
+    must work on its own without any other dependencies!
+"""
+
+import os
+import queue
+import sys
+import tempfile
+import threading
+from multiprocessing.connection import AuthenticationError
+from multiprocessing.connection import Client
+from multiprocessing.connection import Listener
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+from const import APP_VERSION
+from const import APPDATA
+from const import RESIDENT_NAME
+from const import RESIDENT_KEY
+
+# The time in seconds to wait for a request or a reply.
+TIMEOUT = 5
+
+
+def get_authkey(path: Path | str = Path(APPDATA, RESIDENT_KEY)) -> bytes:
+    """
+    Returns the key that authenticates the connections to the resident instance. The key is
+    created on the first call.
+
+    Args:
+        path (Path | str, optional): The path of the key file. Defaults to the key file in \
+            the appdata folder.
+
+    Returns:
+        bytes: The key.
+    """
+    path = Path(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "xb") as f:
+            f.write(os.urandom(32))
+    except FileExistsError:
+        pass
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def get_address(name: str = RESIDENT_NAME) -> str:
+    """
+    Returns the address of the resident instance for the platform: A named pipe on windows,
+    a unix socket otherwise.
+
+    Args:
+        name (str, optional): The name of the pipe or socket. Defaults to the name of the \
+            app and the user.
+
+    Returns:
+        str: The address.
+    """
+    if sys.platform == "win32":
+        return f"\\\\.\\pipe\\{name}"
+    if sys.platform == "linux":
+        # Abstract sockets don't leave a file behind if the app crashes.
+        return f"\0{name}"
+    return str(Path(tempfile.gettempdir(), f"{name}.sock"))
+
+
+def hand_over(address: Optional[str] = None, authkey: Optional[bytes] = None) -> bool:
+    """
+    Hands the launch over to the resident instance, which shows its window for the active
+    document.
+
+    Args:
+        address (Optional[str], optional): The address of the resident instance. Defaults \
+            to the address of the user, see `get_address`.
+        authkey (Optional[bytes], optional): The key of the connection. Defaults to the key \
+            from the appdata folder.
+
+    Returns:
+        bool: True if the resident instance has accepted the request, False if there's no \
+            resident instance or it's busy. The app must start on its own in this case.
+    """
+    try:
+        with Client(
+            address or get_address(), authkey=authkey or get_authkey()
+        ) as connection:
+            connection.send({"command": "open", "version": APP_VERSION})
+            return bool(connection.poll(TIMEOUT) and connection.recv())
+    except (OSError, EOFError, AuthenticationError):
+        return False
+
+
+class ResidentServer:
+    """
+    Accepts the requests of later launches of the app. Requests are only accepted while the
+    app is idle, i.e. while its window is hidden, and only from the same app version.
+    """
+
+    def __init__(
+        self, address: Optional[str] = None, authkey: Optional[bytes] = None
+    ) -> None:
+        """
+        Inits the ResidentServer class.
+
+        Args:
+            address (Optional[str], optional): The address to listen on. Defaults to the \
+                address of the user, see `get_address`.
+            authkey (Optional[bytes], optional): The key of the connections. Defaults to the \
+                key from the appdata folder.
+        """
+        self.address = address or get_address()
+        self.authkey = authkey
+        self.requests: queue.Queue[Dict[str, Any]] = queue.Queue()
+        self._lock = threading.Lock()
+        self._idle = False
+        self._listener: Optional[Listener] = None
+
+    def start(self) -> bool:
+        """
+        Starts listening in a background thread.
+
+        Returns:
+            bool: False if another instance is listening already.
+        """
+        try:
+            self._listener = Listener(
+                self.address, authkey=self.authkey or get_authkey()
+            )
+        except OSError:
+            return False
+        threading.Thread(target=self._serve, daemon=True).start()
+        return True
+
+    def _serve(self) -> None:
+        """Accepts the connections until the server is closed."""
+        while (listener := self._listener) is not None:
+            try:
+                connection = listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                continue
+            with connection:
+                try:
+                    if connection.poll(TIMEOUT):
+                        connection.send(self._accept(connection.recv()))
+                except (OSError, EOFError):
+                    pass
+
+    def _accept(self, request: Any) -> bool:
+        """Queues the request if the app is idle. Returns whether it has been queued."""
+        if not isinstance(request, dict) or request.get("version") != APP_VERSION:
+            return False
+        with self._lock:
+            if not self._idle:
+                return False
+            self._idle = False
+            self.requests.put(request)
+        return True
+
+    def set_idle(self) -> None:
+        """Lets the server accept the next request, e.g. after the window has been hidden."""
+        with self._lock:
+            self._idle = True
+
+    def stop(self) -> bool:
+        """
+        Stops accepting requests, if the app is still idle.
+
+        Returns:
+            bool: False if a request has been accepted in the meantime, which must be \
+                handled first.
+        """
+        with self._lock:
+            if not self._idle:
+                return False
+            self._idle = False
+        self.close()
+        return True
+
+    def close(self) -> None:
+        """Stops listening."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.close()
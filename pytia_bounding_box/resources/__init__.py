@@ -9,16 +9,22 @@ import atexit
 import importlib.resources
 import json
 import os
+import re
 import tkinter.messagebox as tkmsg
 from dataclasses import asdict
 from dataclasses import dataclass
 from dataclasses import field
 from dataclasses import fields
 from pathlib import Path
+from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 
+from atomic import write_atomic
 from const import APP_VERSION
 from const import APPDATA
 from const import CONFIG_APPDATA
@@ -33,7 +39,11 @@ from const import CONFIG_PROPS_DEFAULT
 from const import CONFIG_SETTINGS
 from const import CONFIG_USERS
 from const import STYLES
+from const import MeasurementMode
+from resources.records import Records
+from resources.records import get_index
 from resources.utils import expand_env_vars
+from timing import tracer
 
 
 @dataclass(slots=True, kw_only=True, frozen=True)
@@ -107,6 +117,28 @@ class SettingsRestrictions:
     enable_information: bool
 
 
+@dataclass(slots=True, kw_only=True, frozen=True)
+class SettingsMeasurement:
+    """Dataclass for the measurement of point sources (settings.json)."""
+
+    workers: int = 0
+    chunk_size: int = 4_000_000
+
+    def __post_init__(self) -> None:
+        if self.chunk_size <= 0:
+            raise ValueError(
+                f"The measurement chunk size must be positive, got {self.chunk_size}."
+            )
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class SettingsResident:
+    """Dataclass for the resident mode (settings.json)."""
+
+    enabled: bool = False
+    timeout: int = 60
+
+
 @dataclass(slots=True, kw_only=True)
 class Settings:  # pylint: disable=R0902
     """Dataclass for settings (settings.json)."""
@@ -124,6 +156,8 @@ class Settings:  # pylint: disable=R0902
     paths: SettingsPaths
     urls: SettingsUrls
     mails: SettingsMails
+    measurement: SettingsMeasurement = field(default_factory=dict)  # type: ignore
+    resident: SettingsResident = field(default_factory=dict)  # type: ignore
 
     def __post_init__(self) -> None:
         self.offset = SettingsScale(**dict(self.offset))  # type: ignore
@@ -135,6 +169,8 @@ class Settings:  # pylint: disable=R0902
         self.paths = SettingsPaths(**dict(self.paths))  # type: ignore
         self.urls = SettingsUrls(**dict(self.urls))  # type: ignore
         self.mails = SettingsMails(**dict(self.mails))  # type: ignore
+        self.measurement = SettingsMeasurement(**dict(self.measurement))  # type: ignore
+        self.resident = SettingsResident(**dict(self.resident))  # type: ignore
 
 
 @dataclass(slots=True, kw_only=True, frozen=True)
@@ -174,6 +210,10 @@ class Preset:  # pylint: disable=R0902
     result_filter: str
     tooltip: str
     filter_examples: List[str]
+    result_pattern: re.Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "result_pattern", re.compile(self.result_filter))
 
 
 @dataclass(slots=True, kw_only=True, frozen=True)
@@ -227,15 +267,15 @@ class AppData:
     """Dataclass for appdata settings."""
 
     version: str = field(default=APP_VERSION)
-    counter: int = 0
+    counter: int = 0  # The number of saves, see `Callbacks.on_btn_save`.
     disable_volume_warning: bool = False
     theme: str = STYLES[0]
+    measurement_mode: str = MeasurementMode.AXIS_ALIGNED.value
 
     def __post_init__(self) -> None:
         self.version = (
             APP_VERSION  # Always store the latest version in the appdata json
         )
-        self.counter += 1
 
 
 class Resources:  # pylint: disable=R0902
@@ -249,111 +289,168 @@ class Resources:  # pylint: disable=R0902
         "_users",
         "_infos",
         "_appdata",
+        "_presets_by_name",
+        "_processes_by_name",
+        "_users_by_logon",
+        "_users_by_folded_logon",
+        "_msgs_by_counter",
+        "_appdata_saved",
     )
 
+    # The resource file of each attribute, and the default file if the resource file is
+    # optional.
+    _FILES: Dict[str, Tuple[str, Optional[str]]] = {
+        "_settings": (CONFIG_SETTINGS, None),
+        "_props": (CONFIG_PROPS, CONFIG_PROPS_DEFAULT),
+        "_presets": (CONFIG_PRESETS, CONFIG_PRESETS_DEFAULT),
+        "_processes": (CONFIG_PROCESSES, CONFIG_PROCESSES_DEFAULT),
+        "_users": (CONFIG_USERS, None),
+        "_infos": (CONFIG_INFOS, CONFIG_INFOS_DEFAULT),
+    }
+
     def __init__(self) -> None:
-        self._read_settings()
-        self._read_props()
-        self._read_presets()
-        self._read_users()
-        self._read_processes()
-        self._read_infos()
-        self._read_appdata()
+        # The resource files are read on the first access of their property, so that code
+        # paths like the dependency installer only pay for the files they use.
+        for name in self.__slots__:
+            setattr(self, name, None)
 
         atexit.register(self._write_appdata)
 
+    def _load(self, name: str, reader: Callable[[], None]) -> Any:
+        """Returns the value of the given attribute, reads its resource file if necessary."""
+        if getattr(self, name) is None:
+            with tracer.span(f"read{name}"):
+                reader()
+        return getattr(self, name)
+
     @property
     def settings(self) -> Settings:
         """settings.json"""
-        return self._settings
+        return self._load("_settings", self._read_settings)
 
     @property
     def props(self) -> Props:
         """properties.json"""
-        return self._props
+        return self._load("_props", self._read_props)
 
     @property
-    def presets(self) -> List[Preset]:
+    def presets(self) -> Sequence[Preset]:
         """presets.json"""
-        return self._presets
+        return self._load("_presets", self._read_presets)
 
     @property
-    def processes(self) -> List[Process]:
+    def processes(self) -> Sequence[Process]:
         """processes.json"""
-        return self._processes
+        return self._load("_processes", self._read_processes)
 
     @property
-    def users(self) -> List[User]:
+    def users(self) -> Sequence[User]:
         """users.json"""
-        return self._users
+        return self._load("_users", self._read_users)
 
     @property
-    def infos(self) -> List[Info]:
+    def infos(self) -> Sequence[Info]:
         """infos.json"""
-        return self._infos
+        return self._load("_infos", self._read_infos)
 
     @property
     def appdata(self) -> AppData:
         """Property for the appdata config file."""
-        return self._appdata
+        return self._load("_appdata", self._read_appdata)
+
+    def _get_resource(self, name: str) -> str:
+        """
+        Returns the resource file of the given attribute, the default file if the optional
+        resource file doesn't exist.
+        """
+        resource, default = self._FILES[name]
+        if default and not importlib.resources.is_resource("resources", resource):
+            return default
+        return resource
 
     def _read_settings(self) -> None:
         """Reads the settings json from the resources folder."""
-        with importlib.resources.open_binary("resources", CONFIG_SETTINGS) as f:
+        settings_resource = self._get_resource("_settings")
+        with importlib.resources.open_binary("resources", settings_resource) as f:
             self._settings = Settings(**json.load(f))
 
+    @staticmethod
+    def _read_parsed(resource: str, parse: Callable[[bytes], Any]) -> Any:
+        """Returns the parsed content of a resource file."""
+        with importlib.resources.open_binary("resources", resource) as f:
+            return parse(f.read())
+
     def _read_presets(self) -> None:
         """Reads the presets json from the resources folder."""
-        presets_resource = (
-            CONFIG_PRESETS
-            if importlib.resources.is_resource("resources", CONFIG_PRESETS)
-            else CONFIG_PRESETS_DEFAULT
-        )
-        with importlib.resources.open_binary("resources", presets_resource) as f:
-            self._presets = [Preset(**i) for i in json.load(f)]
+        presets_resource = self._get_resource("_presets")
+
+        def parse(data: bytes) -> tuple:
+            rows = json.loads(data)
+            return rows, get_index(rows, lambda p: p["name"])
+
+        rows, self._presets_by_name = self._read_parsed(presets_resource, parse)
+        self._presets = Records(Preset, rows)
 
     def _read_users(self) -> None:
         """Reads the users json from the resources folder."""
-        with importlib.resources.open_binary("resources", CONFIG_USERS) as f:
-            self._users = [User(**i) for i in json.load(f)]
+
+        def parse(data: bytes) -> tuple:
+            rows = json.loads(data)
+            return (
+                rows,
+                get_index(rows, lambda u: u["logon"]),
+                get_index(rows, lambda u: u["logon"].casefold()),
+            )
+
+        (
+            rows,
+            self._users_by_logon,
+            self._users_by_folded_logon,
+        ) = self._read_parsed(self._get_resource("_users"), parse)
+        self._users = Records(User, rows)
 
     def _read_props(self) -> None:
         """Reads the props json from the resources folder."""
-        props_resource = (
-            CONFIG_PROPS
-            if importlib.resources.is_resource("resources", CONFIG_PROPS)
-            else CONFIG_PROPS_DEFAULT
-        )
-        with importlib.resources.open_binary("resources", props_resource) as f:
-            self._props = Props(**json.load(f))
+        props_resource = self._get_resource("_props")
+        self._props = Props(**self._read_parsed(props_resource, json.loads))
 
     def _read_processes(self) -> None:
         """Reads the processes json from the resources folder."""
-        processes_resource = (
-            CONFIG_PROCESSES
-            if importlib.resources.is_resource("resources", CONFIG_PROCESSES)
-            else CONFIG_PROCESSES_DEFAULT
-        )
-        with importlib.resources.open_binary("resources", processes_resource) as f:
-            self._processes = [Process(**i) for i in json.load(f)]
+        processes_resource = self._get_resource("_processes")
+
+        def parse(data: bytes) -> tuple:
+            rows = json.loads(data)
+            return rows, get_index(rows, lambda p: p["name"])
+
+        rows, self._processes_by_name = self._read_parsed(processes_resource, parse)
+        self._processes = Records(Process, rows)
 
     def _read_infos(self) -> None:
         """Reads the information json from the resources folder."""
-        infos_resource = (
-            CONFIG_INFOS
-            if importlib.resources.is_resource("resources", CONFIG_INFOS)
-            else CONFIG_INFOS_DEFAULT
-        )
-        with importlib.resources.open_binary("resources", infos_resource) as f:
-            self._infos = [Info(**i) for i in json.load(f)]
+        infos_resource = self._get_resource("_infos")
+
+        def parse(data: bytes) -> tuple:
+            rows = json.loads(data)
+            msgs_by_counter: Dict[int, List[str]] = {}
+            for row in rows:
+                msgs_by_counter.setdefault(row["counter"], []).append(row["msg"])
+            return rows, msgs_by_counter
+
+        rows, self._msgs_by_counter = self._read_parsed(infos_resource, parse)
+        self._infos = Records(Info, rows)
 
     def _read_appdata(self) -> None:
-        """Reads the json config file from the appdata folder."""
-        if os.path.exists(appdata_file := f"{APPDATA}\\{CONFIG_APPDATA}"):
+        """
+        Reads the json config file from the appdata folder. Keeps the content of the file, so
+        that the file is only written if the appdata has changed.
+        """
+        if os.path.exists(appdata_file := Path(APPDATA, CONFIG_APPDATA)):
             with open(appdata_file, "r", encoding="utf8") as f:
                 try:
-                    value = AppData(**json.load(f))
+                    self._appdata_saved = json.load(f)
+                    value = AppData(**self._appdata_saved)  # type: ignore
                 except Exception:
+                    self._appdata_saved = None
                     value = AppData()
                     tkmsg.showwarning(
                         title="Configuration warning",
@@ -365,10 +462,17 @@ class Resources:  # pylint: disable=R0902
             self._appdata = AppData()
 
     def _write_appdata(self) -> None:
-        """Saves appdata config to file."""
-        os.makedirs(APPDATA, exist_ok=True)
-        with open(f"{APPDATA}\\{CONFIG_APPDATA}", "w", encoding="utf8") as f:
-            json.dump(asdict(self._appdata), f)
+        """
+        Saves appdata config to file. Skipped if the appdata hasn't been read or hasn't changed
+        since. The file is replaced atomically, an interrupted write doesn't corrupt it.
+        """
+        if (
+            self._appdata is None
+            or (value := asdict(self._appdata)) == self._appdata_saved
+        ):
+            return
+        write_atomic(Path(APPDATA, CONFIG_APPDATA), lambda f: json.dump(value, f))
+        self._appdata_saved = value
 
     @staticmethod
     def get_keys(c: Callable) -> List[str]:
@@ -406,10 +510,7 @@ class Resources:  # pylint: disable=R0902
         Returns:
             bool: True if the process exists, False otherwise.
         """
-        for process in self._processes:
-            if process.name == name:
-                return True
-        return False
+        return name in self._load("_processes_by_name", self._read_processes)
 
     def get_process_by_name(self, name: str) -> Process:
         """
@@ -424,9 +525,10 @@ class Resources:  # pylint: disable=R0902
         Returns:
             Processes: The process object.
         """
-        for index, value in enumerate(self._processes):
-            if value.name == name:
-                return self._processes[index]
+        if name in (
+            processes := self._load("_processes_by_name", self._read_processes)
+        ):
+            return self.processes[processes[name]]
         raise ValueError
 
     def get_preset_by_name(self, name: str) -> Preset:
@@ -442,9 +544,8 @@ class Resources:  # pylint: disable=R0902
         Returns:
             Preset: The preset object.
         """
-        for index, value in enumerate(self._presets):
-            if value.name == name:
-                return self._presets[index]
+        if name in (presets := self._load("_presets_by_name", self._read_presets)):
+            return self.presets[presets[name]]
         raise ValueError
 
     def preset_exists(self, name: str) -> bool:
@@ -457,17 +558,16 @@ class Resources:  # pylint: disable=R0902
         Returns:
             bool: True if the preset exists, False otherwise.
         """
-        for preset in self._presets:
-            if preset.name == name:
-                return True
-        return False
+        return name in self._load("_presets_by_name", self._read_presets)
 
-    def get_user_by_logon(self, logon: str) -> User:
+    def get_user_by_logon(self, logon: str, case_sensitive: bool = True) -> User:
         """
         Returns the user dataclass that matches the logon value.
 
         Args:
             user (str): The user to fetch from the dataclass list.
+            case_sensitive (bool, optional): Matches the logon name case-sensitive. \
+                Defaults to True.
 
         Raises:
             ValueError: Raised when the user doesn't exist.
@@ -475,25 +575,32 @@ class Resources:  # pylint: disable=R0902
         Returns:
             User: The user from the dataclass list that matches the provided logon name.
         """
-        for index, value in enumerate(self._users):
-            if value.logon == logon:
-                return self._users[index]
+        users = self._load(
+            "_users_by_logon" if case_sensitive else "_users_by_folded_logon",
+            self._read_users,
+        )
+        key = logon if case_sensitive else logon.casefold()
+        if key in users:
+            return self.users[users[key]]
         raise ValueError
 
-    def user_exists(self, logon: str) -> bool:
+    def user_exists(self, logon: str, case_sensitive: bool = True) -> bool:
         """
         Returns wether the user exists in the dataclass list, or not.
 
         Args:
             logon (str): The logon name to search for.
+            case_sensitive (bool, optional): Matches the logon name case-sensitive. \
+                Defaults to True.
 
         Returns:
             bool: The user from the dataclass list that matches the provided logon name.
         """
-        for user in self._users:
-            if user.logon == logon:
-                return True
-        return False
+        if case_sensitive:
+            return logon in self._load("_users_by_logon", self._read_users)
+        return logon.casefold() in self._load(
+            "_users_by_folded_logon", self._read_users
+        )
 
     def get_info_msg_by_counter(self) -> List[str]:
         """
@@ -502,11 +609,8 @@ class Resources:  # pylint: disable=R0902
         Returns:
             List[str]: A list of all messages that should be shown at the counter value.
         """
-        values = []
-        for index, value in enumerate(self._infos):
-            if value.counter == self._appdata.counter:
-                values.append(self._infos[index].msg)
-        return values
+        msgs = self._load("_msgs_by_counter", self._read_infos)
+        return list(msgs.get(self.appdata.counter, []))
 
 
 resource = Resources()
@@ -0,0 +1,62 @@
+"""
+    Lazily built resource objects.
+
+    The resource files are parsed into plain rows and indexes, which is much faster than
+    building a dataclass object for each entry of a large file (e.g. the users). The objects
+    are built from the rows on the first access, see `Records`.
+
+    Important: Do not import third party modules here. This module
+    must work on its own without any other dependencies!
+"""
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Generic
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def get_index(rows: Iterable[Dict[str, Any]], key: Callable) -> Dict[Any, int]:
+    """
+    Returns the position of each row by the given key. The first row wins if several rows
+    have the same key, like in a linear search.
+    """
+    index: Dict[Any, int] = {}
+    for position, row in enumerate(rows):
+        index.setdefault(key(row), position)
+    return index
+
+
+class Records(Sequence[T], Generic[T]):
+    """Read-only list of resource objects, each object is built from its row on first access."""
+
+    def __init__(self, cls: Callable[..., T], rows: Sequence[Dict[str, Any]]) -> None:
+        """
+        Inits the Records class.
+
+        Args:
+            cls (Callable[..., T]): The dataclass of the objects.
+            rows (Sequence[Dict[str, Any]]): The keyword arguments of each object.
+        """
+        self._cls = cls
+        self._rows = rows
+        self._items: List[Optional[T]] = [None] * len(rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, position):  # type: ignore
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        if (item := self._items[position]) is None:
+            item = self._items[position] = self._cls(**self._rows[position])
+        return item
+
+    def __repr__(self) -> str:
+        return repr(list(self))
@@ -0,0 +1,166 @@
+"""
+    Timing of the start-up phases of the app.
+
+    The tracer records named spans, which can be nested. A trace starts when this module is
+    imported and ends once the first result is shown. The finished trace is written to the log
+    as a tree and appended to a json file in the appdata folder, which keeps the latest traces.
+    Spans after the end of the trace aren't recorded.
+
+    Important: Do not import third party modules here. This module
+    must work on its own without any other dependencies!
+"""
+
+import json
+import os
+import platform
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from atomic import write_atomic
+from const import APP_VERSION
+
+
+@dataclass(slots=True, kw_only=True)
+class Span:
+    """Dataclass for a timed phase."""
+
+    name: str
+    start: float  # perf_counter
+    end: Optional[float] = None
+    children: List["Span"] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        """Returns the duration in seconds, until now if the span hasn't ended yet."""
+        return (time.perf_counter() if self.end is None else self.end) - self.start
+
+    def to_dict(self, origin: float) -> Dict[str, Any]:
+        """Returns the span and its children as dict, times in seconds from the origin."""
+        return {
+            "name": self.name,
+            "start": round(self.start - origin, 6),
+            "duration": round(self.duration, 6),
+            "children": [child.to_dict(origin) for child in self.children],
+        }
+
+
+class Tracer:
+    """Records the spans of a trace."""
+
+    def __init__(self, name: str = "startup") -> None:
+        """
+        Inits the Tracer class and starts the first trace.
+
+        Args:
+            name (str, optional): The name of the trace. Defaults to "startup".
+        """
+        self.root: Span
+        self.started_at: float  # Unix time
+        self._stack: List[Span]
+        self.start(name)
+
+    @property
+    def finished(self) -> bool:
+        """Returns whether the trace has ended."""
+        return self.root.end is not None
+
+    def start(self, name: str) -> None:
+        """
+        Starts a new trace, e.g. when the resident app shows its window again.
+
+        Args:
+            name (str): The name of the trace.
+        """
+        self.root = Span(name=name, start=time.perf_counter())
+        self.started_at = time.time()
+        self._stack = [self.root]
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """
+        Records the time of the with-block as span of the current span.
+
+        Args:
+            name (str): The name of the span.
+        """
+        if self.finished:
+            yield
+            return
+        span = Span(name=name, start=time.perf_counter())
+        self._stack[-1].children.append(span)
+        self._stack.append(span)
+        try:
+            yield
+        finally:
+            span.end = time.perf_counter()
+            self._stack.remove(span)
+
+    def finish(self) -> bool:
+        """
+        Ends the trace.
+
+        Returns:
+            bool: False if the trace has ended before.
+        """
+        if self.finished:
+            return False
+        self.root.end = time.perf_counter()
+        return True
+
+    def format(self) -> List[str]:
+        """Returns the lines of the trace as tree, one span per line."""
+        rows: List[Tuple[str, float]] = []
+
+        def add(span: Span, depth: int) -> None:
+            rows.append(("  " * depth + span.name, span.duration))
+            for child in span.children:
+                add(child, depth + 1)
+
+        add(self.root, 0)
+        width = max(len(name) for name, _ in rows)
+        return [f"{name:<{width}} {duration:8.4f}s" for name, duration in rows]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the trace and its environment as dict."""
+        return {
+            "version": APP_VERSION,
+            "python": platform.python_version(),
+            "time": self.started_at,
+            "pid": os.getpid(),
+            "trace": self.root.to_dict(self.root.start),
+        }
+
+    def write(self, path: Path | str, maxsize: int = 100) -> None:
+        """
+        Appends the trace to the json file of the traces. The file is replaced atomically. The
+        traces are only statistics, errors are ignored.
+
+        Args:
+            path (Path | str): The path of the json file.
+            maxsize (int, optional): The number of traces to keep. Defaults to 100.
+        """
+        path = Path(path)
+        traces: List[Dict[str, Any]] = []
+        try:
+            with open(path, "r", encoding="utf8") as f:
+                traces = list(json.load(f))
+        except (OSError, ValueError, TypeError):
+            pass
+        traces = [*traces, self.to_dict()][-maxsize:]
+
+        try:
+            write_atomic(path, lambda f: json.dump(traces, f))
+        except OSError:
+            pass
+
+
+tracer = Tracer()
@@ -0,0 +1,25 @@
+"""
+    Test the atomic.py file.
+"""
+
+import json
+
+import pytest
+from pytia_bounding_box.atomic import write_atomic
+
+
+def test_write_atomic(tmp_path):
+    """Tests that the file is replaced as a whole and no temporary file is left behind."""
+    path = tmp_path / "folder" / "data.json"
+    write_atomic(path, lambda f: json.dump({"key": 1}, f))
+    write_atomic(path, lambda f: f.write(b"[]"), binary=True)
+    assert json.loads(path.read_text()) == []
+
+    def fail(f):
+        f.write("{")
+        raise ValueError("Cannot serialize")
+
+    with pytest.raises(ValueError):
+        write_atomic(path, fail)
+    assert json.loads(path.read_text()) == []
+    assert list(path.parent.iterdir()) == [path]
@@ -0,0 +1,40 @@
+"""
+    Test the cache.py file.
+"""
+
+import os
+
+from pytia_bounding_box.app.cache import MeasurementCache
+
+
+def test_measurement_cache(tmp_path):
+    """Tests that cached measurements are valid until the document changes."""
+    document = tmp_path / "part.CATPart"
+    document.write_bytes(b"part")
+    cache = MeasurementCache(tmp_path / "appdata" / "measurements.json")
+
+    assert cache.get(document, "Axis-aligned box", 2) is None
+    cache.set(document, "Axis-aligned box", 2, (100.0, 80.5, 20.0))
+    assert cache.get(document, "Axis-aligned box", 2) == (100.0, 80.5, 20.0)
+    assert cache.get(document, "Oriented box", 2) is None
+    assert cache.get(document, "Axis-aligned box", 3) is None
+
+    # The cache file is read by a new instance, no temporary files are left behind.
+    reloaded = MeasurementCache(tmp_path / "appdata" / "measurements.json")
+    assert reloaded.get(document, "Axis-aligned box", 2) == (100.0, 80.5, 20.0)
+    assert os.listdir(tmp_path / "appdata") == ["measurements.json"]
+
+    document.write_bytes(b"modified part")
+    assert cache.get(document, "Axis-aligned box", 2) is None
+
+
+def test_measurement_cache_maxsize(tmp_path):
+    """Tests that the oldest entries are removed."""
+    cache = MeasurementCache(tmp_path / "measurements.json", maxsize=2)
+    for i in range(3):
+        document = tmp_path / f"part_{i}.CATPart"
+        document.write_bytes(b"part")
+        cache.set(document, "Axis-aligned box", 2, (i, i, i))
+
+    assert cache.get(tmp_path / "part_0.CATPart", "Axis-aligned box", 2) is None
+    assert cache.get(tmp_path / "part_2.CATPart", "Axis-aligned box", 2) == (2, 2, 2)
@@ -24,6 +24,8 @@ def test_versions():
     assert len(deps) == len(pyproject)
 
     for item in deps:
+        if item["name"] == "numpy":
+            assert item["version"] == pyproject["numpy"]
         if item["name"] == "pytia":
             assert f"v{item['version']}" == pyproject["pytia"]["tag"]
         if item["name"] == "pytia_ui_tools":
@@ -39,3 +41,173 @@ def test_imports():
         for line in f.readlines():
             assert "pytia" not in line
             assert "pytia_ui_tools" not in line
+
+
+def test_verification(tmp_path):
+    """Tests that a verification is only valid for the same key."""
+    from pytia_bounding_box.dependencies import Dependencies
+
+    dependencies = Dependencies(verified_path=tmp_path / "appdata" / "verified.json")
+    key = dependencies.get_verification_key()
+    assert key == dependencies.get_verification_key()
+    assert not dependencies.is_verified(key)
+
+    dependencies.set_verified(key)
+    assert dependencies.is_verified(key)
+    assert not dependencies.is_verified(f"{key}|changed")
+    assert os.listdir(tmp_path / "appdata") == ["verified.json"]
+
+
+def test_web_resources_available():
+    """Tests the concurrent probing of wheels against a local server."""
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler
+    from http.server import ThreadingHTTPServer
+
+    from pytia_bounding_box.dependencies import Dependencies
+
+    clients = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keeps the connection alive.
+
+        def do_HEAD(self):  # pylint: disable=C0103
+            clients.append((self.server.server_port, self.client_address))
+            if self.path == "/slow.whl":
+                time.sleep(2)
+            elif self.path.startswith("/late/"):
+                time.sleep(0.6)
+            self.send_response(200 if self.path.startswith("/wheels/") else 404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *_):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    slow_server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=slow_server.serve_forever, daemon=True).start()
+    try:
+        local = f"http://127.0.0.1:{server.server_port}"
+        slow = f"http://127.0.0.1:{slow_server.server_port}/slow.whl"
+        addresses = [f"{local}/wheels/a.whl", f"{local}/wheels/b.whl", f"{local}/c.whl"]
+
+        t0 = time.monotonic()
+        available = Dependencies.web_resources_available(addresses + [slow], timeout=1)
+        assert time.monotonic() - t0 < 1.5
+        assert available == {
+            addresses[0]: True,
+            addresses[1]: True,
+            addresses[2]: False,
+            slow: False,
+        }
+        # The wheels of one host are probed over one connection.
+        local_clients = [c for port, c in clients if port == server.server_port]
+        assert len(local_clients) == 3
+        assert len(set(local_clients)) == 1
+        assert Dependencies.web_resource_available(addresses[0])
+        assert not Dependencies.web_resource_available("http://127.0.0.1:1/a.whl")
+
+        # Each request on a connection only gets the time that is left until the deadline.
+        t0 = time.monotonic()
+        Dependencies._probe_host(  # pylint: disable=W0212
+            "http",
+            f"127.0.0.1:{slow_server.server_port}",
+            ["/late/a.whl", "/late/b.whl", "/late/c.whl"],
+            t0 + 1,
+        )
+        assert time.monotonic() - t0 < 1.3
+    finally:
+        for http_server in (server, slow_server):
+            http_server.shutdown()
+            http_server.server_close()
+
+
+def test_cached_requirements(tmp_path, monkeypatch):
+    """Tests the requirements for an installation from the wheelhouse."""
+    from pytia_bounding_box import dependencies
+    from pytia_bounding_box.dependencies import Dependencies
+    from pytia_bounding_box.dependencies import PackageInfo
+
+    monkeypatch.setattr(dependencies, "WHEELHOUSE", str(tmp_path))
+    wheel = "https://example.com/releases/download/v1.0.0/tool-1.0.0-py3-none-any.whl"
+    packages = [
+        PackageInfo(name="numpy", version="2.1.3", wheel=None),
+        PackageInfo(name="tool", version="1.0.0", wheel=wheel),
+    ]
+    monkeypatch.setattr(Dependencies, "get_missing_packages", lambda: packages)
+
+    assert (
+        Dependencies.get_cached_wheel(wheel) == tmp_path / "tool-1.0.0-py3-none-any.whl"
+    )
+    assert Dependencies.get_cached_requirements() is None  # The wheel is missing
+
+    (tmp_path / "tool-1.0.0-py3-none-any.whl").touch()
+    assert Dependencies.get_cached_requirements() == [
+        "numpy==2.1.3",  # PyPI packages are pinned
+        str(tmp_path / "tool-1.0.0-py3-none-any.whl"),
+    ]
+
+
+def test_installer_report():
+    """Tests that the progress of pip is shown per package."""
+    from types import SimpleNamespace
+
+    from pytia_bounding_box.dependencies import VisualInstaller
+
+    messages = []
+    installer = SimpleNamespace(
+        message=SimpleNamespace(set=messages.append), update_idletasks=lambda: None
+    )
+    for line in (
+        "Collecting numpy==2.1.3\n",
+        "  Downloading https://host/numpy-2.1.3-cp311-win_amd64.whl (12.6 MB)\n",
+        "Saved ./wheelhouse/tool-1.0.0-py3-none-any.whl\n",
+        "Requirement already satisfied: pywin32 in c:\\env\n",
+        "Installing collected packages: tool, numpy\n",
+        "Successfully installed numpy-2.1.3 tool-1.0.0\n",
+        "\n",
+    ):
+        VisualInstaller._report(installer, line)  # type: ignore
+
+    assert messages == [
+        "Collecting numpy==2.1.3",
+        "Downloading numpy-2.1.3-cp311-win_amd64.whl",
+        "Saved tool-1.0.0-py3-none-any.whl",
+        "Installing collected packages: tool, numpy",
+        "Successfully installed numpy-2.1.3 tool-1.0.0",
+    ]
+
+
+def test_installer_missing_download(tmp_path, monkeypatch):
+    """Tests that pip isn't run without requirements, if the download is incomplete."""
+    import pytest
+    from types import SimpleNamespace
+
+    from pytia_bounding_box import dependencies
+    from pytia_bounding_box.dependencies import Dependencies
+    from pytia_bounding_box.dependencies import VisualInstaller
+
+    monkeypatch.setattr(dependencies, "WHEELHOUSE", str(tmp_path))
+    monkeypatch.setattr(Dependencies, "get_cached_requirements", lambda: None)
+    monkeypatch.setattr(Dependencies, "web_resource_available", lambda _: True)
+    monkeypatch.setattr(Dependencies, "get_pip_commands", lambda: {"numpy": "numpy"})
+    errors = []
+    monkeypatch.setattr(dependencies.tkmsg, "showerror", lambda **kw: errors.append(kw))
+
+    calls = []
+    installer = SimpleNamespace(
+        progress=SimpleNamespace(set=lambda _: None),
+        progress_bar=SimpleNamespace(
+            configure=lambda **_: None, start=lambda: None, stop=lambda: None
+        ),
+        message=SimpleNamespace(set=lambda _: None),
+        _run_pip=lambda *args: calls.append(args[0]) or True,
+        destroy=lambda: None,
+    )
+    with pytest.raises(SystemExit):
+        VisualInstaller._install_pip(installer)  # type: ignore
+    assert calls == ["download"]
+    assert len(errors) == 1
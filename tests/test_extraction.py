@@ -0,0 +1,61 @@
+"""
+    Test the extraction.py file.
+"""
+
+import sys
+import zipfile
+
+from pytia_bounding_box.extraction import get_extraction
+
+
+def test_get_extraction(tmp_path):
+    """Tests that the zipapp is extracted once per build and stale copies are removed."""
+    archive = tmp_path / "app.pyz"
+    with zipfile.ZipFile(archive, "w") as z:
+        z.writestr("__main__.py", "")
+        z.writestr("module.py", "")
+        z.writestr("module.pyc", b"bytecode")
+    root = tmp_path / ".app"
+    stale = root / "0.0.1" / "digest"
+    stale.mkdir(parents=True)
+
+    folder = get_extraction(archive, root, "1.0.0")
+    assert (folder / "module.py").is_file()
+    assert not (folder / "module.pyc").exists()
+    assert (
+        folder / "__pycache__" / f"module.{sys.implementation.cache_tag}.pyc"
+    ).is_file()
+    assert not stale.parent.exists()
+
+    (folder / "marker").touch()
+    assert get_extraction(archive, root, "1.0.0") == folder
+    assert (folder / "marker").is_file()
+
+    with zipfile.ZipFile(archive, "w") as z:
+        z.writestr("__main__.py", "# rebuilt")
+    rebuilt = get_extraction(archive, root, "1.0.0")
+    assert rebuilt != folder
+    assert [p.name for p in (root / "1.0.0").iterdir()] == [rebuilt.name]
+
+
+def test_get_extraction_verify(tmp_path):
+    """Tests that a modified or incomplete copy is extracted again."""
+    archive = tmp_path / "app.pyz"
+    with zipfile.ZipFile(archive, "w") as z:
+        z.writestr("__main__.py", "")
+        z.writestr("module.py", "value = 1")
+    root = tmp_path / ".app"
+    folder = get_extraction(archive, root, "1.0.0")
+
+    (folder / "module.py").write_text("value = 2", encoding="utf8")
+    assert get_extraction(archive, root, "1.0.0") == folder
+    assert (folder / "module.py").read_text(encoding="utf8") == "value = 1"
+
+    (folder / "module.py").unlink()
+    assert get_extraction(archive, root, "1.0.0") == folder
+    assert (folder / "module.py").is_file()
+
+    (folder / ".manifest.json").unlink()
+    assert get_extraction(archive, root, "1.0.0") == folder
+    assert (folder / ".manifest.json").is_file()
+    assert [p.name for p in (root / "1.0.0").iterdir()] == [folder.name]
@@ -0,0 +1,71 @@
+"""
+    Test the history.py file.
+"""
+
+import sqlite3
+import time
+
+from pytia_bounding_box.app.history import History
+from pytia_bounding_box.app.history import Save
+
+
+def _get_save(**kwargs) -> Save:
+    values = dict(
+        part_number="1234",
+        path="C:\\parts\\1234.CATPart",
+        saved_at=time.time(),
+        logon="user",
+        preset="Standard",
+        axis="X-Axis",
+        offset=3,
+        step=5,
+        thickness=False,
+        base_size="105 × 85 × 25",
+    )
+    values.update(kwargs)
+    return Save(**values)
+
+
+def test_history_latest(tmp_path):
+    """Tests that the latest save of a part is returned."""
+    history = History(tmp_path / "history.sqlite3")
+    assert history.get_latest("1234", "C:\\parts\\1234.CATPart") is None
+
+    history.add(_get_save(saved_at=1.0, preset="Exact"))
+    history.add(_get_save(saved_at=2.0, thickness=True))
+    history.add(_get_save(saved_at=3.0, path="C:\\moved\\1234.CATPart", preset="Cut"))
+    latest = history.get_latest("1234", "C:\\parts\\1234.CATPart")
+    assert latest == _get_save(saved_at=2.0, thickness=True)
+
+    # A part that has been moved falls back to the latest save of its part number.
+    assert history.get_latest("1234", "C:\\other\\1234.CATPart").preset == "Cut"
+    history.close()
+
+    reopened = History(tmp_path / "history.sqlite3")
+    assert reopened.get_latest("1234", "C:\\moved\\1234.CATPart").preset == "Cut"
+    reopened.close()
+
+
+def test_history_by_preset(tmp_path):
+    """Tests the query of all saves with a preset within a period of time."""
+    history = History(tmp_path / "history.sqlite3")
+    for day in range(10):
+        history.add(_get_save(part_number=str(day), saved_at=day * 86400.0))
+    history.add(_get_save(part_number="cut", preset="Cut", saved_at=86400.0))
+
+    saves = history.get_by_preset("Standard", since=2 * 86400.0, until=5 * 86400.0)
+    assert [save.part_number for save in saves] == ["2", "3", "4", "5"]
+    assert len(history.get_by_preset("Standard")) == 10
+    history.close()
+
+
+def test_history_journal_mode(tmp_path):
+    """Tests that a database in WAL mode is converted to the rollback journal."""
+    with sqlite3.connect(tmp_path / "history.sqlite3") as connection:
+        connection.execute("PRAGMA journal_mode=WAL")
+    connection.close()
+
+    history = History(tmp_path / "history.sqlite3")
+    mode = history.connection.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "delete"
+    history.close()
@@ -0,0 +1,108 @@
+"""
+    Test the lazy.py file and the deferred imports of the app.
+"""
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+from pytia_bounding_box.lazy import LazyModule
+from pytia_bounding_box.lazy import lazy_import
+
+APP = Path(__file__).parent.parent / "pytia_bounding_box"
+
+# Modules that must not be imported before the window is shown.
+DEFERRED = [
+    "pytia_ui_tools.handlers.error_handler",
+    "pytia_ui_tools.handlers.mail_handler",
+    "pytia_ui_tools.handlers.workspace_handler",
+]
+
+
+def test_lazy_import(tmp_path, monkeypatch):
+    """Tests that the module is imported on the first attribute access."""
+    (tmp_path / "lazy_sample.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_sample", raising=False)
+
+    module = lazy_import("lazy_sample")
+    assert isinstance(module, LazyModule)
+    assert "lazy_sample" not in sys.modules
+    assert module.VALUE == 1
+    assert "lazy_sample" in sys.modules
+    assert lazy_import("lazy_sample") is sys.modules["lazy_sample"]
+
+    with pytest.raises(AttributeError):
+        _ = module.MISSING
+    with pytest.raises(ModuleNotFoundError):
+        _ = lazy_import("lazy_sample_missing").VALUE
+
+
+def get_eager_imports(path: Path) -> List[str]:
+    """Returns the modules, which are imported at module level of the given file."""
+    names = []
+    for node in ast.parse(path.read_text(encoding="utf8")).body:
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.extend(
+                [node.module, *(f"{node.module}.{a.name}" for a in node.names)]
+            )
+    return names
+
+
+def get_lazy_imports(path: Path) -> List[str]:
+    """Returns the modules, which are imported with `lazy_import` in the given file."""
+    return [
+        node.args[0].value
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf8")))
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "lazy_import"
+        and node.args
+        and isinstance(node.args[0], ast.Constant)
+    ]
+
+
+def test_no_eager_imports():
+    """Tests that no module of the app imports the deferred modules at module level."""
+    for path in APP.rglob("*.py"):
+        for name in get_eager_imports(path):
+            assert name not in DEFERRED, f"{path.name} imports {name} eagerly"
+
+
+def test_lazy_imports_are_deferred():
+    """
+    Tests that each module of `lazy_import` is a deferred module. A lazy import of a module,
+    which another module of the app imports at module level anyway, defers nothing.
+    """
+    eager = {name for path in APP.rglob("*.py") for name in get_eager_imports(path)}
+    for path in APP.rglob("*.py"):
+        for name in get_lazy_imports(path):
+            assert name in DEFERRED, f"{path.name} imports {name} lazily"
+            assert name not in eager, f"{name} is imported eagerly elsewhere"
+
+
+def test_no_eager_imports_at_runtime():
+    """
+    Tests that importing the GUI doesn't import the deferred modules, not even through the
+    third party packages. Only runs where the GUI dependencies are installed, the static
+    tests above cover the modules of the app regardless.
+    """
+    for module in ("ttkbootstrap", "pytia", "pytia_ui_tools"):
+        pytest.importorskip(module)
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, gui; print([m for m in {DEFERRED!r} if m in sys.modules])",
+        ],
+        cwd=APP,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
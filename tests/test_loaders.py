@@ -0,0 +1,89 @@
+"""
+    Test the loaders.py file.
+"""
+
+import threading
+from types import SimpleNamespace
+
+from pytia_bounding_box.app.loaders import Loaders
+
+
+class Root:
+    """Stand-in of the main window, which records the scheduled callbacks."""
+
+    def __init__(self) -> None:
+        self.scheduled = []
+
+    def after(self, _, func, *args) -> None:
+        """Records the callback instead of scheduling it."""
+        self.scheduled.append((func, args))
+
+    def run_scheduled(self) -> None:
+        """Runs the recorded callbacks once."""
+        scheduled, self.scheduled = self.scheduled, []
+        for func, args in scheduled:
+            func(*args)
+
+
+def get_loaders(root: Root, variables: SimpleNamespace) -> Loaders:
+    """Returns loaders on the given window and variables, like the GUI creates them."""
+    return Loaders(
+        root=root,  # type: ignore
+        variables=variables,  # type: ignore
+        validators=SimpleNamespace(),  # type: ignore
+        lazy_part_helper=SimpleNamespace(),  # type: ignore
+        layout=SimpleNamespace(button_save={}),  # type: ignore
+        ui_setter=SimpleNamespace(),  # type: ignore
+    )
+
+
+def test_close_drops_refinement():
+    """
+    Tests that a refinement, which is pending while the window is hidden in resident mode,
+    doesn't load its result after the window has been shown for the next document.
+    """
+    root = Root()
+    variables = SimpleNamespace(x_measure=1.0, y_measure=2.0, z_measure=3.0)
+    release = threading.Event()
+
+    loaders = get_loaders(root, variables)
+    loaders._refinement = loaders._executor.submit(release.wait)
+    loaders._load_refinement(loaders._refinement)
+    assert len(root.scheduled) == 1  # Polls while the refinement is running
+
+    loaders.close()  # The window is hidden
+    assert loaders._refinement is None
+    assert loaders._executor._shutdown  # pylint: disable=W0212
+    get_loaders(root, variables)  # The window is shown for the next document
+
+    release.set()
+    root.run_scheduled()
+    assert not root.scheduled
+    assert (variables.x_measure, variables.y_measure, variables.z_measure) == (
+        1.0,
+        2.0,
+        3.0,
+    )
+
+
+def test_failed_refinement_keeps_preview():
+    """Tests that the preview is kept and the result is loaded if the refinement fails."""
+
+    def fail():
+        raise ValueError("Degenerate hull")
+
+    root = Root()
+    variables = SimpleNamespace(x_measure=1.0, y_measure=2.0, z_measure=3.0)
+    loaders = get_loaders(root, variables)
+    measurements = []
+    results = []
+    loaders._set_measurements = lambda m, _: measurements.append(m)
+    loaders.load_result = lambda: results.append(True)
+
+    loaders._refinement = loaders._executor.submit(fail)
+    loaders._refinement.exception()  # Waits for the refinement
+    loaders._load_refinement(loaders._refinement)
+    assert loaders._refinement is None
+    assert measurements == [(1.0, 2.0, 3.0)]
+    assert len(results) == 1
+    loaders.close()
@@ -0,0 +1,485 @@
+"""
+    Test the measure submodule.
+"""
+
+import numpy as np
+import pytest
+
+from pytia_bounding_box.measure.assembly import PartBoxCache
+from pytia_bounding_box.measure.assembly import get_envelope
+from pytia_bounding_box.measure.assembly import get_instance_transform
+from pytia_bounding_box.measure import bodies
+from pytia_bounding_box.measure.bodies import BodyExtentsCache
+from pytia_bounding_box.measure.bodies import get_union_extents
+from pytia_bounding_box.measure.cylinder import get_enclosing_circle
+from pytia_bounding_box.measure.cylinder import get_enclosing_cylinder
+from pytia_bounding_box.measure.extents import get_extents
+from pytia_bounding_box.measure.extents import get_min_max
+from pytia_bounding_box.measure.extents import reduce_extents
+from pytia_bounding_box.measure.hull import EXTREME_DIRECTIONS
+from pytia_bounding_box.measure.hull import MAX_HULL_VERTICES
+from pytia_bounding_box.measure.hull import HullCache
+from pytia_bounding_box.measure.hull import get_hull_2d
+from pytia_bounding_box.measure.hull import get_hull_points
+from pytia_bounding_box.measure.oriented import get_oriented_box
+from pytia_bounding_box.measure.readers import get_mesh_extents
+from pytia_bounding_box.measure.parallel import get_extents_parallel
+from pytia_bounding_box.measure.readers import read_points
+from pytia_bounding_box.measure.readers import read_shared_points
+from pytia_bounding_box.measure.transform import get_axis_system_transform
+from pytia_bounding_box.measure.transform import get_extents_batch
+from pytia_bounding_box.measure.transform import get_transformed_extents
+from pytia_bounding_box.measure.voxel import downsample
+from pytia_bounding_box.measure.voxel import get_preview_box
+
+POINTS = np.array(
+    [
+        [0.0, 0.0, 0.0],
+        [100.25, 0.0, 0.0],
+        [0.0, 80.5, 0.0],
+        [0.0, 0.0, -20.0],
+        [50.0, 40.0, -10.0],
+        [10.0, 70.0, -5.0],
+    ]
+)
+
+
+def test_extents():
+    """Tests the extents of a point array and a stream of point blocks."""
+    box = get_extents(POINTS)
+    assert box.size == (100.25, 80.5, 20.0)
+    assert box.get_size(0) == (100.0, 80.0, 20.0)
+    assert reduce_extents([POINTS[:2], np.empty((0, 3)), POINTS[2:]]) == box
+
+    with pytest.raises(ValueError):
+        get_extents(np.empty((0, 3)))
+    with pytest.raises(ValueError):
+        reduce_extents([])
+
+
+def test_min_max():
+    """Tests that the folded reduction matches the plain reduction."""
+    points = np.random.default_rng(0).normal(size=(5000, 3))
+    minimum, maximum = get_min_max(points)
+    assert np.array_equal(minimum, points.min(axis=0))
+    assert np.array_equal(maximum, points.max(axis=0))
+
+
+def test_extents_parallel():
+    """Tests that the parallel reduction is bit-identical to the single process reduction."""
+    points = np.random.default_rng(0).normal(size=(10_000, 3))
+    box = get_extents_parallel(points, workers=2, chunk_size=1_500)
+    assert box.minimum == get_extents(points).minimum
+    assert box.maximum == get_extents(points).maximum
+
+
+def _get_rotation(seed: int) -> np.ndarray:
+    """Returns a random rotation matrix."""
+    q, r = np.linalg.qr(np.random.default_rng(seed).normal(size=(3, 3)))
+    q *= np.sign(np.diag(r))
+    return q if np.linalg.det(q) > 0 else -q
+
+
+def test_transformed_extents():
+    """Tests the extents in an axis system against the extents of transformed points."""
+    transform = get_axis_system_transform(
+        origin=(10.0, 20.0, 30.0), x_axis=(0.0, 2.0, 0.0), y_axis=(-1.0, 1.0, 0.0)
+    )
+    assert np.allclose(transform[:3, :3], [[0, 1, 0], [-1, 0, 0], [0, 0, 1]])
+
+    box = get_transformed_extents(POINTS, transform)
+    assert box.minimum == (-20.0, -90.25, -50.0)
+    assert box.maximum == (60.5, 10.0, -30.0)
+    assert get_transformed_extents(POINTS, transform[:3, :3]).size == box.size
+
+    with pytest.raises(ValueError):
+        get_transformed_extents(POINTS, np.eye(3) * 2)
+    with pytest.raises(ValueError):
+        get_axis_system_transform((0, 0, 0), (1.0, 0.0, 0.0), (2.0, 0.0, 0.0))
+
+
+def test_extents_batch():
+    """Tests that a batch of transforms gives the extents of each single transform."""
+    rng = np.random.default_rng(0)
+    points = rng.normal(size=(10_000, 3))
+    transforms = np.stack([_get_rotation(seed) for seed in range(20)])
+
+    boxes = get_extents_batch(points, transforms)
+    assert len(boxes) == 20
+    for box, rotation in zip(boxes, transforms):
+        assert np.allclose(box.size, get_extents(points @ rotation.T).size)
+
+    with pytest.raises(ValueError):
+        get_extents_batch(points, np.eye(4)[:3])
+
+
+def test_envelope():
+    """Tests the envelope of instances against the extents of the transformed corners."""
+    measured = []
+    corners = np.array([[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)])
+    sizes = {"plate": [100.0, 50.0, 10.0], "pin": [8.0, 8.0, 40.0]}
+
+    def measure(part: str):
+        measured.append(part)
+        return get_extents(corners * sizes[part])
+
+    boxes = PartBoxCache(measure)
+    parts = ["plate", "pin", "pin", "plate"]
+    transforms = np.stack([np.eye(4) for _ in parts])
+    for transform, seed in zip(transforms, range(4)):
+        transform[:3, :3] = _get_rotation(seed)
+        transform[:3, 3] = [seed * 100.0, -seed * 10.0, 5.0]
+
+    envelope = get_envelope(parts, transforms, boxes)
+    world = np.vstack(
+        [
+            corners * sizes[part] @ transform[:3, :3].T + transform[:3, 3]
+            for part, transform in zip(parts, transforms)
+        ]
+    )
+    assert np.allclose(envelope.minimum, world.min(axis=0))
+    assert np.allclose(envelope.maximum, world.max(axis=0))
+
+    # Parts are measured once, also when the assembly is evaluated again.
+    assert get_envelope(parts, transforms, boxes) == envelope
+    assert sorted(measured) == ["pin", "plate"] and len(boxes) == 2
+
+    components = [0, 1, 0, -1, 0, 0, 0, 0, 1, 10, 20, 30]
+    assert np.allclose(
+        get_instance_transform(components) @ [1, 0, 0, 1], [10, 21, 30, 1]
+    )
+    with pytest.raises(ValueError):
+        get_envelope([], np.empty((0, 4, 4)), boxes)
+
+
+def test_hull_2d():
+    """Tests the planar convex hull."""
+    rng = np.random.default_rng(0)
+    square = np.array([[0.0, 0.0], [4.0, 0.0], [4.0, 3.0], [0.0, 3.0]])
+    points = np.vstack((rng.random((1000, 2)) * [4.0, 3.0], square, [[2.0, 0.0]]))
+    hull = get_hull_2d(points)
+    assert sorted(map(tuple, hull)) == sorted(map(tuple, square))
+
+    # Counter-clockwise order: All cross products of consecutive edges are positive.
+    edges = np.roll(hull, -1, axis=0) - hull
+    following = np.roll(edges, -1, axis=0)
+    assert (edges[:, 0] * following[:, 1] - edges[:, 1] * following[:, 0] > 0).all()
+
+
+def test_hull_points():
+    """Tests the hull reduction of a filled box and a sphere."""
+    rng = np.random.default_rng(0)
+    corners = np.array([[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)])
+    points = np.vstack((rng.random((50_000, 3)), corners, corners)) * [30.0, 70.0, 10.0]
+    hull = get_hull_points(points)
+    assert sorted(map(tuple, hull)) == sorted(map(tuple, corners * [30.0, 70.0, 10.0]))
+
+    sphere = rng.normal(size=(2_000, 3))
+    sphere /= np.linalg.norm(sphere, axis=1)[:, None]
+    assert len(get_hull_points(np.vstack((sphere, sphere * 0.5)))) == len(sphere)
+
+
+def test_hull_points_smooth():
+    """Tests that the hull of a tessellated sphere is bounded, all points are hull vertices."""
+    latitude, longitude = np.meshgrid(
+        np.linspace(0.0, np.pi, 200), np.linspace(0.0, 2.0 * np.pi, 400, endpoint=False)
+    )
+    sphere = 50.0 * np.stack(
+        (
+            np.sin(latitude) * np.cos(longitude),
+            np.sin(latitude) * np.sin(longitude),
+            np.cos(latitude),
+        ),
+        axis=-1,
+    ).reshape(-1, 3)
+
+    # The construction stops early, the hull is approximated by a bounded subset.
+    hull = get_hull_points(sphere)
+    assert len(hull) <= MAX_HULL_VERTICES + 4 + 2 * EXTREME_DIRECTIONS + 6
+    assert np.allclose(np.linalg.norm(hull, axis=1), 50.0)
+    assert np.allclose(get_min_max(hull), get_min_max(sphere))
+    assert np.allclose(get_oriented_box(hull).size, (100.0, 100.0, 100.0), rtol=2e-3)
+
+
+def test_hull_cache(tmp_path):
+    """Tests that the hull cache is persistent and keyed by the state of the document."""
+    document = tmp_path / "part.CATPart"
+    document.write_bytes(b"part")
+    cache = HullCache(tmp_path / "hulls", maxsize=1)
+    assert cache.get(document) is None
+
+    cache.set(document, POINTS)
+    assert np.array_equal(HullCache(tmp_path / "hulls").get(document), POINTS)
+
+    document.write_bytes(b"modified part")
+    assert cache.get(document) is None
+
+    other = tmp_path / "other.CATPart"
+    other.write_bytes(b"other")
+    cache.set(document, POINTS)
+    cache.set(other, POINTS[:4])
+    assert len(list((tmp_path / "hulls").glob("*.npz"))) == 1
+    assert np.array_equal(cache.get(other), POINTS[:4])
+
+
+def test_oriented_box():
+    """Tests the oriented box of a rotated, sampled box."""
+    rng = np.random.default_rng(0)
+    corners = np.array([[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)])
+    points = np.vstack((rng.random((20_000, 3)), corners)) * [120.0, 45.0, 8.0]
+    rotated = points @ _get_rotation(1).T + [500.0, -200.0, 30.0]
+
+    box = get_oriented_box(rotated)
+    assert sorted(box.get_size(3)) == [8.0, 45.0, 120.0]
+    assert box.volume < np.prod(get_extents(rotated).size)
+    assert np.allclose(np.abs(np.linalg.det(box.rotation)), 1.0)
+
+
+def test_oriented_box_axis_aligned():
+    """Tests that an axis-aligned box keeps its axes and its edge lengths per axis."""
+    rng = np.random.default_rng(0)
+    corners = np.array([[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)])
+    points = np.vstack((rng.random((5_000, 3)), corners)) * [30.0, 70.0, 10.0]
+
+    box = get_oriented_box(points)
+    assert box.get_size(6) == (30.0, 70.0, 10.0)
+    assert np.allclose(box.rotation, np.eye(3))
+
+    with pytest.raises(ValueError):
+        get_oriented_box(np.empty((0, 3)))
+
+
+def test_oriented_box_smooth():
+    """Tests the oriented box of a rotated cylinder, whose points are all hull vertices."""
+    rng = np.random.default_rng(0)
+    angles = rng.uniform(0.0, 2 * np.pi, 200_000)
+    points = np.stack(
+        (
+            20 * np.cos(angles),
+            20 * np.sin(angles),
+            rng.uniform(0.0, 100.0, len(angles)),
+        ),
+        axis=1,
+    )
+    rotated = points @ _get_rotation(2).T
+
+    box = get_oriented_box(rotated)
+    assert np.allclose(sorted(box.size), [40.0, 40.0, 100.0], rtol=1e-3)
+    assert box.volume < np.prod(get_extents(rotated).size)
+
+
+def test_enclosing_circle():
+    """Tests the enclosing circle of random points and of known shapes."""
+    rng = np.random.default_rng(0)
+    points = rng.normal(size=(40, 2))
+    center, radius = get_enclosing_circle(points)
+    assert np.all(np.hypot(*(points - center).T) <= radius + 1e-9)
+
+    triangle = np.array([[0.0, 0.0], [2.0, 0.0], [1.0, np.sqrt(3)]])
+    center, radius = get_enclosing_circle(triangle)
+    assert np.allclose(center, [1.0, np.sqrt(3) / 3])
+    assert np.isclose(radius, 2 / np.sqrt(3))
+
+    center, radius = get_enclosing_circle(np.array([[0.0, 0.0], [4.0, 0.0]]))
+    assert np.allclose(center, [2.0, 0.0]) and radius == 2.0
+
+    with pytest.raises(ValueError):
+        get_enclosing_circle(np.empty((0, 2)))
+
+
+def test_enclosing_cylinder():
+    """Tests the enclosing cylinder of a bar around each part axis."""
+    rng = np.random.default_rng(0)
+    corners = np.array([[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)])
+    points = np.vstack((rng.random((5_000, 3)), corners)) * [500.0, 40.0, 30.0]
+
+    cylinder = get_enclosing_cylinder(points, (1.0, 0.0, 0.0))
+    assert cylinder.get_size(6) == (50.0, 500.0)
+    assert np.allclose(cylinder.center, [250.0, 20.0, 15.0])
+    assert get_enclosing_cylinder(points, (0.0, 0.0, 2.0)).get_size(3) == (
+        round(np.hypot(500.0, 40.0), 3),
+        30.0,
+    )
+
+    with pytest.raises(ValueError):
+        get_enclosing_cylinder(points, (0.0, 0.0, 0.0))
+
+
+def test_downsample():
+    """Tests that each point lies within half a cell of a cell center."""
+    rng = np.random.default_rng(0)
+    points = rng.normal(size=(10_000, 3)) * [50.0, 20.0, 5.0]
+    centers = downsample(points, 2.0)
+    assert len(centers) < len(points)
+
+    nearest = [np.abs(centers - point).max(axis=1).min() for point in points[:500]]
+    assert max(nearest) <= 1.0 + 1e-9
+
+    with pytest.raises(ValueError):
+        downsample(points, 0.0)
+    with pytest.raises(ValueError):
+        downsample(np.empty((0, 3)), 1.0)
+
+
+def test_preview_box():
+    """Tests that the preview box is within its error bound of the box of all points."""
+    rng = np.random.default_rng(0)
+    corners = np.array([[x, y, z] for x in (0, 1) for y in (0, 1) for z in (0, 1)])
+    points = np.vstack((rng.random((50_000, 3)), corners)) * [120.0, 45.0, 8.0]
+    rotated = points @ _get_rotation(1).T
+
+    preview = get_preview_box(rotated, divisions=32)
+    assert preview.voxel_size < 120.0 / 16
+    frame = np.array(preview.box.rotation)
+    minimum, maximum = (rotated @ frame.T).min(axis=0), (rotated @ frame.T).max(axis=0)
+    assert np.all(
+        np.abs(np.array(preview.box.size) - (maximum - minimum))
+        <= np.array(preview.error) + 1e-9
+    )
+    assert np.all(np.array(preview.error) <= np.sqrt(3) * preview.voxel_size + 1e-9)
+
+
+def _write_obj(path, points: np.ndarray) -> None:
+    """Writes the points as vertices of an OBJ file."""
+    with open(path, "w", encoding="utf8") as f:
+        f.writelines(f"v {x} {y} {z}\n" for x, y, z in points)
+
+
+def test_body_extents(tmp_path, monkeypatch):
+    """Tests the union of body boxes and that only modified bodies are measured again."""
+    measured = []
+    workers = []
+
+    def get_mesh_extents_counted(path, **kwargs):
+        measured.append(path)
+        workers.append(kwargs["workers"])
+        return get_mesh_extents(path, **kwargs)
+
+    monkeypatch.setattr(bodies, "get_mesh_extents", get_mesh_extents_counted)
+    paths = {"Body.1": tmp_path / "body_1.obj", "Body.2": tmp_path / "body_2.obj"}
+    _write_obj(paths["Body.1"], POINTS[:3])
+    _write_obj(paths["Body.2"], POINTS[3:])
+
+    union, boxes = get_union_extents(paths, workers=4)
+    assert workers == [1, 1]  # Several bodies are measured by the threads
+    assert union.minimum == get_extents(POINTS).minimum
+    assert union.maximum == get_extents(POINTS).maximum
+    assert boxes["Body.2"].size == get_extents(POINTS[3:]).size
+
+    # Bodies with a cached box aren't exported, only the body with a new key is measured.
+    monkeypatch.setattr(bodies, "body_extents_cache", BodyExtentsCache())
+    keys = {name: ("part", name) for name in paths}
+    get_union_extents(paths, workers=2, keys=keys)
+    keys["Body.2"] = ("modified part", "Body.2")
+    _write_obj(paths["Body.2"], POINTS[3:] + 1.0)
+    measured.clear()
+    workers.clear()
+    union, boxes = get_union_extents({"Body.2": paths["Body.2"]}, keys=keys)
+    assert boxes["Body.1"].size == get_extents(POINTS[:3]).size
+    assert boxes["Body.2"].minimum == get_extents(POINTS[3:] + 1.0).minimum
+    assert measured == [paths["Body.2"]]
+    assert workers == [0]  # A single body is reduced by the worker processes
+
+    with pytest.raises(ValueError):
+        get_union_extents({})
+    with pytest.raises(ValueError):
+        get_union_extents({}, keys={"Body.3": ("part", "Body.3")})
+
+
+def test_read_ascii_stl(tmp_path):
+    """Tests the ASCII STL reader."""
+    path = tmp_path / "part.stl"
+    with open(path, "w", encoding="utf8") as f:
+        f.write("solid vertex\n")
+        for i in range(0, len(POINTS), 3):
+            f.write("  facet normal 0 0 1\n    outer loop\n")
+            for x, y, z in POINTS[i : i + 3]:
+                f.write(f"      vertex {x:e} {y:e} {z:e}\r\n")
+            f.write("    endloop\n  endfacet\n")
+        f.write("endsolid vertex\n")
+
+    assert np.array_equal(read_points(path, block_size=64), POINTS)
+    assert get_mesh_extents(path).size == get_extents(POINTS).size
+    assert get_mesh_extents(path, workers=2, chunk_size=2).size == (
+        get_extents(POINTS).size
+    )
+
+
+def test_read_binary_stl(tmp_path):
+    """Tests the binary STL reader."""
+    facets = np.zeros(
+        len(POINTS) // 3,
+        dtype=[("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attr", "<u2")],
+    )
+    facets["vertices"] = POINTS.reshape(-1, 3, 3)
+    path = tmp_path / "part.stl"
+    with open(path, "wb") as f:
+        f.write(b"solid binary".ljust(80))
+        f.write(np.uint32(len(facets)).tobytes())
+        f.write(facets.tobytes())
+
+    assert np.allclose(read_points(path), POINTS)
+
+
+def test_read_obj(tmp_path):
+    """Tests the OBJ reader, including vertex colors and other records."""
+    path = tmp_path / "part.obj"
+    with open(path, "w", encoding="utf8") as f:
+        f.write("# v 1000 1000 1000\nvn 0 0 1\n\n")
+        for x, y, z in POINTS:
+            f.write(f"v {x} {y} {z} 0.5 0.5 0.5\nvt 0 0\n")
+        f.write("f 1 2 3\n")
+
+    assert np.array_equal(read_points(path, block_size=64), POINTS)
+
+
+def test_read_obj_mixed_widths(tmp_path):
+    """Tests the OBJ reader with vertices of different widths (weight & vertex colors)."""
+    path = tmp_path / "part.obj"
+    path.write_text("v 0 0 0\nv 1 1 1\n  v 2 2 2 .5 .5 .5\nv 3 3 3 1\r\n")
+
+    assert np.array_equal(
+        read_points(path), [[0, 0, 0], [1, 1, 1], [2, 2, 2], [3, 3, 3]]
+    )
+
+
+def test_read_shared_points(tmp_path):
+    """Tests that the points are read into shared memory, which grows if necessary."""
+    points = np.random.default_rng(0).integers(0, 10, size=(3_000, 3)).astype(float)
+    path = tmp_path / "part.obj"
+    _write_obj(path, points)  # Short records, the preallocated buffer is too small.
+
+    with read_shared_points(path, block_size=4096) as shared:
+        assert np.array_equal(shared.points, points)
+    box = get_mesh_extents(path, block_size=4096, workers=2, chunk_size=500)
+    assert box.size == get_extents(points).size
+
+
+def test_read_ply(tmp_path):
+    """Tests the ASCII PLY reader with reordered properties."""
+    path = tmp_path / "part.ply"
+    with open(path, "w", encoding="utf8") as f:
+        f.write(
+            "ply\nformat ascii 1.0\n"
+            f"element vertex {len(POINTS)}\n"
+            "property float z\nproperty uchar red\nproperty float x\nproperty float y\n"
+            "element face 1\nproperty list uchar int vertex_indices\nend_header\n"
+        )
+        for x, y, z in POINTS:
+            f.write(f"{z} 255 {x} {y}\n")
+        f.write("3 0 1 2\n")
+
+    assert np.array_equal(read_points(path, block_size=64), POINTS)
+
+
+def test_read_unsupported(tmp_path):
+    """Tests the readers with invalid files."""
+    path = tmp_path / "part.step"
+    path.write_text("ISO-10303-21;")
+    with pytest.raises(ValueError):
+        read_points(path)
+
+    path = tmp_path / "part.obj"
+    path.write_text("v 1 2 3\nv 1 2\n")
+    with pytest.raises(ValueError):
+        read_points(path)
@@ -0,0 +1,34 @@
+"""
+    Test the resident.py file.
+"""
+
+from pytia_bounding_box.resident import ResidentServer
+from pytia_bounding_box.resident import get_address
+from pytia_bounding_box.resident import get_authkey
+from pytia_bounding_box.resident import hand_over
+
+
+def test_hand_over(tmp_path):
+    """Tests that requests are only handed over to an idle resident instance."""
+    address = get_address(f"test-{tmp_path.name}")
+    authkey = get_authkey(tmp_path / "resident.key")
+    assert authkey == get_authkey(tmp_path / "resident.key")
+    assert not hand_over(address, authkey)
+
+    server = ResidentServer(address, authkey)
+    assert server.start()
+    assert not ResidentServer(address, authkey).start()
+    try:
+        assert not hand_over(address, authkey)  # The window is shown
+        server.set_idle()
+        assert not hand_over(address, b"wrong key")
+        assert hand_over(address, authkey)
+        assert server.requests.get_nowait()["command"] == "open"
+        assert not hand_over(address, authkey)  # Busy with the request
+
+        assert not server.stop()
+        server.set_idle()
+        assert server.stop()
+        assert not hand_over(address, authkey)
+    finally:
+        server.close()
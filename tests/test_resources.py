@@ -2,9 +2,11 @@
     Test the resources.py file.
 """
 
+import json
 import os
 from pathlib import Path
 
+import pytest
 import validators
 
 
@@ -50,6 +52,15 @@ def test_settings():
     assert validators.email(resource.settings.mails.admin)  # type: ignore
 
 
+def test_settings_measurement():
+    """Tests that the chunk size of the measurement must be positive."""
+    from pytia_bounding_box.resources import SettingsMeasurement
+
+    assert SettingsMeasurement().chunk_size > 0
+    with pytest.raises(ValueError):
+        SettingsMeasurement(chunk_size=0)
+
+
 def test_users():
     from pytia_bounding_box.resources import resource
 
@@ -65,6 +76,86 @@ def test_users():
         logon_list.append(user.logon)
 
 
+def test_lookups():
+    from pytia_bounding_box.resources import resource
+
+    for preset in resource.presets:
+        assert resource.preset_exists(preset.name)
+        assert resource.get_preset_by_name(preset.name) is preset
+    for process in resource.processes:
+        assert resource.process_exists(process.name)
+        assert resource.get_process_by_name(process.name).name == process.name
+    for user in resource.users:
+        assert resource.user_exists(user.logon)
+        assert resource.user_exists(user.logon.upper(), case_sensitive=False)
+        assert resource.get_user_by_logon(user.logon) is user
+
+    assert not resource.preset_exists("")
+    assert not resource.process_exists("")
+    assert not resource.user_exists("", case_sensitive=False)
+    with pytest.raises(ValueError):
+        resource.get_preset_by_name("")
+    with pytest.raises(ValueError):
+        resource.get_user_by_logon("")
+
+    assert resource.get_info_msg_by_counter() == [
+        info.msg for info in resource.infos if info.counter == resource.appdata.counter
+    ]
+
+
+def test_lazy_loading():
+    from pytia_bounding_box.resources import Resources
+
+    resources = Resources()
+    assert resources.settings is not None
+    assert resources._users is None
+    assert resources._appdata is None
+    assert resources.users
+
+
+def test_appdata(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Tests that the appdata is only written if it has changed, and atomically."""
+    import pytia_bounding_box.resources as resources_module
+
+    monkeypatch.setattr(resources_module, "APPDATA", str(tmp_path))
+    resources = resources_module.Resources()
+    counter = resources.appdata.counter
+    resources._write_appdata()
+    assert json.loads(Path(tmp_path, "config.json").read_text())["counter"] == counter
+
+    def replace(*_):
+        raise AssertionError("The unchanged appdata has been written.")
+
+    monkeypatch.setattr(resources_module.os, "replace", replace)
+    resources._write_appdata()
+    next_session = resources_module.Resources()
+    assert next_session.appdata.counter == counter
+    next_session._write_appdata()
+    next_session._appdata = None
+    resources.appdata.theme = "darkly"
+    with pytest.raises(AssertionError):
+        resources._write_appdata()
+    assert list(tmp_path.iterdir()) == [Path(tmp_path, "config.json")]
+    assert json.loads(Path(tmp_path, "config.json").read_text())["theme"] != "darkly"
+    resources._appdata = None  # Don't write the appdata at exit.
+
+
+def test_records():
+    from pytia_bounding_box.resources import User
+    from pytia_bounding_box.resources.records import Records
+    from pytia_bounding_box.resources.records import get_index
+
+    rows = [
+        {"logon": logon, "id": str(i), "name": logon, "mail": ""}
+        for i, logon in enumerate(("a", "b", "A"))
+    ]
+    users = Records(User, rows)
+    assert len(users) == 3
+    assert users[0] is users[0]
+    assert [u.id for u in users[1:]] == ["1", "2"]
+    assert get_index(rows, lambda u: u["logon"].casefold()) == {"a": 0, "b": 1}
+
+
 def test_props():
     from pytia_bounding_box.resources import resource
 
@@ -0,0 +1,45 @@
+"""
+    Test the timing.py file.
+"""
+
+import json
+
+from pytia_bounding_box.timing import Tracer
+
+
+def test_tracer(tmp_path):
+    """Tests that the spans are recorded as tree until the trace has ended."""
+    tracer = Tracer()
+    with tracer.span("gui"):
+        with tracer.span("tk"):
+            pass
+        with tracer.span("layout"):
+            pass
+    with tracer.span("part"):
+        pass
+    assert tracer.finish()
+    assert not tracer.finish()
+    with tracer.span("later"):
+        pass
+
+    lines = tracer.format()
+    assert [line.split()[0] for line in lines] == [
+        "startup",
+        "gui",
+        "tk",
+        "layout",
+        "part",
+    ]
+    assert lines[2].startswith("    tk ")
+    assert len({len(line) for line in lines}) == 1
+
+    path = tmp_path / "startup.json"
+    for _ in range(3):
+        tracer.write(path, maxsize=2)
+    with open(path, "r", encoding="utf8") as f:
+        traces = json.load(f)
+    assert len(traces) == 2
+    trace = traces[0]["trace"]
+    assert trace["start"] == 0
+    assert [span["name"] for span in trace["children"]] == ["gui", "part"]
+    assert trace["children"][0]["duration"] <= trace["duration"]